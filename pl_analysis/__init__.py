@@ -0,0 +1,65 @@
+# pl_analysis
+# Shared Premier League match analysis engine
+#
+# Replaces the per-match analysis.py scripts with one importable
+# pipeline that can process a whole season in a single process.
+#
+# Public names are resolved lazily: `from pl_analysis import
+# run_match` imports pandas, but importing a light submodule (e.g.
+# pl_analysis.validate) does not pull in pandas or matplotlib.
+
+import importlib
+
+from .discovery import Match, discover_clean_matches, discover_matches, load_match
+from .errors import DataQualityError, MissingRawTableError, PipelineError
+
+# Public name -> submodule that defines it.
+_LAZY = {
+    "DISTANCE_ZONES": "bins", "TIME_WINDOWS": "bins", "BinSpec": "bins",
+    "count_matrix": "bins", "long_counts": "bins",
+    "CHART_TEMPLATES": "charts", "ChartTemplate": "charts",
+    "render_match_charts": "charts", "render_season_charts": "charts",
+    "INVARIANTS": "checks", "Invariant": "checks", "OutputTables": "checks",
+    "check_season": "checks", "check_tables": "checks",
+    "ShotAggregates": "chunked", "aggregate_shots": "chunked",
+    "clean_fbref": "fbref", "get_numeric_series": "fbref",
+    "load_fbref": "fbref", "read_fbref_table": "fbref",
+    "IdentityResolver": "identity", "load_identities": "identity",
+    "save_identities": "identity", "stable_id": "identity",
+    "DEFAULT_STAGES": "pipeline", "MatchContext": "pipeline", "Pipeline": "pipeline",
+    "Stage": "pipeline", "run_match": "pipeline", "run_season": "pipeline",
+    "LiveShots": "live", "stream_shots": "live",
+    "LoadedMatch": "loader", "iter_loaded": "loader", "load_matches": "loader",
+    "load_passing_profiles": "passing", "passing_profiles": "passing",
+    "FormIndex": "opposition", "load_form_index": "opposition",
+    "update_form_index": "opposition",
+    "normalise_player_names": "players", "season_players": "players",
+    "build_star_schema": "powerbi", "export_star_schema": "powerbi",
+    "render_match_report": "report", "render_season_reports": "report",
+    "MatchResult": "runner", "run_matches_parallel": "runner", "run_one": "runner",
+    "run_season_parallel": "runner", "summarise_results": "runner",
+    "Season": "season",
+    "SeasonShots": "shot_table", "consolidate_shots": "shot_table",
+    "CsvStore": "storage", "ParquetStore": "storage",
+    "make_stores": "storage", "read_dataset": "storage",
+    "match_xg": "timeline", "rolling_xg": "timeline", "xg_timelines": "timeline",
+    "validate_match": "validate", "validate_raw_file": "validate",
+}
+
+__all__ = [
+    "Match", "discover_clean_matches", "discover_matches", "load_match",
+    "DataQualityError", "MissingRawTableError", "PipelineError",
+] + sorted(_LAZY)
+
+
+def __getattr__(name):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module 'pl_analysis' has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
@@ -0,0 +1,502 @@
+# __main__.py
+# python -m pl_analysis <command> <root> — season command line
+#
+#   clean      run the pipeline (default when no command is given)
+#   summarize  print team and shot summaries from the clean outputs
+#   render     draw the match charts
+#   report     write templated Markdown / PDF match reports
+#   export     season star schema (dimensions + facts) for Power BI
+#   validate   check raw files without running the pipeline
+#   check      data-quality invariants over the clean outputs
+#   live       stream shot events into running match outputs
+#   opposition pre-match profile from rolling home / away form
+#   archive    chunked, memory-bounded shot aggregates over many seasons
+#
+# Heavy dependencies (pandas, matplotlib) are imported inside the
+# command that needs them, so `validate` and `--help` start fast.
+
+import argparse
+import sys
+
+from .discovery import discover_matches
+
+COMMANDS = [
+    "clean", "summarize", "render", "report", "export", "validate", "check",
+    "live", "opposition", "archive",
+]
+
+# Same values as storage.OUTPUT_FORMATS (not imported: it needs pandas).
+OUTPUT_FORMATS = ["csv", "parquet", "both"]
+
+# =====================================================
+# 1. COMMANDS
+# =====================================================
+def cmd_clean(args, parser):
+    from .identity import load_identities, save_identities
+    from .pipeline import Pipeline
+    from .runner import run_matches_parallel, summarise_results
+    from .storage import make_stores
+
+    try:
+        stores = make_stores(args.format, args.store, args.season)
+    except (ImportError, ValueError) as exc:
+        parser.error(str(exc))
+    if args.max_open and args.workers != 1:
+        parser.error("--max-open only applies to inline runs: add --workers 1")
+
+    matches = discover_matches(args.root)
+    identities = load_identities(args.root)
+    results = run_matches_parallel(
+        matches,
+        workers=args.workers,
+        pipeline=Pipeline(stores=stores, identities=identities),
+        force=args.force,
+        max_open=args.max_open
+    )
+    print(summarise_results(results))
+
+    learned = {}
+    for result in results:
+        learned.update(result.aliases)
+    if learned:
+        identities.learned.update(learned)
+        for spelling, team in sorted(learned.items()):
+            print(f"Team spelling {spelling!r} matched to {team!r}")
+        if args.save_aliases:
+            save_identities(args.root, identities, learned=True)
+            print(f"Identity aliases: {len(learned)} spelling(s) saved")
+        else:
+            print("Check these and add them to identity_aliases.json "
+                  "(or rerun with --save-aliases)")
+
+    if args.shots_table or args.xg_rolling:
+        from .shot_table import SeasonShots
+
+        ok = [m for m in matches if m.base_dir in {r.base_dir for r in results if r.ok}]
+        table = SeasonShots.from_matches(ok, stores[0])
+        if args.shots_table:
+            table.save(args.shots_table)
+            print(f"Season shot table: {len(table)} shots -> {args.shots_table}")
+        if args.xg_rolling:
+            from .timeline import match_xg, rolling_xg
+
+            teams = {m.name: [identities.team(t) for t in m.teams.values()] for m in ok}
+            rolling = rolling_xg(match_xg(table.table, teams=teams), args.rolling_window)
+            rolling.to_csv(args.xg_rolling, index=False)
+            print(f"Rolling xG ({args.rolling_window} matches): "
+                  f"{len(rolling)} team-matches -> {args.xg_rolling}")
+
+    if args.players:
+        from .season import Season
+
+        ok = {r.base_dir for r in results if r.ok}
+        season = Season(matches=[m for m in matches if m.base_dir in ok], store=stores[0],
+                        identities=identities)
+        totals = season.player_totals(args.min_minutes)
+        totals.to_csv(args.players, index=False)
+        print(f"Season players: {len(totals)} player-teams -> {args.players}")
+
+    from .opposition import update_form_index
+
+    ok = {r.base_dir for r in results if r.ok}
+    _, recorded = update_form_index(
+        args.root, [m for m in matches if m.base_dir in ok], stores[0], args.form_window,
+        identities
+    )
+    if recorded:
+        print(f"Form index: {recorded} matches recorded")
+
+    charts_ok = True
+    if args.charts:
+        ok = {r.base_dir for r in results if r.ok}
+        charts_ok = _render([m for m in matches if m.base_dir in ok], args, stores[0])
+
+    reports_ok = True
+    if args.reports:
+        ok = {r.base_dir for r in results if r.ok}
+        reports_ok = _report([m for m in matches if m.base_dir in ok], args, stores[0])
+
+    for result in results:
+        for warning in result.warnings:
+            print(f"WARNING {result.name}: {warning}", file=sys.stderr)
+        if not result.ok:
+            print(f"\n--- {result.name} ---\n{result.error}", file=sys.stderr)
+
+    return 0 if charts_ok and reports_ok and all(r.ok for r in results) else 1
+
+
+def _render(matches, args, store=None):
+    from .charts import render_season_charts, summarise_charts
+
+    results = render_season_charts(
+        matches, workers=args.workers, store=store, force=args.force
+    )
+    print(summarise_charts(results))
+    for result in results:
+        if not result.ok:
+            print(f"\n--- {result.name} (charts) ---\n{result.error}", file=sys.stderr)
+    return all(r.ok for r in results)
+
+
+def cmd_render(args, parser):
+    return 0 if _render(discover_matches(args.root), args) else 1
+
+
+def _report(matches, args, store=None):
+    from .report import DEFAULT_TEMPLATE, render_season_reports, summarise_reports
+
+    template = DEFAULT_TEMPLATE
+    if getattr(args, "template", None):
+        with open(args.template, encoding="utf-8") as f:
+            template = f.read()
+
+    results = render_season_reports(
+        matches, workers=args.workers, store=store, template=template,
+        pdf=not getattr(args, "no_pdf", False), force=args.force
+    )
+    print(summarise_reports(results))
+    for result in results:
+        if not result.ok:
+            print(f"\n--- {result.name} (report) ---\n{result.error}", file=sys.stderr)
+    return all(r.ok for r in results)
+
+
+def cmd_report(args, parser):
+    return 0 if _report(discover_matches(args.root), args) else 1
+
+
+def cmd_summarize(args, parser):
+    from .storage import CsvStore
+
+    store = CsvStore()
+    missing = 0
+    for match in discover_matches(args.root):
+        print(f"== {match.name}")
+        if not store.exists(match, "shot_summary"):
+            print("   no clean outputs (run: python -m pl_analysis clean)")
+            missing += 1
+            continue
+        shots = store.read(match, "shot_summary").set_index("squad")
+        teams = (
+            store.read(match, "team_summary").set_index("team")
+            if store.exists(match, "team_summary") else None
+        )
+        for row in shots.itertuples():
+            name = str(row.Index).strip()
+            line = f"   {name:<24} shots {row.shots:>3}  xG {row.total_xg:5.2f}"
+            if teams is not None and name in teams.index:
+                passes = teams.loc[name, "passes_completed"]
+                line += f"  passes completed {passes}"
+            print(line)
+    return 1 if missing else 0
+
+
+def cmd_validate(args, parser):
+    from .validate import validate_match
+
+    matches = discover_matches(args.root)
+    if not matches:
+        print(f"no match folders under {args.root}")
+        return 1
+
+    failed = 0
+    for match in matches:
+        problems = validate_match(match)
+        if problems:
+            failed += 1
+            print(f"INVALID {match.name}")
+            for problem in problems:
+                print(f"   {problem}")
+        else:
+            print(f"VALID   {match.name}")
+    print(f"{len(matches) - failed} valid, {failed} invalid")
+    return 1 if failed else 0
+
+
+def cmd_check(args, parser):
+    from .checks import ERROR, check_season, summarise_checks
+    from .discovery import discover_clean_matches
+    from .identity import load_identities
+    from .season import Season
+
+    matches = discover_clean_matches(args.root)
+    if not matches:
+        print(f"no match folders under {args.root}")
+        return 1
+
+    identities = load_identities(args.root)
+    violations = check_season(
+        Season(matches=matches, identities=identities), identities=identities
+    )
+    print(summarise_checks(violations, matches))
+    failing = violations if args.strict else violations[violations["severity"] == ERROR]
+    return 1 if len(failing) else 0
+
+
+def cmd_live(args, parser):
+    import os
+
+    from .discovery import load_match
+    from .identity import load_identities
+    from .live import follow_file, socket_lines, stream_shots
+
+    match = load_match(args.match)
+    if match is None:
+        parser.error(f"{args.match}: no raw data folder found")
+
+    if args.port:
+        lines = socket_lines(args.host, args.port)
+        print(f"Listening on {args.host}:{args.port}")
+    else:
+        path = args.file or match.shot_file
+        if path is None:
+            parser.error(f"{match.name}: no shot table; pass --file or --port")
+        lines = follow_file(path, from_start=not args.new_only)
+        print(f"Following {path}")
+
+    def show(live, seconds):
+        teams = "  ".join(
+            f"{squad} {live.shots[squad]} shots / {live.xg[squad]:.2f} xG"
+            for squad in sorted(live.shots)
+        )
+        print(f"[{live.events:3d}] {teams}  ({seconds * 1000:.0f} ms)", flush=True)
+
+    try:
+        # The season folder (and its alias table) holds the match folder.
+        identities = load_identities(os.path.dirname(os.path.abspath(match.base_dir)))
+        stream_shots(lines, match, interval=args.interval, on_update=show,
+                     identities=identities)
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+def cmd_export(args, parser):
+    from .errors import DataQualityError
+    from .powerbi import export_star_schema
+
+    try:
+        counts = export_star_schema(
+            args.root, args.out, args.format, checks=not args.skip_checks
+        )
+    except (ImportError, ValueError) as exc:
+        parser.error(str(exc))
+    except DataQualityError as exc:
+        print(f"Export stopped: {exc}", file=sys.stderr)
+        return 1
+    for name, rows in counts.items():
+        print(f"{name:<20} {rows:>8} rows")
+    print(f"Star schema -> {args.out}")
+    return 0
+
+
+def cmd_opposition(args, parser):
+    from .opposition import profile_markdown, update_form_index
+
+    index, _ = update_form_index(args.root, window=args.window)
+    try:
+        profile = index.profile(args.home, args.away)
+    except KeyError as exc:
+        parser.error(exc.args[0])
+
+    report = profile_markdown(profile)
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            f.write(report)
+        print(f"Opposition profile -> {args.out}")
+    else:
+        print(report, end="")
+    return 0
+
+
+def cmd_archive(args, parser):
+    import os
+
+    from .chunked import aggregate_shots
+
+    for source in args.sources:
+        if not os.path.exists(source):
+            parser.error(f"{source}: no such file or folder")
+
+    by = ["match", "team"] if args.by_match else "team"
+    aggregates = aggregate_shots(args.sources, by=by, chunk_size=args.chunk_size)
+
+    os.makedirs(args.out, exist_ok=True)
+    for name, frame in aggregates.outputs().items():
+        frame.to_csv(os.path.join(args.out, f"{name}.csv"), index=False)
+    print(f"{aggregates.rows} shots in {aggregates.chunks} chunks -> {args.out}")
+    return 0
+
+# =====================================================
+# 2. ARGUMENTS
+# =====================================================
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="pl_analysis",
+        description="Premier League match analysis over a season folder."
+    )
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    def add(name, func, summary):
+        command = sub.add_parser(name, help=summary)
+        command.add_argument("root", help="Folder containing match folders")
+        command.set_defaults(func=func)
+        return command
+
+    def add_workers(command):
+        command.add_argument(
+            "-j", "--workers", type=int, default=None,
+            help="Worker processes (default: CPU count, 1 = run inline)"
+        )
+        command.add_argument(
+            "--force", action="store_true",
+            help="Ignore the manifests and rebuild everything"
+        )
+
+    clean = add("clean", cmd_clean, "Run the analysis pipeline for every match")
+    add_workers(clean)
+    clean.add_argument(
+        "--max-open", type=int, metavar="N",
+        help="Read raw files concurrently, at most N open at once (for slow or "
+             "network storage); inline runs only, so it needs --workers 1"
+    )
+    clean.add_argument(
+        "--save-aliases", action="store_true",
+        help="Save team spellings matched to a match team to identity_aliases.json"
+    )
+    clean.add_argument(
+        "--format", choices=OUTPUT_FORMATS, default="csv",
+        help="Output format: per-match CSV, columnar Parquet store, or both"
+    )
+    clean.add_argument(
+        "--store", help="Root folder of the Parquet store (parquet / both)"
+    )
+    clean.add_argument(
+        "--season", default="unspecified",
+        help="Season label used to partition the Parquet store"
+    )
+    clean.add_argument(
+        "--shots-table", metavar="PATH",
+        help="Also write the consolidated season shot table (.parquet or .csv)"
+    )
+    clean.add_argument(
+        "--xg-rolling", metavar="PATH",
+        help="Also write rolling xG for / against per team (.csv)"
+    )
+    clean.add_argument(
+        "--rolling-window", type=int, default=5, metavar="N",
+        help="Matches in the rolling xG window (default 5)"
+    )
+    clean.add_argument(
+        "--players", metavar="PATH",
+        help="Also write season player totals and per-90 rates (.csv)"
+    )
+    clean.add_argument(
+        "--min-minutes", type=int, default=0, metavar="N",
+        help="Leave players with fewer season minutes out of --players"
+    )
+    clean.add_argument(
+        "--form-window", type=int, default=5, metavar="N",
+        help="Home / away matches kept in the opposition form index (default 5)"
+    )
+    clean.add_argument(
+        "--charts", action="store_true",
+        help="Also render the match charts (shots, xG, shot distance) "
+             "into each match's visuals folder"
+    )
+    clean.add_argument(
+        "--reports", action="store_true",
+        help="Also write Report/match_report.md and .pdf for each match"
+    )
+
+    add("summarize", cmd_summarize, "Print team and shot summaries per match")
+    add_workers(add("render", cmd_render, "Render the match charts"))
+
+    report = add("report", cmd_report, "Write Markdown / PDF match reports")
+    add_workers(report)
+    report.add_argument(
+        "--no-pdf", action="store_true", help="Write the Markdown reports only"
+    )
+    report.add_argument(
+        "--template", metavar="PATH",
+        help="Markdown template with $placeholders (default: built-in layout)"
+    )
+    export = add("export", cmd_export, "Write the season star schema for Power BI")
+    export.add_argument("--out", required=True, help="Folder for the star schema tables")
+    export.add_argument(
+        "--format", choices=["csv", "parquet"], default="csv",
+        help="Table file format (parquet needs pyarrow)"
+    )
+    export.add_argument(
+        "--skip-checks", action="store_true",
+        help="Export even if the outputs break a data-quality invariant"
+    )
+
+    add("validate", cmd_validate, "Check raw files without running the pipeline")
+    check = add("check", cmd_check, "Check the clean outputs against the data-quality invariants")
+    check.add_argument(
+        "--strict", action="store_true", help="Fail on warnings as well as errors"
+    )
+
+    live = sub.add_parser("live", help="Stream shot events into running match outputs")
+    live.add_argument("match", help="Match folder (live_* outputs go to its clean folder)")
+    live.add_argument(
+        "--file", help="Shot table being appended to (default: the match's shot table)"
+    )
+    live.add_argument(
+        "--new-only", action="store_true",
+        help="Ignore lines already in --file when starting"
+    )
+    live.add_argument("--port", type=int, help="Read events from a local TCP socket")
+    live.add_argument("--host", default="127.0.0.1")
+    live.add_argument(
+        "--interval", type=float, default=0.5,
+        help="Minimum seconds between output writes (default 0.5)"
+    )
+    live.set_defaults(func=cmd_live)
+
+    opposition = add(
+        "opposition", cmd_opposition,
+        "Pre-match profile: home team's home form vs away team's away form"
+    )
+    opposition.add_argument("home", help="Home team")
+    opposition.add_argument("away", help="Away team")
+    opposition.add_argument(
+        "--window", type=int, default=5, metavar="N",
+        help="Last N home / away matches (default 5)"
+    )
+    opposition.add_argument("--out", help="Write the Markdown profile to this file")
+
+    archive = sub.add_parser(
+        "archive", help="Shot aggregates over large archives, in fixed-size chunks"
+    )
+    archive.add_argument(
+        "sources", nargs="+",
+        help="Season folders, raw shot tables or season shot tables (.csv / .parquet)"
+    )
+    archive.add_argument("--out", required=True, help="Folder for the aggregate CSVs")
+    archive.add_argument(
+        "--chunk-size", type=int, default=100_000, metavar="ROWS",
+        help="Rows read per chunk (default 100000); bounds peak memory"
+    )
+    archive.add_argument(
+        "--by-match", action="store_true",
+        help="Aggregate per match and team instead of per team"
+    )
+    archive.set_defaults(func=cmd_archive)
+    return parser
+
+
+def main(argv=None):
+    argv = list(sys.argv[1:] if argv is None else argv)
+    # `python -m pl_analysis <root> [options]` keeps meaning "clean".
+    if argv and argv[0] not in COMMANDS and not argv[0].startswith("-"):
+        argv.insert(0, "clean")
+
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    return args.func(args, parser)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,363 @@
+# bench.py
+# Benchmarks for the pipeline
+#
+#   python -m pl_analysis.bench readers <root>
+#   python -m pl_analysis.bench season --matches 1 38 380
+#   python -m pl_analysis.bench startup <root>
+#
+# "readers" compares the legacy read_csv + clean_fbref path with the
+# single-pass, schema-typed read_fbref_table reader over every raw
+# FBref CSV found under <root> (wall time and in-memory size).
+#
+# "season" writes synthetic FBref exports (synthetic.py) for each
+# requested match count and times every pipeline step on them:
+# raw load, clean_fbref, numeric coercion, the typed reader, groupby
+# summaries, pd.cut vs BinSpec binning, CSV writes, chart rendering
+# and the end-to-end Pipeline, reporting throughput and peak memory.
+#
+# "startup" times `python -m pl_analysis --help` and `validate <root>`
+# in fresh interpreters against STARTUP_BUDGET and lists any heavy
+# dependency (pandas, numpy, matplotlib) those commands imported.
+
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+from .bins import DISTANCE_ZONES, TIME_WINDOWS, count_matrix
+from .charts import CHART_TEMPLATES
+from .discovery import discover_matches
+from .fbref import RAW_ENCODING, clean_fbref, read_fbref_table
+from .pipeline import Pipeline
+from .synthetic import write_season
+
+# =====================================================
+# 1. TIMING HELPERS
+# =====================================================
+def best_of(func, repeat=3):
+    """
+    Best wall time of ``repeat`` calls, in seconds.
+    """
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def peak_memory(func):
+    """
+    Peak Python heap allocation (bytes) during one call.
+    Measured separately from timing because tracemalloc slows
+    allocation-heavy code down.
+    """
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+# =====================================================
+# 2. FBREF READERS
+# =====================================================
+def legacy_read(path):
+    """
+    The original script approach: read, promote row 0, coerce.
+    """
+    df = clean_fbref(pd.read_csv(path, encoding=RAW_ENCODING))
+    return df.apply(pd.to_numeric, errors="coerce")
+
+
+def frame_bytes(frames):
+    return sum(int(df.memory_usage(deep=True).sum()) for df in frames)
+
+
+def compare_readers(items, repeat=3):
+    """
+    Time both readers over the same (path, kind) items.
+    Returns seconds and deep memory size for each reader.
+    """
+    items = list(items)
+    legacy = lambda: [legacy_read(path) for path, _ in items]
+    typed = lambda: [read_fbref_table(path, kind) for path, kind in items]
+    return {
+        "files": len(items),
+        "legacy": best_of(legacy, repeat),
+        "single_pass": best_of(typed, repeat),
+        "legacy_bytes": frame_bytes(legacy()),
+        "single_pass_bytes": frame_bytes(typed()),
+    }
+
+
+def _match_tables(match):
+    for kind, files in sorted(match.raw_files.items()):
+        for path in files.values():
+            yield path, kind
+    if match.shot_file:
+        yield match.shot_file, "shots"
+
+
+def raw_tables(root):
+    """
+    (path, table kind) for every raw file under ``root``.
+    """
+    return [item for match in discover_matches(root) for item in _match_tables(match)]
+
+# =====================================================
+# 3. SEASON-SCALE STAGES
+# =====================================================
+def _legacy_shots(path):
+    """
+    Shot table as the original scripts produced it.
+    """
+    shots = clean_fbref(pd.read_csv(path, encoding=RAW_ENCODING))
+    shots.columns = shots.columns.str.lower()
+    shots = shots.loc[:, ~shots.columns.duplicated()]
+    for col in ["xg", "minute", "distance"]:
+        shots[col] = pd.to_numeric(shots[col], errors="coerce")
+    return shots.dropna(subset=["xg", "minute", "distance"])
+
+
+def season_steps(matches, out_dir, charts=True):
+    """
+    {step name: zero-argument callable} covering every pipeline
+    step over all ``matches``. Inputs each step depends on are
+    prepared up front so a step measures only its own work.
+    """
+    raw = [(path, kind) for m in matches for path, kind in _match_tables(m)]
+    frames = [pd.read_csv(path, encoding=RAW_ENCODING) for path, _ in raw]
+    cleaned = [clean_fbref(df) for df in frames]
+    shots = [read_fbref_table(m.shot_file, "shots").dropna(
+        subset=["xg", "minute", "distance"]) for m in matches]
+    legacy_shots = [_legacy_shots(m.shot_file) for m in matches]
+    season_shots = pd.concat(
+        [s.assign(match=m.name) for m, s in zip(matches, shots)], ignore_index=True
+    )
+    os.makedirs(out_dir, exist_ok=True)
+
+    def summaries():
+        for df in shots:
+            df.groupby("squad").agg(
+                shots=("xg", "count"), total_xg=("xg", "sum"), xg_per_shot=("xg", "mean")
+            )
+            df.groupby(["squad", "outcome"]).size()
+
+    def pd_cut():
+        for df in legacy_shots:
+            for spec in (DISTANCE_ZONES, TIME_WINDOWS):
+                binned = pd.cut(df[spec.column], bins=spec.edges, labels=spec.labels)
+                df.assign(**{spec.name: binned}).groupby(["squad", spec.name]).size()
+
+    def bin_spec():
+        for df in shots:
+            for spec in (DISTANCE_ZONES, TIME_WINDOWS):
+                count_matrix(df, spec, by="squad")
+
+    def csv_write():
+        for i, df in enumerate(shots):
+            df.to_csv(os.path.join(out_dir, f"shots_{i}.csv"), index=False)
+
+    def chart():
+        template = CHART_TEMPLATES["shots_by_team"]
+        for i, df in enumerate(shots):
+            summary = df.groupby("squad").agg(shots=("xg", "count")).reset_index()
+            template.render({"shot_summary": summary}, os.path.join(out_dir, f"shots_{i}.png"))
+
+    def pipeline():
+        runner = Pipeline(incremental=False)
+        for match in matches:
+            runner.run(match)
+
+    steps = {
+        "load (read_csv)": lambda: [pd.read_csv(p, encoding=RAW_ENCODING) for p, _ in raw],
+        "clean_fbref": lambda: [clean_fbref(df.copy()) for df in frames],
+        "numeric coercion": lambda: [df.apply(pd.to_numeric, errors="coerce") for df in cleaned],
+        "read_fbref_table": lambda: [read_fbref_table(p, kind) for p, kind in raw],
+        "groupby summaries": summaries,
+        "binning (pd.cut)": pd_cut,
+        "binning (BinSpec)": bin_spec,
+        "season binning": lambda: count_matrix(season_shots, DISTANCE_ZONES, by=["match", "squad"]),
+        "csv writes": csv_write,
+    }
+    if charts:
+        steps["chart rendering"] = chart
+    steps["pipeline (end to end)"] = pipeline
+    return steps
+
+
+def bench_season(n_matches, repeat=1, charts=True, keep=None, memory=True):
+    """
+    Synthesize ``n_matches`` matches and measure every step.
+    Returns a list of {step, matches, seconds, matches_per_s,
+    peak_mib} rows (peak_mib is None when ``memory`` is off).
+    """
+    root = keep or tempfile.mkdtemp(prefix="pl_bench_")
+    try:
+        season_dir = os.path.join(root, f"{n_matches:03d} matches")
+        write_season(season_dir, n_matches)
+        matches = discover_matches(season_dir)
+        steps = season_steps(matches, os.path.join(root, "out"), charts)
+
+        rows = []
+        for name, func in steps.items():
+            seconds = best_of(func, repeat)
+            rows.append({
+                "step": name,
+                "matches": len(matches),
+                "seconds": seconds,
+                "matches_per_s": len(matches) / seconds if seconds else np.inf,
+                "peak_mib": peak_memory(func) / 2 ** 20 if memory else None,
+            })
+        return rows
+    finally:
+        if keep is None:
+            shutil.rmtree(root, ignore_errors=True)
+
+
+def compare_results(rows, baseline, tolerance):
+    """
+    Steps slower than the baseline by more than ``tolerance``
+    (a fraction): [(step, matches, baseline s, current s)].
+    """
+    previous = {(r["step"], r["matches"]): r["seconds"] for r in baseline}
+    slower = []
+    for row in rows:
+        before = previous.get((row["step"], row["matches"]))
+        if before and row["seconds"] > before * (1 + tolerance):
+            slower.append((row["step"], row["matches"], before, row["seconds"]))
+    return slower
+
+# =====================================================
+# 4. COMMAND-LINE STARTUP
+# =====================================================
+# Wall-time budget (seconds) for quick commands in a fresh process.
+STARTUP_BUDGET = 0.5
+
+HEAVY_MODULES = ["pandas", "numpy", "matplotlib"]
+
+
+def _cli(argv, *options):
+    return subprocess.run(
+        [sys.executable, *options, "-m", "pl_analysis", *argv],
+        capture_output=True, text=True
+    )
+
+
+def heavy_imports(argv):
+    """
+    Heavy top-level packages imported while running ``argv``.
+    """
+    stderr = _cli(argv, "-X", "importtime").stderr
+    imported = {line.rsplit("|", 1)[-1].strip() for line in stderr.splitlines()
+                if line.startswith("import time:")}
+    return [name for name in HEAVY_MODULES if name in imported]
+
+
+def measure_startup(argv, repeat=3):
+    """
+    {seconds, heavy}: best wall time of ``python -m pl_analysis
+    <argv>`` in a new interpreter and the heavy modules it loaded.
+    """
+    return {
+        "seconds": best_of(lambda: _cli(argv), repeat),
+        "heavy": heavy_imports(argv),
+    }
+
+# =====================================================
+# 5. COMMAND LINE
+# =====================================================
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="pl_analysis.bench")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    readers = sub.add_parser("readers", help="Compare FBref table readers")
+    readers.add_argument("root", help="Folder containing match folders")
+    readers.add_argument("--repeat", type=int, default=3)
+
+    season = sub.add_parser("season", help="Time every step on synthetic seasons")
+    season.add_argument("--matches", type=int, nargs="+", default=[1, 38, 380])
+    season.add_argument("--repeat", type=int, default=1)
+    season.add_argument("--no-charts", action="store_true",
+                        help="Skip chart rendering (matplotlib not needed)")
+    season.add_argument("--no-memory", action="store_true",
+                        help="Skip the (slow) tracemalloc peak memory pass")
+    season.add_argument("--keep", metavar="DIR",
+                        help="Keep the synthetic data and outputs in DIR")
+    season.add_argument("--json", metavar="PATH", help="Write results as JSON")
+    season.add_argument("--compare", metavar="PATH",
+                        help="Baseline JSON from a previous --json run")
+    season.add_argument("--tolerance", type=float, default=0.2,
+                        help="Allowed slow-down vs --compare (default 0.2 = 20%%)")
+
+    startup = sub.add_parser("startup", help="Check quick commands against the startup budget")
+    startup.add_argument("root", help="Folder containing match folders")
+    startup.add_argument("--budget", type=float, default=STARTUP_BUDGET)
+    startup.add_argument("--repeat", type=int, default=3)
+
+    args = parser.parse_args(argv)
+
+    if args.command == "readers":
+        items = raw_tables(args.root)
+        if not items:
+            parser.error(f"no raw FBref files under {os.path.abspath(args.root)}")
+        result = compare_readers(items, args.repeat)
+        print(f"files        {result['files']}")
+        print(f"legacy       {result['legacy'] * 1000:8.1f} ms  "
+              f"{result['legacy_bytes'] / 1024:8.1f} KiB")
+        print(f"single pass  {result['single_pass'] * 1000:8.1f} ms  "
+              f"{result['single_pass_bytes'] / 1024:8.1f} KiB")
+        print(f"speed-up     {result['legacy'] / result['single_pass']:8.2f}x")
+        print(f"memory       {result['single_pass_bytes'] / result['legacy_bytes']:8.2f}x")
+
+    elif args.command == "season":
+        rows = []
+        for n in args.matches:
+            keep = os.path.join(args.keep, f"{n:03d}") if args.keep else None
+            rows.extend(bench_season(
+                n, args.repeat, not args.no_charts, keep, not args.no_memory
+            ))
+
+        print(f"{'step':24} {'matches':>7} {'seconds':>9} {'matches/s':>10} {'peak MiB':>9}")
+        for row in rows:
+            peak = "-" if row["peak_mib"] is None else f"{row['peak_mib']:.1f}"
+            print(f"{row['step']:24} {row['matches']:7d} {row['seconds']:9.3f} "
+                  f"{row['matches_per_s']:10.1f} {peak:>9}")
+
+        if args.json:
+            with open(args.json, "w") as f:
+                json.dump(rows, f, indent=2)
+
+        if args.compare:
+            with open(args.compare) as f:
+                slower = compare_results(rows, json.load(f), args.tolerance)
+            for step, n, before, now in slower:
+                print(f"SLOWER  {step} ({n} matches): {before:.3f}s -> {now:.3f}s")
+            if slower:
+                raise SystemExit(1)
+
+    elif args.command == "startup":
+        over = False
+        for argv in (["--help"], ["validate", args.root]):
+            result = measure_startup(argv, args.repeat)
+            ok = result["seconds"] <= args.budget and not result["heavy"]
+            over = over or not ok
+            heavy = ", ".join(result["heavy"]) or "none"
+            print(f"{'OK  ' if ok else 'SLOW'}  {' '.join(argv):40} "
+                  f"{result['seconds'] * 1000:7.1f} ms  heavy imports: {heavy}")
+        if over:
+            raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
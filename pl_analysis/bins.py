@@ -0,0 +1,144 @@
+# bins.py
+# Distance-zone / time-window binning with precomputed lookups
+#
+# A BinSpec holds right-closed bin edges (the pd.cut default the
+# scripts used) and a lookup table mapping every whole value in
+# range to its bin code, so whole-number minutes and distances are
+# binned with one array index instead of a search per value.
+# count_matrix() turns (group, value) pairs into a dense group x bin
+# count matrix with a single bincount, for one match or a season.
+
+import numpy as np
+import pandas as pd
+
+# =====================================================
+# 1. BIN SPEC
+# =====================================================
+class BinSpec:
+    """
+    Right-closed bins (edges[i], edges[i + 1]] with labels.
+
+    - ``name`` is the output column ("distance_zone")
+    - ``column`` is the input column ("distance")
+    """
+
+    def __init__(self, name, column, edges, labels):
+        if len(labels) != len(edges) - 1:
+            raise ValueError(f"{name}: {len(edges)} edges need {len(edges) - 1} labels")
+        if list(edges) != sorted(edges):
+            raise ValueError(f"{name}: bin edges must be increasing")
+
+        self.name = name
+        self.column = column
+        self.edges = np.asarray(edges, dtype="float64")
+        self.labels = list(labels)
+
+        # lookup[v] = bin code for whole values 0..max edge, -1 outside.
+        whole = np.arange(int(np.floor(self.edges[-1])) + 1, dtype="float64")
+        self.lookup = self._search(whole)
+
+    def __repr__(self):
+        return f"BinSpec({self.name!r}, {self.labels})"
+
+    def _search(self, values):
+        codes = np.searchsorted(self.edges, values, side="left") - 1
+        outside = (values <= self.edges[0]) | (values > self.edges[-1]) | np.isnan(values)
+        codes[outside] = -1
+        return codes.astype("int8")
+
+    def code(self, value):
+        """
+        Bin code of a single value (-1 if missing / out of range);
+        whole values are one lookup, for per-event streaming use.
+        """
+        if value is None or value != value:
+            return -1
+        if 0 <= value < len(self.lookup) and value == int(value):
+            return int(self.lookup[int(value)])
+        return int(self._search(np.array([value], dtype="float64"))[0])
+
+    def codes(self, values):
+        """
+        Bin code per value (-1 for missing / out of range).
+        """
+        values = np.asarray(pd.to_numeric(values, errors="coerce"), dtype="float64")
+        in_lookup = (values >= 0) & (values < len(self.lookup))
+        whole = in_lookup & (values == np.floor(np.where(in_lookup, values, 0)))
+
+        if whole.all():
+            return self.lookup[values.astype("int64")]
+
+        codes = self._search(values)
+        codes[whole] = self.lookup[values[whole].astype("int64")]
+        return codes
+
+    def categorical(self, values):
+        """
+        Ordered categorical of labels, like pd.cut(..., ordered=True).
+        """
+        return pd.Categorical.from_codes(
+            self.codes(values), categories=self.labels, ordered=True
+        )
+
+# =====================================================
+# 2. DEFAULT DEFINITIONS
+# =====================================================
+DISTANCE_ZONES = BinSpec(
+    "distance_zone", "distance",
+    [0, 6, 12, 18, 100],
+    ["0-6 yards", "6-12 yards", "12-18 yards", "18+ yards"]
+)
+
+TIME_WINDOWS = BinSpec(
+    "time_window", "minute",
+    [0, 15, 30, 45, 60, 75, 90, 120],
+    ["0-15", "16-30", "31-45+", "46-60", "61-75", "76-90+", "90+"]
+)
+
+# =====================================================
+# 3. COUNT MATRICES
+# =====================================================
+def count_matrix(frame, spec, by="squad"):
+    """
+    Dense group x bin counts in one vectorized pass.
+    ``by`` may be one column or a list (e.g. ["match", "team"]) so a
+    whole season of shots is binned at once. Groups are sorted and
+    only observed groups appear; rows outside every bin are ignored.
+    """
+    keys = [by] if isinstance(by, str) else list(by)
+    codes = spec.codes(frame[spec.column])
+
+    if len(keys) == 1:
+        group_codes, groups = pd.factorize(frame[keys[0]], sort=True)
+        index = pd.Index(groups, name=keys[0])
+    else:
+        index = pd.MultiIndex.from_frame(frame[keys]).unique().sort_values()
+        group_codes = index.get_indexer(pd.MultiIndex.from_frame(frame[keys]))
+
+    n_bins = len(spec.labels)
+    valid = (codes >= 0) & (group_codes >= 0)
+    flat = group_codes[valid].astype("int64") * n_bins + codes[valid]
+    counts = np.bincount(flat, minlength=len(index) * n_bins)
+
+    return pd.DataFrame(
+        counts.reshape(len(index), n_bins),
+        index=index,
+        columns=pd.CategoricalIndex(spec.labels, ordered=True, name=spec.name)
+    )
+
+
+def long_counts(matrix, value_name="shots"):
+    """
+    Matrix -> long table (group columns, bin label, count), the
+    layout written to distance_based_analysis / shot_timing_analysis.
+    """
+    n_groups, n_bins = matrix.shape
+    long = matrix.index.repeat(n_bins).to_frame(index=False)
+    name = matrix.columns.name
+    long[name] = pd.Categorical.from_codes(
+        np.tile(np.arange(n_bins), n_groups),
+        categories=list(matrix.columns),
+        ordered=True
+    )
+    long[value_name] = matrix.to_numpy().ravel()
+    return long
@@ -0,0 +1,335 @@
+# charts.py
+# Headless, batched rendering of the per-match matplotlib visuals
+#
+# Charts are drawn with matplotlib's object API on an Agg canvas (no
+# pyplot state machine, no GUI backend), so they can be rendered in
+# worker processes. Each ChartTemplate keeps one Figure per process
+# and clears it between matches instead of building a new one.
+# A chart manifest in the visuals folder records a hash of the data
+# each PNG was drawn from; unchanged charts are not redrawn.
+
+import hashlib
+import os
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from .manifest import load_manifest, save_manifest
+from .runner import default_workers
+from .storage import CsvStore
+
+CHART_MANIFEST_NAME = ".chart_manifest.json"
+
+# Bump when a template's drawing code changes so every chart is redrawn.
+CHARTS_VERSION = "1"
+
+TEAM_COLORS = ["blue", "red"]
+
+# =====================================================
+# 1. FIGURE TEMPLATES
+# =====================================================
+def _require_matplotlib():
+    try:
+        import matplotlib  # noqa: F401
+    except ImportError as exc:
+        raise ImportError(
+            "Chart rendering needs matplotlib: pip install matplotlib"
+        ) from exc
+
+
+class ChartTemplate:
+    """
+    One chart type.
+
+    - ``name`` is the PNG file name (without extension)
+    - ``inputs`` lists the pipeline outputs the chart is drawn from
+    - ``draw(ax, frames, title)`` draws onto a cleared axes
+    """
+
+    def __init__(self, name, inputs, draw, title, figsize=(6, 4), tight=False):
+        self.name = name
+        self.inputs = tuple(inputs)
+        self.draw = draw
+        self.title = title
+        self.figsize = figsize
+        self.tight = tight
+        self._figure = None
+
+    def __repr__(self):
+        return f"ChartTemplate({self.name!r})"
+
+    def __getstate__(self):
+        # Figures stay in the process that created them.
+        state = self.__dict__.copy()
+        state["_figure"] = None
+        return state
+
+    def figure(self):
+        """
+        This process's reusable Figure, attached to an Agg canvas.
+        """
+        if self._figure is None:
+            _require_matplotlib()
+            from matplotlib.backends.backend_agg import FigureCanvasAgg
+            from matplotlib.figure import Figure
+
+            self._figure = Figure(figsize=self.figsize)
+            FigureCanvasAgg(self._figure)
+        return self._figure
+
+    def draw_figure(self, frames, title=None):
+        """
+        Clear this process's Figure and draw the chart onto it.
+        """
+        fig = self.figure()
+        fig.clear()
+        ax = fig.add_subplot()
+        self.draw(ax, frames, title or self.title)
+        if self.tight:
+            fig.tight_layout()
+        return fig
+
+    def render(self, frames, path, title=None):
+        self.draw_figure(frames, title).savefig(path)
+
+
+def _draw_team_bars(column, ylabel):
+    def draw(ax, frames, title):
+        summary = frames["shot_summary"]
+        ax.bar(summary["squad"].astype(str), summary[column], color=TEAM_COLORS)
+        ax.set_title(title)
+        ax.set_ylabel(ylabel)
+    return draw
+
+
+def _draw_distance_lines(ax, frames, title):
+    distance = frames["distance_based_analysis"]
+    for team in distance["squad"].unique():
+        team_data = distance[distance["squad"] == team]
+        ax.plot(
+            team_data["distance_zone"].astype(str),
+            team_data["shots"],
+            marker="o",
+            label=team
+        )
+    ax.set_title(title)
+    ax.set_xlabel("Distance Zone")
+    ax.set_ylabel("Shots")
+    if len(distance):
+        ax.legend()
+
+
+def _draw_shot_map(ax, frames, title):
+    """
+    Every shot by minute and distance from goal; marker area is
+    proportional to xG and goals are drawn as stars. (FBref shot
+    tables have no pitch coordinates, so distance is the axis.)
+    """
+    shots = frames["shots_clean"]
+    teams = sorted(shots["squad"].astype(str).str.strip().unique())
+    for color, team in zip(TEAM_COLORS, teams):
+        team_shots = shots[shots["squad"].astype(str).str.strip() == team]
+        goals = team_shots["outcome"] == "Goal"
+        sizes = 20 + 600 * team_shots["xg"].astype(float)
+        ax.scatter(
+            team_shots.loc[~goals, "minute"], team_shots.loc[~goals, "distance"],
+            s=sizes[~goals], color=color, alpha=0.45, label=team
+        )
+        ax.scatter(
+            team_shots.loc[goals, "minute"], team_shots.loc[goals, "distance"],
+            s=sizes[goals], color=color, marker="*", edgecolors="black"
+        )
+    ax.set_title(title)
+    ax.set_xlabel("Minute")
+    ax.set_ylabel("Distance from goal (yards)")
+    ax.set_xlim(0, max(95, int(shots["minute"].max()) + 5) if len(shots) else 95)
+    ax.set_ylim(bottom=0)
+    if teams:
+        ax.legend()
+
+
+def _draw_xg_timeline(ax, frames, title):
+    """
+    Cumulative xG step lines per team with goals marked.
+    """
+    timeline = frames["xg_timeline"]
+    goals = frames["goal_events"]
+    teams = sorted(timeline["squad"].astype(str).str.strip().unique())
+    for color, team in zip(TEAM_COLORS, teams):
+        team_line = timeline[timeline["squad"].astype(str).str.strip() == team]
+        ax.step(
+            team_line["minute"], team_line["cumulative_xg"],
+            where="post", color=color, label=team
+        )
+        scored = goals.loc[goals["squad"].astype(str).str.strip() == team, "minute"]
+        at_goal = team_line.set_index("minute")["cumulative_xg"].reindex(scored)
+        ax.scatter(scored, at_goal, color=color, marker="o", edgecolors="black", zorder=3)
+    ax.set_title(title)
+    ax.set_xlabel("Minute")
+    ax.set_ylabel("Cumulative xG")
+    if teams:
+        ax.legend(loc="upper left")
+
+
+CHART_TEMPLATES = {
+    template.name: template
+    for template in [
+        ChartTemplate(
+            "shots_by_team", ["shot_summary"],
+            _draw_team_bars("shots", "Shots"), "Shots by Team"
+        ),
+        ChartTemplate(
+            "xg_by_team", ["shot_summary"],
+            _draw_team_bars("total_xg", "xG"), "Total xG by Team"
+        ),
+        ChartTemplate(
+            "shot_distance_distribution", ["distance_based_analysis"],
+            _draw_distance_lines, "Shot Distance Distribution by Team",
+            figsize=(7, 4), tight=True
+        ),
+        ChartTemplate(
+            "shot_map", ["shots_clean"],
+            _draw_shot_map, "Shot Map (size = xG, star = goal)",
+            figsize=(8, 5), tight=True
+        ),
+        ChartTemplate(
+            "xg_timeline", ["xg_timeline", "goal_events"],
+            _draw_xg_timeline, "xG Timeline",
+            figsize=(8, 4), tight=True
+        ),
+    ]
+}
+
+# =====================================================
+# 2. CHANGE DETECTION
+# =====================================================
+def chart_key(template, frames, title):
+    """
+    Hash of the template version, title and the CSV form of every
+    input frame — the same for data held in memory or re-read
+    from the clean folder.
+    """
+    digest = hashlib.sha256()
+    digest.update(f"{CHARTS_VERSION}\0{template.name}\0{title}".encode())
+    for name in template.inputs:
+        digest.update(f"\0{name}\0".encode())
+        digest.update(frames[name].to_csv(index=False).encode())
+    return digest.hexdigest()
+
+# =====================================================
+# 3. RENDERING
+# =====================================================
+def render_match_charts(match, charts=None, titles=None, store=None, force=False):
+    """
+    Draw the requested charts (default: all templates) for one
+    match from its stored outputs into the visuals folder.
+    Returns {chart name: "rendered" | "fresh"}.
+    """
+    store = store or CsvStore()
+    titles = titles or {}
+    templates = [CHART_TEMPLATES[name] for name in (charts or CHART_TEMPLATES)]
+
+    frames = {}
+    for template in templates:
+        for name in template.inputs:
+            if name not in frames:
+                frames[name] = store.read(match, name)
+
+    os.makedirs(match.visuals_dir, exist_ok=True)
+    manifest = load_manifest(match.visuals_dir, CHART_MANIFEST_NAME)
+    previous = manifest.get("charts", {})
+
+    status = {}
+    for template in templates:
+        title = titles.get(template.name, template.title)
+        key = chart_key(template, frames, title)
+        path = os.path.join(match.visuals_dir, f"{template.name}.png")
+
+        if not force and previous.get(template.name) == key and os.path.exists(path):
+            status[template.name] = "fresh"
+            continue
+
+        template.render(frames, path, title)
+        previous[template.name] = key
+        status[template.name] = "rendered"
+
+    save_manifest(match.visuals_dir, {"charts": previous}, CHART_MANIFEST_NAME)
+    return status
+
+
+class ChartResult:
+    """
+    Outcome of rendering one match's charts.
+    """
+
+    def __init__(self, name, ok, seconds, status=None, error=None):
+        self.name = name
+        self.ok = ok
+        self.seconds = seconds
+        self.status = dict(status or {})
+        self.error = error
+
+    def __repr__(self):
+        state = "ok" if self.ok else "failed"
+        return f"ChartResult({self.name!r}, {state}, {self.seconds:.2f}s)"
+
+
+def render_one(match, charts=None, store=None, force=False):
+    """
+    Render one match and capture success / failure and timing.
+    Module level so it can be pickled into worker processes.
+    """
+    start = time.perf_counter()
+    try:
+        status = render_match_charts(match, charts, store=store, force=force)
+    except Exception:
+        return ChartResult(
+            match.name, False, time.perf_counter() - start,
+            error=traceback.format_exc()
+        )
+    return ChartResult(match.name, True, time.perf_counter() - start, status)
+
+
+def render_season_charts(matches, workers=None, charts=None, store=None, force=False):
+    """
+    Render charts for every match across a process pool (each
+    worker reuses its own template figures). Returns one
+    ChartResult per match, in input order.
+    """
+    matches = list(matches)
+    workers = min(workers or default_workers(), max(len(matches), 1))
+
+    if workers == 1:
+        return [render_one(match, charts, store, force) for match in matches]
+
+    results = {}
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {
+            pool.submit(render_one, match, charts, store, force): match
+            for match in matches
+        }
+        for future in as_completed(futures):
+            match = futures[future]
+            try:
+                results[match.base_dir] = future.result()
+            except Exception:
+                results[match.base_dir] = ChartResult(
+                    match.name, False, 0.0, error=traceback.format_exc()
+                )
+
+    return [results[match.base_dir] for match in matches]
+
+
+def summarise_charts(results):
+    lines = []
+    for result in results:
+        if result.ok:
+            rendered = sum(1 for s in result.status.values() if s == "rendered")
+            lines.append(
+                f"CHARTS  {result.name} ({rendered} rendered, "
+                f"{len(result.status) - rendered} unchanged, {result.seconds:.2f}s)"
+            )
+        else:
+            last = result.error.strip().splitlines()[-1] if result.error else "unknown error"
+            lines.append(f"FAILED  {result.name} charts: {last}")
+    return "\n".join(lines)
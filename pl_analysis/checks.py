@@ -0,0 +1,544 @@
+# checks.py
+# Data-quality invariants over the clean outputs
+#
+# Each Invariant is a vectorized rule over season-wide tables (one
+# frame per output, every match concatenated with a ``match``
+# column): shot counts agree with the team totals, xG sums agree
+# across tables, no output repeats a column, team names are trimmed
+# and resolve to the match's two teams, and team / player ids agree
+# with the names. A season is checked with one groupby / merge per
+# invariant rather than one pass per match, and
+# the same rules run on a single match's outputs inside the pipeline,
+# before anything is written, so bad data never reaches the CSVs
+# Power BI reads.
+#
+#   python -m pl_analysis check "Tactical- analysis"
+
+import csv
+import os
+
+import pandas as pd
+
+from .discovery import SIDES, team_key, team_slug
+from .errors import DataQualityError
+from .identity import IdentityResolver
+from .players import SPACE, prepare_players
+
+ERROR = "error"
+WARNING = "warning"
+
+PLAYERS = "players_clean"
+
+# Outputs the invariants read (player tables as PLAYERS).
+CHECK_INPUTS = [
+    "shots_clean", "shot_summary", "shot_outcome_breakdown",
+    "distance_based_analysis", "shot_timing_analysis", "goal_events",
+    "team_summary", "goalkeeper_summary", "passing_styles_summary",
+    "pass_types_summary", "passing_profile", PLAYERS,
+]
+
+# Columns holding team names.
+TEAM_COLUMNS = ["squad", "team"]
+
+# Columns that must hold whole, non-negative numbers.
+COUNT_COLUMNS = [
+    "shots", "count", "saves", "passes_completed", "passes_attempted",
+    "fouls", "corners",
+]
+
+# xG totals built from the same shots may differ by float rounding
+# only; FBref rounds each player's xG to 0.1, so a team's player
+# total may be off by up to 0.05 per player who shot.
+XG_TOLERANCE = 1e-3
+PLAYER_XG_ROUNDING = 0.05
+
+VIOLATION_COLUMNS = ["invariant", "severity", "match", "detail"]
+
+# =====================================================
+# 1. OUTPUT TABLES
+# =====================================================
+def _header(path):
+    """
+    Column names as written (pandas would rename repeats).
+    """
+    with open(path, encoding="utf-8", newline="") as f:
+        return next(csv.reader(f), [])
+
+
+class OutputTables:
+    """
+    What the invariants see, for one match or a whole season.
+
+    - ``tables`` maps output name to one frame with a ``match``
+      column (player tables under PLAYERS, with a ``team`` column)
+    - ``columns`` lists (match, output, column) as written, so
+      repeated column names are still visible
+    - ``teams`` maps match name to its {side: team name}
+    - ``identities`` resolves names to canonical names and ids
+    """
+
+    def __init__(self, tables, columns, teams, identities=None):
+        self.tables = tables
+        self.columns = columns
+        self.teams = teams
+        self.identities = identities or IdentityResolver()
+        self._resolved = {}
+        self._names = None
+        self._totals = {}
+
+    def __repr__(self):
+        return f"OutputTables({len(self.teams)} matches, {len(self.tables)} outputs)"
+
+    def get(self, name):
+        frame = self.tables.get(name)
+        return None if frame is None or frame.empty else frame
+
+    @classmethod
+    def from_outputs(cls, match, outputs, identities=None):
+        """
+        One match's in-memory outputs ({output name: DataFrame}).
+        """
+        slugs = {
+            f"{team_slug(match.teams[side])}_{PLAYERS}": match.teams[side]
+            for side in SIDES if side in match.teams
+        }
+        tables, players, columns = {}, [], []
+        for name, frame in outputs.items():
+            columns += [(match.name, name, str(col)) for col in frame.columns]
+            if name in slugs:
+                players.append(frame.assign(match=match.name, team=slugs[name]))
+            elif name in CHECK_INPUTS:
+                tables[name] = frame.assign(match=match.name)
+        if players:
+            tables[PLAYERS] = pd.concat(players, ignore_index=True)
+        return cls(
+            tables,
+            pd.DataFrame(columns, columns=["match", "output", "column"]),
+            {match.name: dict(match.teams)},
+            identities,
+        )
+
+    @classmethod
+    def from_context(cls, ctx):
+        """
+        A pipeline run's outputs, plus the stored outputs of stages
+        that were up to date (so cross-table rules still apply).
+        """
+        match, outputs = ctx.match, dict(ctx.outputs)
+        names = [n for n in CHECK_INPUTS if n != PLAYERS] + [
+            f"{team_slug(match.teams[side])}_{PLAYERS}" for side in SIDES if side in match.teams
+        ]
+        for name in names:
+            if name not in outputs and ctx.store.exists(match, name):
+                outputs[name] = ctx.store.read(match, name)
+        return cls.from_outputs(match, outputs, ctx.identities)
+
+    @classmethod
+    def from_season(cls, season, identities=None):
+        """
+        The stored outputs of every match in a Season (read once and
+        concatenated by the Season). Column names are taken from the
+        CSV headers; columnar stores cannot hold repeated names.
+        """
+        tables = {name: season.table(name) for name in CHECK_INPUTS}
+
+        columns = []
+        if getattr(season.store, "format", None) == "csv":
+            for match in season.matches:
+                if not os.path.isdir(match.clean_dir):
+                    continue
+                for f in sorted(os.listdir(match.clean_dir)):
+                    if f.endswith(".csv"):
+                        name = f[:-len(".csv")]
+                        header = _header(os.path.join(match.clean_dir, f))
+                        columns += [(match.name, name, col) for col in header]
+        return cls(
+            tables,
+            pd.DataFrame(columns, columns=["match", "output", "column"]),
+            {match.name: dict(match.teams) for match in season.matches},
+            identities,
+        )
+
+    def team_of(self, match, name):
+        """
+        The canonical name of the team of ``match`` a name refers to
+        (``identities``, falling back to a close match team), or None
+        if the name is blank, the teams unknown, or the name is not
+        one of them.
+        """
+        key = (match, name)
+        if key not in self._resolved:
+            teams = self.teams.get(match)
+            name = name.strip() if isinstance(name, str) else ""
+            team = None
+            if teams and name:
+                team = self.identities.team(name, list(teams.values()))
+                if team not in {self.identities.team(t) for t in teams.values()}:
+                    team = None
+            self._resolved[key] = team
+        return self._resolved[key]
+
+    def canonical(self, frame, col):
+        """
+        ``team_of`` for every row of a frame; each distinct
+        (match, name) pair is resolved once.
+        """
+        return [
+            self.team_of(match, name)
+            for match, name in zip(frame["match"].astype(str), frame[col].astype(object))
+        ]
+
+    def names(self):
+        """
+        (output, column, match, name, team) for every distinct team
+        name in the outputs (player tables excluded: their ``team``
+        comes from the match). Built once.
+        """
+        if self._names is None:
+            rows = []
+            for output, frame in self.tables.items():
+                for col in TEAM_COLUMNS:
+                    if output == PLAYERS or frame.empty or col not in frame.columns:
+                        continue
+                    pairs = set(zip(frame["match"].astype(str), frame[col].astype(object)))
+                    rows += [
+                        (output, col, match, name, self.team_of(match, name))
+                        for match, name in sorted(pairs, key=str) if isinstance(name, str)
+                    ]
+            self._names = pd.DataFrame(rows, columns=["output", "column", "match", "name", "team"])
+        return self._names
+
+    def by_team(self, frame, col, values=None):
+        """
+        Sum of ``values`` (row count if None) per (match, team) of a
+        frame, team names resolved with ``canonical``. Totals of the
+        ``tables`` frames are computed once and shared by invariants.
+        """
+        if frame is None or col not in frame.columns:
+            return None
+        key = (id(frame), col, values)
+        if key not in self._totals or not any(frame is f for f in self.tables.values()):
+            keyed = pd.DataFrame({
+                "match": frame["match"].astype(str).to_numpy(),
+                "team": self.canonical(frame, col),
+                "value": 1 if values is None
+                else pd.to_numeric(frame[values], errors="coerce").to_numpy(),
+            })
+            self._totals[key] = keyed.dropna().groupby(["match", "team"])["value"].sum()
+        return self._totals[key]
+
+# =====================================================
+# 2. INVARIANTS
+# =====================================================
+def _found(rows):
+    """
+    [(match, detail)] -> violations frame.
+    """
+    return pd.DataFrame(rows, columns=["match", "detail"])
+
+
+def _compare(left, right, labels, tolerance=0.0, missing=0):
+    """
+    Per (match, team) values that disagree between two Series.
+    Only matches present in both are compared; a team missing from
+    one side (no shots) counts as ``missing`` (None: not compared).
+    ``tolerance`` is a number or a per (match, team) Series.
+    """
+    if left is None or right is None:
+        return _found([])
+    left, right = left.to_dict(), right.to_dict()
+    limits = tolerance.to_dict() if isinstance(tolerance, pd.Series) else None
+    matches = {match for match, _ in left} & {match for match, _ in right}
+
+    rows = []
+    for key in sorted(set(left) | set(right)):
+        a, b = left.get(key, missing), right.get(key, missing)
+        if key[0] not in matches or a is None or b is None:
+            continue
+        limit = tolerance if limits is None else limits.get(key, 0)
+        if abs(a - b) > limit + 1e-9:
+            rows.append((key[0], f"{key[1]}: {labels[0]} {_number(a)}, {labels[1]} {_number(b)}"))
+    return _found(rows)
+
+
+def _number(value):
+    return f"{value:g}" if value == int(value) else f"{value:.2f}"
+
+
+def unique_columns(data):
+    """
+    No output repeats a column name (e.g. three ``player`` columns).
+    """
+    counts = data.columns.groupby(["match", "output", "column"], sort=False).size()
+    repeated = counts[counts > 1]
+    return _found([
+        (match, f"{output}: column {column!r} appears {n} times")
+        for (match, output, column), n in repeated.items()
+    ])
+
+
+def trimmed_names(data):
+    """
+    Team names carry no leading / trailing spaces (" Aston Villa").
+    """
+    names = data.names()
+    padded = names[names["name"].str.contains(rf"^{SPACE}|{SPACE}$", regex=True).astype(bool)]
+    padded = padded[["output", "column", "match", "name"]]
+    return _found([
+        (match, f"{output}: {col} {name!r} has surrounding spaces")
+        for output, col, match, name in padded.itertuples(index=False)
+    ])
+
+
+def numeric_counts(data):
+    """
+    Count columns hold whole, non-negative numbers (not text such
+    as a printed Series).
+    """
+    rows = []
+    for name, frame in data.tables.items():
+        for col in COUNT_COLUMNS:
+            if frame.empty or col not in frame.columns:
+                continue
+            values = frame[col]
+            if not pd.api.types.is_integer_dtype(values):
+                values = pd.to_numeric(values, errors="coerce")
+            bad = frame[col].notna() & (values.isna() | (values < 0) | (values % 1 != 0))
+            bad = bad.fillna(False).to_numpy(dtype=bool)
+            if bad.any():
+                rows += [
+                    (match, f"{name}: {col} is not a count: {value!r}")
+                    for match, value in frame.loc[bad, ["match", col]]
+                    .astype(str).drop_duplicates().itertuples(index=False)
+                ]
+    return _found(rows)
+
+
+def known_teams(data):
+    """
+    Within each output, every team name resolves to a different one
+    of the match's two teams.
+    """
+    names = data.names()
+    unknown = names[
+        names["team"].isna()
+        & names["name"].str.strip().astype(bool)
+        & names["match"].isin(list(data.teams))
+    ]
+    found = [
+        (match, f"{output}: {name.strip()!r} is not one of the match's teams "
+                f"({', '.join(data.teams[match].values())})")
+        for output, match, name in unknown[["output", "match", "name"]].itertuples(index=False)
+    ]
+
+    names = names.dropna(subset=["team"])
+    names = names.assign(key=names["name"].map(team_key))
+    per = names.groupby(["match", "output"]).agg(
+        names=("key", "nunique"), teams=("team", "nunique"),
+        listed=("name", lambda n: ", ".join(sorted(n))),
+    )
+    bad = per[per["names"] > per["teams"]]
+    return _found(found + [
+        (match, f"{output}: {n} team names for {t} team(s) ({listed})")
+        for (match, output), n, t, listed
+        in zip(bad.index, bad["names"], bad["teams"], bad["listed"])
+    ])
+
+
+def team_spelling(data):
+    """
+    Outputs use canonical team names ("Manchester United", not the
+    shot table's "Manchester Utd"), so tables join on team.
+    """
+    names = data.names().dropna(subset=["team"])
+    names = names[names["name"].map(team_key) != names["team"].map(team_key)]
+    grouped = names.groupby(["match", "name", "team"])["output"].agg(
+        lambda o: ", ".join(sorted(set(o)))
+    )
+    return _found([
+        (match, f"{name.strip()!r} for {team!r} in {outputs}")
+        for (match, name, team), outputs in grouped.items()
+    ])
+
+
+def identity_ids(data):
+    """
+    ``team_id`` / ``player_id`` columns hold the ids of the row's
+    canonical team / player (identity.py), so id joins agree with
+    the names.
+    """
+    rows = []
+    for output, frame in data.tables.items():
+        if frame.empty:
+            continue
+        col = next((c for c in TEAM_COLUMNS if c in frame.columns), None)
+        if "team_id" in frame.columns and col is not None:
+            for match, name, team_id in set(zip(
+                frame["match"].astype(str).tolist(), frame[col].tolist(),
+                frame["team_id"].tolist(),
+            )):
+                team = data.team_of(match, name)
+                if team is not None and not pd.isna(team_id) \
+                        and data.identities.team_id(team) != team_id:
+                    rows.append((
+                        match, f"{output}: team_id {team_id} does not identify {name.strip()!r}"
+                    ))
+        if {"player", "player_id"} <= set(frame.columns):
+            for match, name, player_id in set(zip(
+                frame["match"].astype(str).tolist(), frame["player"].tolist(),
+                frame["player_id"].tolist(),
+            )):
+                if isinstance(name, str) and not pd.isna(player_id) \
+                        and data.identities.player_id(name) != player_id:
+                    rows.append((
+                        match, f"{output}: player_id {player_id} does not identify {name.strip()!r}"
+                    ))
+    return _found(sorted(rows))
+
+
+def shots_match_team_totals(data):
+    """
+    Shots in the shot table equal the team stats' ``sh`` total.
+    """
+    return _compare(
+        data.by_team(data.get("shot_summary"), "squad", "shots"),
+        data.by_team(data.get("team_summary"), "team", "shots"),
+        ("shot table shots", "team stats shots"),
+    )
+
+
+def xg_totals(data):
+    """
+    Shot-summary xG equals the sum over shots_clean, and the
+    players' xG matches it up to FBref's per-player rounding.
+    """
+    shot_xg = data.by_team(data.get("shots_clean"), "squad", "xg")
+    found = [_compare(
+        data.by_team(data.get("shot_summary"), "squad", "total_xg"), shot_xg,
+        ("shot summary xG", "shots xG"), XG_TOLERANCE,
+    )]
+
+    players = data.get(PLAYERS)
+    if players is not None and {"player", "xg", "sh"} <= set(players.columns):
+        players = prepare_players(players)
+        keyed = players.assign(match=players["match"].astype(str), shooters=players["sh"] > 0)
+        keyed["team"] = data.canonical(keyed, "team")
+        per_team = keyed.groupby(["match", "team"])
+        tolerance = per_team["shooters"].sum() * PLAYER_XG_ROUNDING + XG_TOLERANCE
+        found.append(_compare(
+            per_team["xg"].sum(), shot_xg, ("players xG", "shots xG"), tolerance, None,
+        ))
+    return pd.concat(found, ignore_index=True)
+
+
+def bin_totals(data):
+    """
+    Distance-zone and time-window counts add up to the team's shots.
+    """
+    shots = data.by_team(data.get("shot_summary"), "squad", "shots")
+    return pd.concat([
+        _compare(
+            data.by_team(data.get(name), "squad", "shots"), shots,
+            (f"{label} shots", "shot summary shots"),
+        )
+        for name, label in [
+            ("distance_based_analysis", "distance-zone"),
+            ("shot_timing_analysis", "time-window"),
+        ]
+    ], ignore_index=True)
+
+
+def goal_counts(data):
+    """
+    One goal event per shot with outcome Goal.
+    """
+    outcomes = data.get("shot_outcome_breakdown")
+    goals = None
+    if outcomes is not None and "outcome" in outcomes.columns:
+        scored = outcomes[outcomes["outcome"].astype(str) == "Goal"]
+        goals = data.by_team(scored, "squad", "count")
+    return _compare(
+        data.by_team(data.get("goal_events"), "squad"), goals,
+        ("goal events", "Goal outcomes"),
+    )
+
+
+class Invariant:
+    """
+    A declared data-quality rule: ``func(data)`` returns violations
+    (match, detail). ``error`` invariants stop the pipeline;
+    ``warning`` ones are reported only.
+    """
+
+    def __init__(self, name, func, severity=ERROR):
+        self.name = name
+        self.func = func
+        self.severity = severity
+
+    def __repr__(self):
+        return f"Invariant({self.name!r}, {self.severity})"
+
+
+INVARIANTS = [
+    Invariant("unique_columns", unique_columns),
+    Invariant("trimmed_names", trimmed_names),
+    Invariant("numeric_counts", numeric_counts),
+    Invariant("known_teams", known_teams),
+    Invariant("team_spelling", team_spelling, WARNING),
+    Invariant("identity_ids", identity_ids),
+    Invariant("shots_match_team_totals", shots_match_team_totals),
+    Invariant("xg_totals", xg_totals),
+    Invariant("bin_totals", bin_totals),
+    Invariant("goal_counts", goal_counts),
+]
+
+# =====================================================
+# 3. RUNNING CHECKS
+# =====================================================
+def check_tables(data, invariants=None):
+    """
+    Every invariant over ``data`` (an OutputTables); returns one
+    row per violation (invariant, severity, match, detail).
+    """
+    found = []
+    for invariant in INVARIANTS if invariants is None else invariants:
+        violations = invariant.func(data)
+        if len(violations):
+            found.append(violations.assign(invariant=invariant.name, severity=invariant.severity))
+    if not found:
+        return pd.DataFrame(columns=VIOLATION_COLUMNS)
+    return (
+        pd.concat(found, ignore_index=True)[VIOLATION_COLUMNS]
+        .sort_values(["match"], kind="stable")
+        .reset_index(drop=True)
+    )
+
+
+def check_season(season, invariants=None, identities=None):
+    return check_tables(OutputTables.from_season(season, identities), invariants)
+
+
+def raise_for_errors(violations, what="outputs"):
+    """
+    DataQualityError listing the error-level violations, if any.
+    """
+    errors = violations[violations["severity"] == ERROR]
+    if len(errors):
+        lines = [f"   {row.match}: {row.invariant}: {row.detail}" for row in errors.itertuples()]
+        raise DataQualityError(
+            f"{len(errors)} data-quality error(s) in {what}:\n" + "\n".join(lines)
+        )
+
+
+def summarise_checks(violations, matches):
+    """
+    One line per violation plus a totals line, for console output.
+    """
+    lines = [
+        f"{row.severity.upper():<8}{row.match}: {row.invariant}: {row.detail}"
+        for row in violations.itertuples()
+    ]
+    failed = violations.loc[violations["severity"] == ERROR, "match"].nunique()
+    warnings = int((violations["severity"] == WARNING).sum())
+    lines.append(f"{len(matches) - failed} passed, {failed} failed, {warnings} warning(s)")
+    return "\n".join(lines)
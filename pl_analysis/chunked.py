@@ -0,0 +1,223 @@
+# chunked.py
+# Memory-bounded shot aggregation for large shot / event archives
+#
+# Shots are read in fixed-size chunks (raw FBref shot tables, match
+# folders, or consolidated season shot tables in CSV / Parquet) and
+# each chunk is reduced to small partial aggregates that are added
+# to running totals: per-group shots and xG, outcome counts and the
+# distance-zone / time-window count matrices. Peak memory depends on
+# the chunk size and the number of groups, not on how many rows or
+# seasons are processed. Outputs have the layout of the batch
+# shot_summary / shot_outcomes / distance_analysis / shot_timing
+# stages, grouped by ``team`` (or e.g. ["match", "team"]).
+
+import os
+
+import pandas as pd
+
+from .bins import DISTANCE_ZONES, TIME_WINDOWS, count_matrix, long_counts
+from .discovery import discover_matches
+from .headers import RAW_ENCODING, fbref_column_names, normalise_column, read_header
+from .schema import parse_minutes
+
+DEFAULT_CHUNK_SIZE = 100_000
+
+# Columns the aggregates need (``match`` when the source has one).
+CHUNK_COLUMNS = ["match", "team", "minute", "xg", "distance", "outcome"]
+
+# =====================================================
+# 1. CHUNK SOURCES
+# =====================================================
+def _normalise_chunk(chunk, match=None):
+    """
+    Source chunk -> CHUNK_COLUMNS, keeping only real shots (the
+    shots_clean rule: minute, xG and distance present).
+    """
+    if "team" not in chunk.columns:
+        chunk = chunk.rename(columns={"squad": "team"})
+    if match is not None:
+        chunk = chunk.assign(match=match)
+
+    for col in ["xg", "distance"]:
+        chunk[col] = pd.to_numeric(chunk[col], errors="coerce")
+    if not pd.api.types.is_numeric_dtype(chunk["minute"]):
+        chunk = parse_minutes(chunk)
+
+    chunk = chunk.dropna(subset=["xg", "minute", "distance"])
+    chunk["team"] = chunk["team"].astype(str).str.strip()
+    return chunk[[c for c in CHUNK_COLUMNS if c in chunk.columns]]
+
+
+def raw_shot_chunks(path, chunk_size=DEFAULT_CHUNK_SIZE, match=None):
+    """
+    Chunks of a raw FBref shot table (two header rows), reading only
+    the columns the aggregates use.
+    """
+    names = fbref_column_names(*read_header(path))
+    wanted = {"squad", "minute", "xg", "distance", "outcome"}
+    keep = [i for i, name in enumerate(names) if name in wanted]
+    reader = pd.read_csv(
+        path, encoding=RAW_ENCODING, header=None, skiprows=2,
+        names=[names[i] or f"_{i}" for i in range(len(names))],
+        usecols=keep, dtype=str, skip_blank_lines=True, index_col=False,
+        chunksize=chunk_size
+    )
+    with reader:
+        for chunk in reader:
+            yield _normalise_chunk(chunk, match)
+
+
+def table_chunks(path, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Chunks of a consolidated season shot table (.parquet or .csv,
+    see SeasonShots.save).
+    """
+    if path.endswith(".parquet"):
+        import pyarrow.parquet as pq
+
+        parquet = pq.ParquetFile(path)
+        columns = [c for c in CHUNK_COLUMNS if c in parquet.schema_arrow.names]
+        for batch in parquet.iter_batches(batch_size=chunk_size, columns=columns):
+            yield _normalise_chunk(batch.to_pandas())
+        return
+
+    header = pd.read_csv(path, nrows=0).columns
+    columns = [c for c in CHUNK_COLUMNS if c in header]
+    with pd.read_csv(path, usecols=columns, chunksize=chunk_size) as reader:
+        for chunk in reader:
+            yield _normalise_chunk(chunk)
+
+
+def shot_chunks(source, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Chunks from one source: a folder of match folders (every
+    match's raw shot table), a raw FBref shot table, or a season
+    shot table.
+    """
+    if os.path.isdir(source):
+        for match in discover_matches(source):
+            if match.shot_file:
+                yield from raw_shot_chunks(match.shot_file, chunk_size, match.name)
+        return
+
+    if source.endswith(".parquet"):
+        yield from table_chunks(source, chunk_size)
+        return
+
+    # A raw export has its column names on the second header row.
+    groups, _ = read_header(source)
+    if "xg" in {normalise_column(name) for name in groups}:
+        yield from table_chunks(source, chunk_size)
+    else:
+        yield from raw_shot_chunks(source, chunk_size)
+
+# =====================================================
+# 2. MERGEABLE AGGREGATES
+# =====================================================
+def _add(total, part):
+    return part if total is None else total.add(part, fill_value=0)
+
+
+class ShotAggregates:
+    """
+    Running shot aggregates over any number of chunks.
+
+    ``update(chunk)`` reduces a chunk to per-group partials and adds
+    them to the totals; ``merge(other)`` adds another instance's
+    totals (e.g. one built per season or per worker).
+    """
+
+    def __init__(self, by="team"):
+        self.by = [by] if isinstance(by, str) else list(by)
+        self.rows = 0
+        self.chunks = 0
+        self._summary = None
+        self._outcomes = None
+        self._distance = None
+        self._timing = None
+
+    def __repr__(self):
+        return f"ShotAggregates(by={self.by}, {self.rows} shots, {self.chunks} chunks)"
+
+    def update(self, chunk):
+        if chunk.empty:
+            return self
+        grouped = chunk.groupby(self.by, observed=True, sort=False)
+        summary = grouped["xg"].agg(["count", "sum"])
+        summary.columns = ["shots", "total_xg"]
+
+        outcomes = (
+            chunk.assign(outcome=chunk["outcome"].astype("string"))
+            .groupby(self.by + ["outcome"], sort=False)
+            .size()
+        )
+
+        self._summary = _add(self._summary, summary)
+        self._outcomes = _add(self._outcomes, outcomes)
+        self._distance = _add(self._distance, count_matrix(chunk, DISTANCE_ZONES, by=self.by))
+        self._timing = _add(self._timing, count_matrix(chunk, TIME_WINDOWS, by=self.by))
+        self.rows += len(chunk)
+        self.chunks += 1
+        return self
+
+    def merge(self, other):
+        if other.by != self.by:
+            raise ValueError(f"cannot merge aggregates by {other.by} into {self.by}")
+        for name in ["_summary", "_outcomes", "_distance", "_timing"]:
+            part = getattr(other, name)
+            if part is not None:
+                setattr(self, name, _add(getattr(self, name), part))
+        self.rows += other.rows
+        self.chunks += other.chunks
+        return self
+
+    # -----------------------------
+    # Outputs (layouts of the batch stages)
+    # -----------------------------
+    def shot_summary(self):
+        if self._summary is None:
+            return pd.DataFrame(columns=self.by + ["shots", "total_xg", "xg_per_shot"])
+        summary = self._summary.sort_index().reset_index()
+        summary["shots"] = summary["shots"].astype("int64")
+        summary["xg_per_shot"] = summary["total_xg"] / summary["shots"]
+        return summary
+
+    def shot_outcome_breakdown(self):
+        if self._outcomes is None:
+            return pd.DataFrame(columns=self.by + ["outcome", "count"])
+        return (
+            self._outcomes.astype("int64")
+            .sort_index()
+            .reset_index(name="count")
+        )
+
+    def _long(self, matrix):
+        return long_counts(matrix.sort_index().astype("int64"))
+
+    def outputs(self):
+        outputs = {
+            "shot_summary": self.shot_summary(),
+            "shot_outcome_breakdown": self.shot_outcome_breakdown(),
+        }
+        outputs["shot_volume_by_team"] = outputs["shot_summary"][self.by + ["shots"]]
+        if self._distance is not None:
+            outputs["distance_based_analysis"] = self._long(self._distance)
+            outputs["shot_timing_analysis"] = self._long(self._timing)
+        return outputs
+
+
+def aggregate_shots(sources, by="team", chunk_size=DEFAULT_CHUNK_SIZE, on_chunk=None):
+    """
+    Stream every source (see shot_chunks) through one
+    ShotAggregates. ``on_chunk(aggregates)`` is called after each
+    chunk, e.g. for progress output.
+    """
+    if isinstance(sources, str):
+        sources = [sources]
+    aggregates = ShotAggregates(by)
+    for source in sources:
+        for chunk in shot_chunks(source, chunk_size):
+            aggregates.update(chunk)
+            if on_chunk is not None:
+                on_chunk(aggregates)
+    return aggregates
@@ -0,0 +1,260 @@
+# discovery.py
+# Locate match folders and classify the raw FBref files inside them
+
+import difflib
+import os
+import re
+
+# =====================================================
+# 1. FOLDER CONVENTIONS
+# =====================================================
+# Raw folder name -> clean folder name used alongside it.
+DATA_DIRS = {
+    "Data_raw": "Data_clean",
+    "Data- Raw": "Data- Clean",
+}
+
+VISUAL_DIRS = ["Visuals", "Visual"]
+
+# =====================================================
+# 2. RAW FILE PATTERNS
+# =====================================================
+# Per-team tables carry the team name as a prefix, the shot
+# table carries both teams ("Shot table <home> vs <away>.csv").
+TEAM_TABLE_PATTERNS = {
+    "team_stats": re.compile(r"^(?P<team>.+?) team stats\.csv$", re.I),
+    "passing": re.compile(r"^(?P<team>.+?) passing (styles|types)\.csv$", re.I),
+    "pass_types": re.compile(r"^(?P<team>.+?) pass types\.csv$", re.I),
+    "goalkeeper": re.compile(r"^(?P<team>.+?) goalkeeper stats\.csv$", re.I),
+}
+
+SHOT_TABLE_PATTERN = re.compile(
+    r"^shot table (?P<home>.+?) vs (?P<away>.+?)\.csv$", re.I
+)
+
+SIDES = ["home", "away"]
+
+# Match folder names ("Aston villa vs Manchester united",
+# "manchester-united-vs-bournemouth") name both teams; used for
+# folders kept without their raw exports.
+FOLDER_PATTERN = re.compile(
+    r"^(?:\d+\s+)?(?P<home>.+?)[\s_-]+vs[\s_-]+(?P<away>.+)$", re.I
+)
+
+
+def display_team_name(name):
+    """
+    Turn a team name taken from a file name into a display name.
+    Words typed in lower case are capitalised ("Newcastle united"
+    -> "Newcastle United"); existing casing ("AFC") is kept.
+    """
+    words = name.strip().split()
+    return " ".join(w.capitalize() if w.islower() else w for w in words)
+
+
+def team_slug(name):
+    """
+    File-name friendly version of a team name.
+    """
+    return re.sub(r"[^a-z0-9]+", "_", name.lower()).strip("_")
+
+# =====================================================
+# 3. MATCH FOLDER
+# =====================================================
+class Match:
+    """
+    One match folder and the raw tables found in it.
+
+    - ``teams`` maps "home" / "away" to display names
+    - ``raw_files`` maps table kind to {side: path}
+    - ``shot_file`` is the shot table path (or None)
+    """
+
+    def __init__(self, base_dir, raw_dir, clean_dir, visuals_dir):
+        self.base_dir = base_dir
+        self.name = os.path.basename(os.path.normpath(base_dir))
+        self.raw_dir = raw_dir
+        self.clean_dir = clean_dir
+        self.visuals_dir = visuals_dir
+        self.teams = {}
+        self.raw_files = {kind: {} for kind in TEAM_TABLE_PATTERNS}
+        self.shot_file = None
+
+    def __repr__(self):
+        return f"Match({self.name!r})"
+
+    def has_table(self, kind):
+        if kind == "shots":
+            return self.shot_file is not None
+        return len(self.raw_files.get(kind, {})) == len(SIDES)
+
+    def raw_paths(self):
+        """
+        All raw files used by this match, in a stable order.
+        """
+        paths = []
+        for kind in sorted(self.raw_files):
+            for side in SIDES:
+                if side in self.raw_files[kind]:
+                    paths.append(self.raw_files[kind][side])
+        if self.shot_file:
+            paths.append(self.shot_file)
+        return paths
+
+
+def _resolve_side(team, candidates):
+    """
+    Match a team name from a file name against the home / away
+    names. Falls back to a first-word comparison because FBref
+    exports are named inconsistently ("Aston villa", "Aston Villa").
+    """
+    key = team.lower().strip()
+    for side, name in candidates.items():
+        if key == name.lower():
+            return side
+    for side, name in candidates.items():
+        name = name.lower()
+        if key.startswith(name) or name.startswith(key):
+            return side
+    for side, name in candidates.items():
+        if key.split()[0] == name.lower().split()[0]:
+            return side
+    return None
+
+
+def team_key(name):
+    """
+    Case- and whitespace-insensitive form of a team name.
+    """
+    return " ".join(str(name).split()).casefold()
+
+
+def squad_sides(squads, teams):
+    """
+    {squad name in the shot table: side}. Shot tables may spell a
+    team differently from the file names ("Manchester Utd"), so
+    each squad goes to the closest of the home / away names.
+    """
+    sides = {}
+    for squad in squads:
+        scores = {
+            side: difflib.SequenceMatcher(None, team_key(squad), team_key(name)).ratio()
+            for side, name in teams.items()
+        }
+        sides[squad] = max(scores, key=scores.get)
+    return sides
+
+
+def load_match(base_dir):
+    """
+    Build a Match for a folder, or return None if the folder does
+    not contain a recognised raw data directory.
+    """
+    raw_dir = clean_dir = None
+    for raw_name, clean_name in DATA_DIRS.items():
+        if os.path.isdir(os.path.join(base_dir, raw_name)):
+            raw_dir = os.path.join(base_dir, raw_name)
+            clean_dir = os.path.join(base_dir, clean_name)
+            break
+
+    if raw_dir is None:
+        return None
+
+    visuals_dir = os.path.join(base_dir, VISUAL_DIRS[0])
+    for name in VISUAL_DIRS:
+        if os.path.isdir(os.path.join(base_dir, name)):
+            visuals_dir = os.path.join(base_dir, name)
+            break
+
+    match = Match(base_dir, raw_dir, clean_dir, visuals_dir)
+    files = sorted(f for f in os.listdir(raw_dir) if f.lower().endswith(".csv"))
+
+    # Shot table first: it fixes home / away ordering.
+    for f in files:
+        found = SHOT_TABLE_PATTERN.match(f)
+        if found:
+            match.shot_file = os.path.join(raw_dir, f)
+            match.teams = {
+                "home": display_team_name(found.group("home")),
+                "away": display_team_name(found.group("away")),
+            }
+            break
+
+    team_files = []
+    for f in files:
+        for kind, pattern in TEAM_TABLE_PATTERNS.items():
+            found = pattern.match(f)
+            if found:
+                team_files.append((kind, found.group("team"), f))
+                break
+
+    # Without a shot table, sides follow the team stats file order.
+    if not match.teams:
+        names = [team for kind, team, _ in team_files if kind == "team_stats"]
+        for side, team in zip(SIDES, names):
+            match.teams[side] = display_team_name(team)
+
+    for kind, team, f in team_files:
+        side = _resolve_side(team, match.teams)
+        if side is not None:
+            match.raw_files[kind][side] = os.path.join(raw_dir, f)
+            if kind == "team_stats":
+                match.teams[side] = display_team_name(team)
+
+    return match
+
+
+def discover_matches(root):
+    """
+    Walk ``root`` and return every match folder, sorted by path.
+    """
+    matches = []
+    for dirpath, dirnames, _ in os.walk(root):
+        dirnames[:] = sorted(d for d in dirnames if not d.startswith("."))
+        if any(name in dirnames for name in DATA_DIRS):
+            match = load_match(dirpath)
+            if match is not None:
+                matches.append(match)
+            dirnames[:] = []
+    return matches
+
+
+def load_clean_match(base_dir):
+    """
+    Match for a folder with clean outputs but no raw data folder
+    (teams from the folder name, no raw files), or None.
+    """
+    for clean_name in DATA_DIRS.values():
+        clean_dir = os.path.join(base_dir, clean_name)
+        if os.path.isdir(clean_dir):
+            break
+    else:
+        return None
+
+    visuals_dir = os.path.join(base_dir, VISUAL_DIRS[0])
+    match = Match(base_dir, None, clean_dir, visuals_dir)
+    found = FOLDER_PATTERN.match(match.name)
+    if found:
+        match.teams = {
+            side: display_team_name(re.sub(r"[_-]+", " ", found.group(side)))
+            for side in SIDES
+        }
+    return match
+
+
+def discover_clean_matches(root):
+    """
+    Every match folder with clean outputs, sorted by path: the
+    folders discover_matches finds plus those whose raw exports
+    are not kept.
+    """
+    matches = []
+    data_dirs = set(DATA_DIRS) | set(DATA_DIRS.values())
+    for dirpath, dirnames, _ in os.walk(root):
+        dirnames[:] = sorted(d for d in dirnames if not d.startswith("."))
+        if any(name in dirnames for name in data_dirs):
+            match = load_match(dirpath) or load_clean_match(dirpath)
+            if match is not None:
+                matches.append(match)
+            dirnames[:] = []
+    return matches
@@ -0,0 +1,22 @@
+# errors.py
+# Exceptions raised by the match analysis pipeline
+
+
+class PipelineError(Exception):
+    """
+    Base error for anything that stops a match from being processed.
+    """
+
+
+class MissingRawTableError(PipelineError):
+    """
+    A stage needs a raw FBref table that is not present in the
+    match's raw data folder (e.g. no "Shot table ... .csv").
+    """
+
+
+class DataQualityError(PipelineError):
+    """
+    Outputs break a declared data-quality invariant (checks.py),
+    e.g. shot counts that disagree with the team totals.
+    """
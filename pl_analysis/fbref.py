@@ -0,0 +1,154 @@
+# fbref.py
+# Shared FBref table loading and cleaning helpers
+
+import io
+
+import pandas as pd
+
+from .headers import RAW_ENCODING, fbref_column_names, split_header
+from .schema import apply_parsers, coerce_to_schema, read_dtypes
+
+# =====================================================
+# 1. GENERIC FBREF CLEANER
+# =====================================================
+def clean_fbref(df):
+    """
+    Legacy cleaner for frames already loaded with pandas' default
+    header (kept for ad-hoc use; the pipeline uses read_fbref_table).
+    Standardise FBref tables:
+    - Promote first row to header
+    - Drop empty / unnamed columns
+    - Normalise column names
+    """
+    df.columns = df.iloc[0]
+    df = df.drop(index=0)
+
+    df = df.loc[:, df.columns.notna()]
+    df.columns = (
+        df.columns.astype(str)
+        .str.strip()
+        .str.lower()
+        .str.replace(" ", "_")
+    )
+
+    return df.reset_index(drop=True)
+
+# =====================================================
+# 2. SINGLE-PASS FBREF READER
+# =====================================================
+def read_fbref_table(path, kind=None):
+    """
+    Read a raw FBref CSV export in a single pass.
+    - The two header rows (group + column) are parsed directly
+      instead of being loaded as data and promoted afterwards
+    - Duplicate column names are disambiguated by group
+    - Numeric columns are typed by the CSV parser itself, using the
+      compact dtypes declared for ``kind`` in schema.py
+    """
+    with open(path, encoding=RAW_ENCODING, newline="") as f:
+        return parse_fbref_text(f.read(), kind)
+
+
+def parse_fbref_text(text, kind=None):
+    """
+    read_fbref_table for an export already read into memory
+    (decoded text), e.g. by the concurrent loader.
+    """
+    groups, header = split_header(text)
+    names = fbref_column_names(groups, header)
+
+    keep = [i for i, name in enumerate(names) if name is not None]
+    columns = [names[i] for i in keep]
+    options = dict(
+        header=None,
+        skiprows=2,
+        names=[names[i] if names[i] is not None else f"_{i}" for i in range(len(names))],
+        usecols=keep,
+        skip_blank_lines=True,
+        index_col=False,
+    )
+
+    try:
+        df = pd.read_csv(io.StringIO(text), dtype=read_dtypes(kind, columns), **options)
+    except (ValueError, TypeError):
+        # Stray text in a numeric column: parse untyped, then coerce.
+        df = coerce_to_schema(pd.read_csv(io.StringIO(text), **options), kind)
+
+    return apply_parsers(df[columns], kind)
+
+
+def load_fbref(path, kind=None):
+    """
+    Read a raw FBref CSV export and return the cleaned table.
+    """
+    return read_fbref_table(path, kind)
+
+# =====================================================
+# 3. SAFE NUMERIC EXTRACTOR (FBref DUPLICATES)
+# =====================================================
+def get_numeric_series(df, col_name):
+    """
+    Safely extract numeric columns from FBref tables.
+    Handles duplicated column names gracefully.
+    """
+    if col_name not in df.columns:
+        return pd.Series(dtype="float64")
+
+    series = df[col_name]
+
+    if isinstance(series, pd.DataFrame):
+        series = series.iloc[:, 0]
+
+    # Schema-typed tables are already numeric: skip the coercion pass.
+    if pd.api.types.is_numeric_dtype(series):
+        return series
+
+    return pd.to_numeric(series, errors="coerce")
+
+# =====================================================
+# 4. SQUAD TOTAL ROW
+# =====================================================
+# FBref player tables end with a footer such as "14 Players" that
+# already holds the squad totals.
+TOTAL_ROW_PATTERN = r"^\s*\d+\s+players?\s*$|^\s*squad total\s*$"
+
+ID_COLUMNS = ["player", "#", "nation", "pos", "age"]
+
+
+def split_squad_total(df):
+    """
+    Return (player rows, total row or None).
+    """
+    if "player" not in df.columns or df.empty:
+        return df, None
+
+    is_total = (
+        df["player"].astype("string")
+        .str.match(TOTAL_ROW_PATTERN, case=False)
+        .fillna(False)
+        .to_numpy(dtype=bool)
+    )
+    if not is_total.any():
+        return df, None
+
+    players = df[~is_total].reset_index(drop=True)
+    return players, df[is_total].iloc[-1]
+
+
+def squad_totals(df):
+    """
+    Numeric squad totals for a player table.
+    - Uses FBref's footer row when present (no re-sum, no double
+      counting of the footer itself)
+    - Falls back to summing the player rows otherwise
+    """
+    players, total = split_squad_total(df)
+    numeric = [
+        c for c in players.columns
+        if c not in ID_COLUMNS and pd.api.types.is_numeric_dtype(players[c])
+    ]
+
+    if total is not None:
+        return pd.to_numeric(total[numeric], errors="coerce")
+
+    return players[numeric].sum()
@@ -0,0 +1,81 @@
+# headers.py
+# FBref header-row parsing (standard library only)
+#
+# FBref exports start with two header rows: a group row ("Performance",
+# "Take-Ons", "SCA 1", ...) and the column row. These helpers turn
+# them into unique column names without importing pandas, so quick
+# checks such as `python -m pl_analysis validate` start fast.
+
+import csv
+import io
+import re
+
+RAW_ENCODING = "latin1"
+
+# =====================================================
+# 1. HEADER ROWS
+# =====================================================
+def read_header(path):
+    """
+    (group row, column row) of a raw FBref CSV, reading only the
+    first two lines.
+    """
+    with open(path, encoding=RAW_ENCODING, newline="") as f:
+        lines = csv.reader(f)
+        return next(lines, []), next(lines, [])
+
+
+def split_header(text):
+    """
+    (group row, column row) from the full text of an export.
+    """
+    lines = csv.reader(io.StringIO(text))
+    return next(lines, []), next(lines, [])
+
+# =====================================================
+# 2. COLUMN NAMES
+# =====================================================
+def normalise_column(name):
+    return str(name).strip().lower().replace(" ", "_")
+
+
+def group_prefix(group):
+    """
+    "Take-Ons" -> "take_ons", "SCA 1" -> "sca1", "" -> "".
+    """
+    prefix = re.sub(r"[^a-z0-9]+", "_", group.strip().lower()).strip("_")
+    return re.sub(r"_(?=\d)", "", prefix)
+
+
+def fbref_column_names(groups, header):
+    """
+    Build unique column names from FBref's two header rows.
+    - Names that occur once keep their plain form ("sh", "xg")
+    - Repeated names are prefixed with their group
+      ("passes_att" / "take_ons_att", "short_cmp", "sca1_player")
+    - Columns with an empty header are returned as None (dropped)
+    """
+    groups = list(groups) + [""] * (len(header) - len(groups))
+    names = [normalise_column(h) if str(h).strip() else None for h in header]
+
+    counts = {}
+    for name in names:
+        if name is not None:
+            counts[name] = counts.get(name, 0) + 1
+
+    result = []
+    used = set()
+    for name, group in zip(names, groups):
+        if name is not None and counts[name] > 1:
+            prefix = group_prefix(group)
+            if prefix:
+                name = f"{prefix}_{name}"
+        if name is not None:
+            # Same name under the same (or no) group: number repeats.
+            base, n = name, 2
+            while name in used:
+                name = f"{base}_{n}"
+                n += 1
+            used.add(name)
+        result.append(name)
+    return result
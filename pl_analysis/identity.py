@@ -0,0 +1,318 @@
+# identity.py
+# Canonical team and player identities with integer ids
+#
+# FBref spells the same team differently across exports of one match
+# ("Manchester United" in the team stats file names, "Manchester Utd"
+# in the shot table) and indents substitutes' names. Every name is
+# resolved to one canonical name through a hashed alias lookup:
+#
+#   key (casefolded, whitespace-collapsed name) -> canonical name
+#
+# seeded with FBref's short names and extended by a persistent alias
+# table in the season folder (identity_aliases.json, editable by hand).
+# A spelling in neither is matched to one of the match's two teams
+# only if it is close to it (difflib ratio >= MATCH_CUTOFF); such
+# guesses are reported, and only saved to the alias table on request
+# (`clean --save-aliases`). Anything else stays unresolved, so the
+# known_teams check reports it.
+#
+# Ids are a stable 53-bit hash of the canonical name, so every stage,
+# worker process and season assigns the same id to the same team or
+# player without coordination, and outputs join on team_id /
+# player_id instead of strings. 53 bits keep ids exact where a
+# season concat turns an id column with gaps into float64.
+
+import difflib
+import hashlib
+import json
+import os
+import unicodedata
+
+import numpy as np
+import pandas as pd
+
+from .discovery import team_key
+
+ALIASES_NAME = "identity_aliases.json"
+
+ALIASES_VERSION = "1"
+
+# Minimum difflib ratio between an unknown spelling and a match team.
+MATCH_CUTOFF = 0.8
+
+ID_BITS = 53
+
+# Id columns the pipeline adds to its outputs.
+ID_COLUMNS = ["team_id", "player_id"]
+
+# FBref / common short names -> canonical names (the spelling used
+# in the match folders' file names).
+TEAM_ALIASES = {
+    "Manchester Utd": "Manchester United",
+    "Man Utd": "Manchester United",
+    "Man United": "Manchester United",
+    "Man City": "Manchester City",
+    "Newcastle Utd": "Newcastle United",
+    "Newcastle": "Newcastle United",
+    "Nott'ham Forest": "Nottingham Forest",
+    "Nottm Forest": "Nottingham Forest",
+    "Sheffield Utd": "Sheffield United",
+    "Leeds": "Leeds United",
+    "Tottenham Hotspur": "Tottenham",
+    "Spurs": "Tottenham",
+    "West Ham United": "West Ham",
+    "Wolverhampton Wanderers": "Wolves",
+    "Brighton & Hove Albion": "Brighton",
+    "Brighton and Hove Albion": "Brighton",
+    "AFC Bournemouth": "Bournemouth",
+}
+
+TEAM = "team"
+PLAYER = "player"
+
+# =====================================================
+# 1. KEYS AND IDS
+# =====================================================
+def player_key(name):
+    """
+    Case-, whitespace- and Unicode-form-insensitive player name
+    (FBref's non-breaking-space indentation is whitespace too).
+    """
+    return " ".join(unicodedata.normalize("NFC", str(name)).split()).casefold()
+
+
+KEY_FUNCS = {TEAM: team_key, PLAYER: player_key}
+
+
+def stable_id(kind, name):
+    """
+    Non-negative 53-bit id of a canonical name: the same in every
+    process and run (unlike hash()), and exact as a float64.
+    """
+    digest = hashlib.blake2b(
+        f"{kind}\0{KEY_FUNCS[kind](name)}".encode("utf-8"), digest_size=8
+    ).digest()
+    return int.from_bytes(digest, "big") >> (64 - ID_BITS)
+
+
+def integer_ids(table):
+    """
+    Id columns of a concatenated table as nullable integers (outputs
+    written without ids leave gaps, which make the column float).
+    """
+    for col in ID_COLUMNS:
+        if col in table.columns and pd.api.types.is_numeric_dtype(table[col]):
+            table[col] = table[col].astype("Int64")
+    return table
+
+# =====================================================
+# 2. RESOLVER
+# =====================================================
+class IdentityResolver:
+    """
+    Hashed name -> canonical name / id lookup for teams and players.
+
+    - ``team(name, candidates)`` / ``player(name)``: canonical name
+    - ``team_id`` / ``player_id``: its stable id
+    - ``teams`` / ``players``: the same for a whole column, each
+      distinct value resolved once
+    - ``learned`` holds team spellings matched to a close match
+      team ({spelling: canonical name}); they are not aliases until
+      saved with ``save_identities(..., learned=True)``
+    """
+
+    def __init__(self, aliases=None):
+        aliases = aliases or {}
+        self.aliases = {
+            TEAM: dict(aliases.get(TEAM, {})),
+            PLAYER: dict(aliases.get(PLAYER, {})),
+        }
+        self.learned = {}
+        self._guesses = {}
+        self._lookup = {TEAM: {}, PLAYER: {}}
+        self._ids = {TEAM: {}, PLAYER: {}}
+        for kind, seeds in [(TEAM, TEAM_ALIASES), (PLAYER, {})]:
+            for alias, name in list(seeds.items()) + list(self.aliases[kind].items()):
+                self._add(kind, alias, name)
+
+    def __repr__(self):
+        return (f"IdentityResolver({len(self._lookup[TEAM])} team names, "
+                f"{len(self._lookup[PLAYER])} player names)")
+
+    def _add(self, kind, alias, name):
+        key = KEY_FUNCS[kind]
+        self._lookup[kind][key(name)] = name
+        self._lookup[kind][key(alias)] = name
+
+    # -----------------------------
+    # Single names
+    # -----------------------------
+    def team(self, name, candidates=None):
+        """
+        Canonical team name. A name not in the lookup is matched to
+        the closest of ``candidates`` (e.g. the match's two teams) if
+        it is at least MATCH_CUTOFF similar, and recorded in
+        ``learned``; otherwise it is returned unresolved.
+        """
+        name = " ".join(str(name).split())
+        key = team_key(name)
+        found = self._lookup[TEAM].get(key)
+        if found is not None or not candidates:
+            return name if found is None else found
+
+        teams = tuple(self.team(c) for c in candidates)
+        by_key = {team_key(t): t for t in teams}
+        if key in by_key:
+            return by_key[key]
+        if (key, teams) not in self._guesses:
+            close = difflib.get_close_matches(key, list(by_key), n=1, cutoff=MATCH_CUTOFF)
+            self._guesses[(key, teams)] = by_key[close[0]] if close else None
+        closest = self._guesses[(key, teams)]
+        if closest is None:
+            return name
+        self.learned[name] = closest
+        return closest
+
+    def player(self, name):
+        """
+        Canonical player name: FBref indentation and repeated spaces
+        removed, then the alias table applied.
+        """
+        name = " ".join(unicodedata.normalize("NFC", str(name)).split())
+        return self._lookup[PLAYER].get(player_key(name), name)
+
+    def _id(self, kind, canonical):
+        ids = self._ids[kind]
+        if canonical not in ids:
+            ids[canonical] = stable_id(kind, canonical)
+        return ids[canonical]
+
+    def team_id(self, name, candidates=None):
+        return self._id(TEAM, self.team(name, candidates))
+
+    def player_id(self, name):
+        return self._id(PLAYER, self.player(name))
+
+    # -----------------------------
+    # Whole columns
+    # -----------------------------
+    def _resolve(self, values, func):
+        """
+        ``func`` of every name in ``values``, each distinct name
+        resolved once; missing (non-string) values give None.
+        """
+        values = values.tolist() if hasattr(values, "tolist") else list(values)
+        resolved = {}
+        for value in values:
+            if value not in resolved:
+                resolved[value] = func(value) if isinstance(value, str) else None
+        return np.array([resolved[value] for value in values], dtype=object)
+
+    def teams(self, values, candidates=None):
+        """
+        Canonical names for a column of team names (None if missing).
+        """
+        return self._resolve(values, lambda v: self.team(v, candidates))
+
+    def team_ids(self, values, candidates=None):
+        return pd.array(
+            self._resolve(values, lambda v: self.team_id(v, candidates)), dtype="Int64"
+        )
+
+    def players(self, values):
+        return self._resolve(values, self.player)
+
+    def player_ids(self, values):
+        return pd.array(self._resolve(values, self.player_id), dtype="Int64")
+
+    def teams_by_match(self, frame, col, teams):
+        """
+        Canonical team of every row of a season-wide frame, each name
+        resolved against its own match's teams ({match: {side:
+        team}}); None where the match's teams are unknown.
+        """
+        def resolve(pair):
+            match, name = pair
+            if not isinstance(name, str) or not name.strip() or not teams.get(match):
+                return None
+            return self.team(name, list(teams[match].values()))
+
+        pairs = list(zip(frame["match"].astype(str).tolist(), frame[col].tolist()))
+        resolved = {pair: resolve(pair) for pair in set(pairs)}
+        return np.array([resolved[pair] for pair in pairs], dtype=object)
+
+    # -----------------------------
+    # Annotating outputs
+    # -----------------------------
+    def annotate(self, frame, candidates=None):
+        """
+        Canonical names in a frame's ``squad`` / ``team`` column with
+        ``team_id`` after it, and ``player_id`` after ``player``.
+        """
+        frame = frame.copy(deep=False)
+        for col in ["squad", "team"]:
+            if col in frame.columns and "team_id" not in frame.columns:
+                names = pd.Series(self.teams(frame[col], candidates), index=frame.index)
+                if isinstance(frame[col].dtype, pd.CategoricalDtype):
+                    names = names.astype("category")
+                frame[col] = names
+                frame.insert(frame.columns.get_loc(col) + 1, "team_id", self.team_ids(names))
+        if "player" in frame.columns and "player_id" not in frame.columns:
+            frame.insert(
+                frame.columns.get_loc("player") + 1, "player_id", self.player_ids(frame["player"])
+            )
+        return frame
+
+    # -----------------------------
+    # Persistence
+    # -----------------------------
+    def digest(self):
+        """
+        SHA-256 of the alias table, so outputs annotated with another
+        table are rebuilt (see Pipeline.stage_keys).
+        """
+        data = json.dumps(self.to_json(), sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+    def to_json(self, learned=False):
+        teams = dict(self.aliases[TEAM])
+        if learned:
+            teams.update(self.learned)
+        return {
+            "version": ALIASES_VERSION,
+            TEAM: dict(sorted(teams.items())),
+            PLAYER: dict(sorted(self.aliases[PLAYER].items())),
+        }
+
+
+def aliases_path(root):
+    return os.path.join(root, ALIASES_NAME)
+
+
+def load_identities(root=None):
+    """
+    Resolver with the season folder's alias table (built-in aliases
+    only if there is none or it cannot be read).
+    """
+    if root is not None:
+        try:
+            with open(aliases_path(root), encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version", ALIASES_VERSION) == ALIASES_VERSION:
+                return IdentityResolver(data)
+        except (OSError, ValueError, AttributeError):
+            pass
+    return IdentityResolver()
+
+
+def save_identities(root, identities, learned=False):
+    """
+    Write the alias table: the loaded aliases, plus the ``learned``
+    spellings if asked to.
+    """
+    path = aliases_path(root)
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(identities.to_json(learned), f, indent=2, ensure_ascii=False)
+        f.write("\n")
+    os.replace(tmp, path)
@@ -0,0 +1,303 @@
+# live.py
+# Streaming shot ingestion for match-day dashboards
+#
+# Shot events arrive one CSV line at a time, in the FBref shot table
+# layout, either from a shot table file that is still being appended
+# to or from a local TCP socket. LiveShots keeps running per-team
+# counters (shots, xG, time-window counts, goals), so adding an event
+# is O(1) and never rescans earlier shots. Publishing is not: it
+# rebuilds every live table from the counters (O(teams + goals)) and
+# rewrites every file, so it happens at most once per ``interval``
+# seconds, however fast events arrive.
+#
+# Live tables are written next to the batch outputs under a "live_"
+# prefix (live_shot_summary.csv, ...), with canonical team names and
+# ids like the batch outputs. The batch outputs and the pipeline
+# manifest are never touched; `clean` after the match is unaffected.
+
+import csv
+import os
+import socket
+import time
+
+import pandas as pd
+
+from .bins import TIME_WINDOWS, long_counts
+from .headers import fbref_column_names, normalise_column
+from .identity import IdentityResolver
+from .storage import CsvStore
+
+# Columns a line needs to count as a shot (the shots_clean rule).
+SHOT_FIELDS = ["minute", "xg", "distance"]
+
+# Prefix of the live outputs' names, keeping them apart from the
+# batch outputs of the same name.
+LIVE_PREFIX = "live_"
+
+# =====================================================
+# 1. EVENT PARSING
+# =====================================================
+def parse_minute(text):
+    """
+    "67" -> (67, 0), "90+3" -> (90, 3), anything else -> (None, None).
+    Scalar counterpart of schema.parse_minutes.
+    """
+    base, plus, added = str(text).strip().partition("+")
+    try:
+        minute = int(float(base))
+        return minute, int(added) if plus else 0
+    except ValueError:
+        return None, None
+
+
+def _number(text):
+    try:
+        return float(text)
+    except (TypeError, ValueError):
+        return None
+
+
+class ShotLineParser:
+    """
+    Turns raw CSV lines into shot event dicts.
+
+    Header rows are recognised in the stream itself: the row
+    containing "Minute" and "xG" is the column row and the row just
+    before it (if any) the FBref group row. Blank separator rows and
+    rows missing minute / xG / distance yield None.
+    """
+
+    def __init__(self):
+        self.names = None
+        self._previous = []
+
+    def parse(self, line):
+        row = next(csv.reader([line]), [])
+        if not any(cell.strip() for cell in row):
+            return None
+
+        cells = {normalise_column(cell) for cell in row}
+        if {"minute", "xg"} <= cells:
+            self.names = fbref_column_names(self._previous, row)
+            return None
+        if self.names is None:
+            self._previous = row
+            return None
+
+        event = {
+            name: value.strip()
+            for name, value in zip(self.names, row)
+            if name is not None
+        }
+        event["minute"], event["minute_added"] = parse_minute(event.get("minute", ""))
+        for col in ["xg", "distance"]:
+            event[col] = _number(event.get(col))
+        if any(event.get(col) is None for col in SHOT_FIELDS):
+            return None
+        return event
+
+# =====================================================
+# 2. RUNNING AGGREGATES
+# =====================================================
+class LiveShots:
+    """
+    Running shot aggregates for one match.
+
+    ``add(event)`` is O(1): it bumps the team's shot / xG counters,
+    one time-window counter (a BinSpec lookup) and appends goals.
+    ``outputs()`` builds the tables from the counters on each call.
+    """
+
+    def __init__(self, windows=TIME_WINDOWS):
+        self.windows = windows
+        self.shots = {}
+        self.xg = {}
+        self.timing = {}
+        self.goals = []
+        self.events = 0
+
+    def add(self, event):
+        squad = event["squad"]
+        if squad not in self.shots:
+            self.shots[squad] = 0
+            self.xg[squad] = 0.0
+            self.timing[squad] = [0] * len(self.windows.labels)
+
+        self.shots[squad] += 1
+        self.xg[squad] += event["xg"]
+        code = self.windows.code(event["minute"])
+        if code >= 0:
+            self.timing[squad][code] += 1
+        if event.get("outcome") == "Goal":
+            self.goals.append({
+                "minute": event["minute"],
+                "squad": squad,
+                "player": event.get("player"),
+                "xg": event["xg"],
+            })
+        self.events += 1
+
+    # -----------------------------
+    # Outputs (same layout as the batch stages)
+    # -----------------------------
+    def shot_summary(self):
+        squads = sorted(self.shots)
+        summary = pd.DataFrame({
+            "squad": squads,
+            "shots": [self.shots[s] for s in squads],
+            "total_xg": [self.xg[s] for s in squads],
+        })
+        summary["xg_per_shot"] = summary["total_xg"] / summary["shots"]
+        return summary
+
+    def shot_timing_analysis(self):
+        squads = sorted(self.timing)
+        matrix = pd.DataFrame(
+            [self.timing[s] for s in squads],
+            index=pd.Index(squads, name="squad"),
+            columns=pd.CategoricalIndex(
+                self.windows.labels, ordered=True, name=self.windows.name
+            ),
+            dtype="int64"
+        )
+        return long_counts(matrix)
+
+    def goal_events(self):
+        return pd.DataFrame(self.goals, columns=["minute", "squad", "player", "xg"])
+
+    def outputs(self):
+        summary = self.shot_summary()
+        return {
+            "shot_summary": summary,
+            "shot_volume_by_team": summary[["squad", "shots"]],
+            "shot_timing_analysis": self.shot_timing_analysis(),
+            "goal_events": self.goal_events(),
+        }
+
+# =====================================================
+# 3. LINE SOURCES
+# =====================================================
+# Both sources yield complete lines, and None when no new data
+# arrived within ``poll`` seconds, so the consumer can flush.
+
+def follow_file(path, poll=0.1, from_start=True):
+    """
+    Lines of a file that is still being written (like tail -f).
+    Waits for the file to appear; partial last lines are held back
+    until their newline arrives.
+    """
+    while not os.path.exists(path):
+        yield None
+        time.sleep(poll)
+
+    with open(path, encoding="latin1", newline="") as f:
+        if not from_start:
+            f.seek(0, os.SEEK_END)
+        pending = ""
+        while True:
+            chunk = f.readline()
+            if not chunk:
+                yield None
+                time.sleep(poll)
+                continue
+            pending += chunk
+            if pending.endswith("\n"):
+                yield pending
+                pending = ""
+
+
+def socket_lines(host="127.0.0.1", port=5555, poll=0.1):
+    """
+    Lines sent by local clients to a TCP socket, one client at a
+    time (e.g. `nc 127.0.0.1 5555 < shots.csv`).
+    """
+    with socket.create_server((host, port)) as server:
+        server.settimeout(poll)
+        while True:
+            try:
+                conn, _ = server.accept()
+            except socket.timeout:
+                yield None
+                continue
+            with conn:
+                conn.settimeout(poll)
+                buffer = b""
+                while True:
+                    try:
+                        data = conn.recv(65536)
+                    except socket.timeout:
+                        yield None
+                        continue
+                    if not data:
+                        break
+                    buffer += data
+                    *lines, buffer = buffer.split(b"\n")
+                    for line in lines:
+                        yield line.decode("latin1") + "\n"
+                if buffer:
+                    yield buffer.decode("latin1") + "\n"
+
+# =====================================================
+# 4. STREAMING LOOP
+# =====================================================
+def live_outputs(live, match, identities):
+    """
+    The LiveShots tables under their live_ names, with the squads
+    resolved against the match's teams and team_id / player_id added.
+    """
+    candidates = list(match.teams.values()) or None
+    return {
+        LIVE_PREFIX + name: identities.annotate(df, candidates)
+        for name, df in live.outputs().items()
+    }
+
+
+def stream_shots(lines, match=None, store=None, interval=0.5, on_update=None,
+                 max_events=None, identities=None):
+    """
+    Feed ``lines`` into a LiveShots and publish its outputs.
+
+    - outputs are written to ``store`` (default: the match's clean
+      folder as CSV) as live_<name> when ``match`` is given, so the
+      batch outputs and their manifest entries stay as they are
+    - ``on_update(live, seconds)`` is called after every publish
+      with the time taken since the newest unpublished event
+    - publishing happens at most every ``interval`` seconds, and
+      immediately when the source goes idle
+    Returns the LiveShots once the source ends (or ``max_events``).
+    """
+    parser = ShotLineParser()
+    live = LiveShots()
+    store = store or CsvStore()
+    identities = identities or IdentityResolver()
+    last_publish = 0.0
+    waiting_since = None
+
+    def publish():
+        nonlocal last_publish, waiting_since
+        if match is not None:
+            store.write(match, live_outputs(live, match, identities))
+        if on_update is not None:
+            on_update(live, time.perf_counter() - waiting_since)
+        last_publish = time.perf_counter()
+        waiting_since = None
+
+    for line in lines:
+        if line is not None:
+            event = parser.parse(line)
+            if event is not None:
+                live.add(event)
+                if waiting_since is None:
+                    waiting_since = time.perf_counter()
+
+        if waiting_since is not None and (
+            line is None or time.perf_counter() - last_publish >= interval
+        ):
+            publish()
+
+        if max_events is not None and live.events >= max_events:
+            break
+
+    if waiting_since is not None:
+        publish()
+    return live
@@ -0,0 +1,140 @@
+# loader.py
+# Concurrent raw-table loading with bounded I/O
+#
+# Reads every raw FBref export of many matches concurrently with
+# asyncio: at most ``max_open`` files are being read at once (so a
+# network mount is not flooded), and reading, hashing and parsing
+# run on one shared thread pool. Each file is read exactly once;
+# its bytes give both the parsed table and the content hash used by
+# the incremental manifest.
+
+import asyncio
+import hashlib
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from .fbref import parse_fbref_text
+from .headers import RAW_ENCODING
+
+DEFAULT_MAX_OPEN = 8
+
+# =====================================================
+# 1. LOADED MATCH
+# =====================================================
+class LoadedMatch:
+    """
+    Raw tables of one match, loaded ahead of the pipeline run.
+
+    - ``tables`` maps (kind, side) to a DataFrame (side is None for
+      the shot table), the keys MatchContext.table uses
+    - ``digests`` maps file path to SHA-256, as manifest.file_digest
+    - ``errors`` maps (kind, side) to the exception a file raised;
+      it is re-raised when a stage asks for that table
+    """
+
+    def __init__(self, match):
+        self.match = match
+        self.tables = {}
+        self.digests = {}
+        self.errors = {}
+
+    def __repr__(self):
+        return f"LoadedMatch({self.match.name!r}, {len(self.tables)} tables)"
+
+
+def raw_table_keys(match, kinds=None):
+    """
+    ((kind, side), path) for every raw file of a match, or only
+    for the table ``kinds`` given.
+    """
+    items = []
+    for kind in sorted(match.raw_files):
+        if kinds is not None and kind not in kinds:
+            continue
+        for side, path in sorted(match.raw_files[kind].items()):
+            items.append(((kind, side), path))
+    if match.shot_file and (kinds is None or "shots" in kinds):
+        items.append((("shots", None), match.shot_file))
+    return items
+
+# =====================================================
+# 2. ASYNC LOADING
+# =====================================================
+def _thread_pool():
+    # Same default size as ThreadPoolExecutor; shared by all matches.
+    return ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) + 4))
+
+
+def _read_bytes(path):
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def _digest_and_parse(data, kind):
+    text = data.decode(RAW_ENCODING)
+    return hashlib.sha256(data).hexdigest(), parse_fbref_text(text, kind)
+
+
+async def _load_file(loaded, key, path, pool, limit):
+    loop = asyncio.get_running_loop()
+    try:
+        async with limit:
+            data = await loop.run_in_executor(pool, _read_bytes, path)
+        digest, table = await loop.run_in_executor(pool, _digest_and_parse, data, key[0])
+    except Exception as exc:
+        loaded.errors[key] = exc
+        return
+    loaded.digests[path] = digest
+    loaded.tables[key] = table
+
+
+async def load_matches_async(matches, max_open=DEFAULT_MAX_OPEN, pool=None, kinds=None):
+    """
+    Load every raw table (or those of ``kinds``) of ``matches``
+    concurrently and return one LoadedMatch per match, in input order.
+    """
+    limit = asyncio.Semaphore(max_open)
+    own_pool = pool is None
+    pool = pool or _thread_pool()
+
+    try:
+        loaded = [LoadedMatch(match) for match in matches]
+        await asyncio.gather(*(
+            _load_file(item, key, path, pool, limit)
+            for item in loaded
+            for key, path in raw_table_keys(item.match, kinds)
+        ))
+        return loaded
+    finally:
+        if own_pool:
+            pool.shutdown(wait=False)
+
+
+def load_matches(matches, max_open=DEFAULT_MAX_OPEN, pool=None, kinds=None):
+    """
+    Blocking wrapper around load_matches_async.
+    """
+    return asyncio.run(load_matches_async(list(matches), max_open, pool, kinds))
+
+# =====================================================
+# 3. PREFETCHING ITERATOR
+# =====================================================
+def iter_loaded(matches, max_open=DEFAULT_MAX_OPEN, batch_size=32):
+    """
+    Yield a LoadedMatch per match, in order. The next batch is
+    loaded in the background while the caller processes the current
+    one, so parsing and pipeline work overlap with file I/O, and
+    only two batches of raw tables are held in memory.
+    """
+    matches = list(matches)
+    batches = [matches[i:i + batch_size] for i in range(0, len(matches), batch_size)]
+    if not batches:
+        return
+
+    with _thread_pool() as pool, ThreadPoolExecutor(max_workers=1) as background:
+        pending = background.submit(load_matches, batches[0], max_open, pool)
+        for i in range(len(batches)):
+            current = pending.result()
+            if i + 1 < len(batches):
+                pending = background.submit(load_matches, batches[i + 1], max_open, pool)
+            yield from current
@@ -0,0 +1,74 @@
+# manifest.py
+# Content-hash manifest used to skip stages whose inputs are unchanged
+#
+# One JSON file per match, stored next to the clean outputs:
+#   {"pipeline_version": ..., "stages": {name: {"key": ..., "outputs": [...]}}}
+# A stage key hashes the pipeline version (with the identity alias
+# table), the stage name and the content of every raw file the stage
+# reads.
+
+import hashlib
+import json
+import os
+
+MANIFEST_NAME = ".pipeline_manifest.json"
+
+# =====================================================
+# 1. HASHING
+# =====================================================
+def file_digest(path, chunk_size=1 << 20):
+    """
+    SHA-256 of a file's content.
+    """
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def stage_key(version, stage_name, input_digests):
+    """
+    Combine pipeline version, stage name and (file name, digest)
+    pairs into one key. File names are relative so moving the
+    season folder does not invalidate every match.
+    """
+    digest = hashlib.sha256()
+    digest.update(f"{version}\0{stage_name}".encode())
+    for name, file_hash in sorted(input_digests):
+        digest.update(f"\0{name}\0{file_hash}".encode())
+    return digest.hexdigest()
+
+# =====================================================
+# 2. MANIFEST FILE
+# =====================================================
+def manifest_path(clean_dir, name=MANIFEST_NAME):
+    return os.path.join(clean_dir, name)
+
+
+def load_manifest(clean_dir, name=MANIFEST_NAME):
+    """
+    Previous manifest for a match, or an empty one if missing or
+    unreadable (which simply forces a full rebuild).
+    """
+    try:
+        with open(manifest_path(clean_dir, name), encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return {"pipeline_version": None, "stages": {}}
+
+    manifest.setdefault("stages", {})
+    return manifest
+
+
+def save_manifest(clean_dir, manifest, name=MANIFEST_NAME):
+    """
+    Write the manifest atomically so an interrupted run never
+    leaves a half-written file that marks stages as fresh.
+    """
+    os.makedirs(clean_dir, exist_ok=True)
+    path = manifest_path(clean_dir, name)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, path)
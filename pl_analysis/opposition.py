@@ -0,0 +1,378 @@
+# opposition.py
+# Pre-match opposition profiles from rolling home / away form
+#
+# A FormIndex keeps, for every (team, venue), the metric vectors of
+# its last ``window`` matches at that venue plus their running sums.
+# Recording a newly cleaned match touches two windows (the home
+# team's at home, the away team's away) and costs O(window); a
+# pre-match profile for any
+# fixture is then a dictionary lookup and one division per metric.
+# The index is saved as JSON in the season folder. Every update
+# (`clean`, `opposition`) still stats each match's form inputs to
+# spot changes, but only reads the outputs of matches whose files
+# changed, so an unchanged season costs a few stat calls per match.
+#
+# Output rows are assigned to a side by their team_id (outputs
+# written before ids existed: by their squad / team name resolved
+# against the match's teams), so FBref's spelling variants count.
+
+import bisect
+import json
+import os
+
+from .bins import DISTANCE_ZONES, TIME_WINDOWS
+from .discovery import SIDES, discover_matches, team_key
+from .identity import IdentityResolver, load_identities
+
+FORM_INDEX_NAME = ".form_index.json"
+
+DEFAULT_WINDOW = 5
+
+# Bump when the metric layout or side assignment changes so saved
+# indexes are rebuilt.
+FORM_VERSION = "3"
+
+# Outputs a match record is built from.
+FORM_INPUTS = [
+    "shot_summary", "distance_based_analysis", "shot_timing_analysis",
+    "goal_events", "team_summary", "goalkeeper_summary",
+]
+
+# Per-match metrics (summed over the window, reported per match).
+FORM_METRICS = (
+    ["shots", "shots_against", "xg", "xg_against", "goals", "goals_against",
+     "passes_attempted", "saves"]
+    + [f"distance {label}" for label in DISTANCE_ZONES.labels]
+    + [f"minute {label}" for label in TIME_WINDOWS.labels]
+)
+
+# =====================================================
+# 1. MATCH RECORDS
+# =====================================================
+def _row_sides(table, col, match, identities):
+    """
+    Side of every row of an output (None for rows of neither team):
+    by ``team_id``, or by the ``col`` name where there is no id.
+    """
+    candidates = [match.teams[side] for side in SIDES]
+    by_id = {identities.team_id(team): side for side, team in zip(SIDES, candidates)}
+    names = table[col].tolist()
+    ids = table["team_id"].tolist() if "team_id" in table.columns else [None] * len(table)
+    sides = []
+    for team_id, name in zip(ids, names):
+        if team_id is None or team_id != team_id:
+            team_id = identities.team_id(name, candidates) if isinstance(name, str) else None
+        sides.append(by_id.get(team_id))
+    return sides
+
+
+def match_records(match, store, identities=None):
+    """
+    {side: {metric: value}} for one cleaned match, from its stored
+    outputs (missing optional outputs leave their metrics at 0).
+    """
+    identities = identities or IdentityResolver()
+
+    def read(name):
+        return store.read(match, name) if store.exists(match, name) else None
+
+    values = {side: dict.fromkeys(FORM_METRICS, 0.0) for side in SIDES}
+
+    summary = read("shot_summary")
+    for side, row in zip(_row_sides(summary, "squad", match, identities),
+                         summary.itertuples(index=False)):
+        if side is not None:
+            values[side]["shots"] += float(row.shots)
+            values[side]["xg"] += float(row.total_xg)
+
+    for name, spec, prefix in [
+        ("distance_based_analysis", DISTANCE_ZONES, "distance"),
+        ("shot_timing_analysis", TIME_WINDOWS, "minute"),
+    ]:
+        table = read(name)
+        if table is None:
+            continue
+        rows = table[[spec.name, "shots"]].itertuples(index=False)
+        for side, (label, shots) in zip(_row_sides(table, "squad", match, identities), rows):
+            if side is not None:
+                values[side][f"{prefix} {label}"] += float(shots)
+
+    goals = read("goal_events")
+    if goals is not None:
+        for side in _row_sides(goals, "squad", match, identities):
+            if side is not None:
+                values[side]["goals"] += 1
+
+    for name, column, metric in [
+        ("team_summary", "passes_attempted", "passes_attempted"),
+        ("goalkeeper_summary", "saves", "saves"),
+    ]:
+        table = read(name)
+        if table is None:
+            continue
+        for side, value in zip(_row_sides(table, "team", match, identities), table[column]):
+            if side is not None and value == value:
+                values[side][metric] = float(value)
+
+    home, away = values["home"], values["away"]
+    for mine, theirs in [(home, away), (away, home)]:
+        mine["shots_against"] = theirs["shots"]
+        mine["xg_against"] = theirs["xg"]
+        mine["goals_against"] = theirs["goals"]
+    return values
+
+# =====================================================
+# 2. ROLLING FORM INDEX
+# =====================================================
+class TeamForm:
+    """
+    Last-N matches of one team at one venue: ``records`` is a list
+    of (match name, metric list) in match order, ``sums`` their
+    element-wise sum.
+    """
+
+    def __init__(self, records=None):
+        self.records = [(name, list(vector)) for name, vector in records or []]
+        self.sums = [sum(column) for column in zip(*(v for _, v in self.records))] \
+            or [0.0] * len(FORM_METRICS)
+
+    def add(self, name, vector, window):
+        """
+        Insert or replace one match, keeping the latest ``window``.
+        """
+        names = [n for n, _ in self.records]
+        if name in names:
+            i = names.index(name)
+            old = self.records[i][1]
+            self.sums = [s - o + v for s, o, v in zip(self.sums, old, vector)]
+            self.records[i] = (name, vector)
+            return
+        if len(self.records) >= window and name < names[0]:
+            return  # older than every match in a full window
+
+        self.records.insert(bisect.bisect(names, name), (name, vector))
+        self.sums = [s + v for s, v in zip(self.sums, vector)]
+        while len(self.records) > window:
+            _, dropped = self.records.pop(0)
+            self.sums = [s - d for s, d in zip(self.sums, dropped)]
+
+    def averages(self):
+        n = len(self.records)
+        return {
+            metric: (total / n if n else None)
+            for metric, total in zip(FORM_METRICS, self.sums)
+        }
+
+
+class FormIndex:
+    """
+    Rolling last-``window`` home / away form for every team.
+
+    - ``record(match, store)`` adds a cleaned match
+    - ``form(team, venue)`` is the team's per-match averages
+    - ``profile(home, away)`` is the pre-match opposition profile
+
+    Windows are keyed by the canonical team (``identities``), so
+    every spelling of a club adds to, and finds, the same window.
+    """
+
+    def __init__(self, window=DEFAULT_WINDOW, identities=None):
+        self.window = window
+        self.identities = identities or IdentityResolver()
+        self.teams = {}
+        self.names = {}
+        self.signatures = {}
+
+    def __repr__(self):
+        return f"FormIndex(window={self.window}, {len(self.signatures)} matches)"
+
+    def _key(self, team):
+        return team_key(self.identities.team(team))
+
+    def record(self, match, store, signature=None):
+        values = match_records(match, store, self.identities)
+        for side in SIDES:
+            key = (self._key(match.teams[side]), side)
+            self.names[key[0]] = self.identities.team(match.teams[side])
+            form = self.teams.setdefault(key, TeamForm())
+            form.add(match.name, [values[side][m] for m in FORM_METRICS], self.window)
+        self.signatures[match.name] = signature
+
+    def form(self, team, venue):
+        if venue not in SIDES:
+            raise ValueError(f"venue must be 'home' or 'away', not {venue!r}")
+        form = self.teams.get((self._key(team), venue))
+        if form is None:
+            known = sorted(self.names.values())
+            raise KeyError(f"no {venue} matches recorded for {team!r} (known: {', '.join(known)})")
+        averages = form.averages()
+        averages["matches"] = [name for name, _ in form.records]
+        return averages
+
+    def profile(self, home_team, away_team):
+        """
+        {"home": home team's home form, "away": away team's away form}
+        with derived xG per shot and distance / timing shares.
+        """
+        profile = {}
+        for side, team in [("home", home_team), ("away", away_team)]:
+            form = self.form(team, side)
+            form["team"] = self.names[self._key(team)]
+            form["xg_per_shot"] = form["xg"] / form["shots"] if form["shots"] else None
+            for prefix, spec in [("distance", DISTANCE_ZONES), ("minute", TIME_WINDOWS)]:
+                labels = [f"{prefix} {label}" for label in spec.labels]
+                total = sum(form[label] for label in labels)
+                for label in labels:
+                    form[f"{label} share"] = 100 * form[label] / total if total else None
+            profile[side] = form
+        return profile
+
+    # -----------------------------
+    # Persistence
+    # -----------------------------
+    def to_json(self):
+        return {
+            "version": FORM_VERSION,
+            "window": self.window,
+            "metrics": FORM_METRICS,
+            "aliases": self.identities.digest(),
+            "names": self.names,
+            "signatures": self.signatures,
+            "teams": [
+                {"team": team, "venue": venue, "records": form.records}
+                for (team, venue), form in sorted(self.teams.items())
+            ],
+        }
+
+    @classmethod
+    def from_json(cls, data, identities=None):
+        index = cls(data["window"], identities)
+        index.names = dict(data["names"])
+        index.signatures = dict(data["signatures"])
+        for entry in data["teams"]:
+            index.teams[(entry["team"], entry["venue"])] = TeamForm(
+                [(name, vector) for name, vector in entry["records"]]
+            )
+        return index
+
+
+def form_index_path(root):
+    return os.path.join(root, FORM_INDEX_NAME)
+
+
+def load_form_index(root, window=DEFAULT_WINDOW, identities=None):
+    """
+    The saved index of a season folder, or an empty one if it is
+    missing, unreadable, or was built with another window / layout
+    / alias table.
+    """
+    identities = identities or load_identities(root)
+    try:
+        with open(form_index_path(root), encoding="utf-8") as f:
+            data = json.load(f)
+        if (data.get("version") == FORM_VERSION and data.get("window") == window
+                and data.get("metrics") == FORM_METRICS
+                and data.get("aliases") == identities.digest()):
+            return FormIndex.from_json(data, identities)
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    return FormIndex(window, identities)
+
+
+def save_form_index(root, index):
+    path = form_index_path(root)
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(index.to_json(), f)
+    os.replace(tmp, path)
+
+# =====================================================
+# 3. INCREMENTAL UPDATES
+# =====================================================
+def _signature(match, store):
+    signature = []
+    for name in FORM_INPUTS:
+        try:
+            stat = os.stat(store.path(match, name))
+        except OSError:
+            continue
+        signature.append([name, stat.st_mtime_ns, stat.st_size])
+    return signature
+
+
+def update_form_index(root, matches=None, store=None, window=DEFAULT_WINDOW,
+                      identities=None):
+    """
+    Record every cleaned match whose outputs changed since the index
+    was saved, save it, and return (index, number of matches recorded).
+    Matches are recorded in folder-name order (names carry no date).
+    ``identities`` defaults to the season folder's alias table.
+    """
+    from .storage import CsvStore
+
+    store = store or CsvStore()
+    identities = identities or load_identities(root)
+    matches = discover_matches(root) if matches is None else matches
+    index = load_form_index(root, window, identities)
+
+    recorded = 0
+    for match in sorted(matches, key=lambda m: m.name):
+        if not store.exists(match, "shot_summary"):
+            continue
+        signature = _signature(match, store)
+        if index.signatures.get(match.name) == signature:
+            continue
+        index.record(match, store, signature)
+        recorded += 1
+
+    if recorded:
+        save_form_index(root, index)
+    return index, recorded
+
+# =====================================================
+# 4. REPORT
+# =====================================================
+def _cell(value, digits=2):
+    if value is None:
+        return "–"
+    return f"{value:.{digits}f}"
+
+
+def profile_markdown(profile):
+    """
+    Pre-match profile as Markdown tables (home team's home form vs
+    away team's away form).
+    """
+    home, away = profile["home"], profile["away"]
+    lines = [
+        f"# {home['team']} vs {away['team']} — Pre-Match Opposition Profile",
+        "",
+        f"- {home['team']}: last {len(home['matches'])} home matches",
+        f"- {away['team']}: last {len(away['matches'])} away matches",
+        "",
+        "## Recent Form (per match)",
+        "",
+        f"| Metric | {home['team']} (home) | {away['team']} (away) |",
+        "|---|---|---|",
+    ]
+    for metric in ["shots", "shots_against", "xg", "xg_against", "xg_per_shot",
+                   "goals", "goals_against", "passes_attempted", "saves"]:
+        digits = 0 if metric == "passes_attempted" else 2
+        label = metric.replace("_", " ")
+        lines.append(f"| {label} | {_cell(home[metric], digits)} | {_cell(away[metric], digits)} |")
+
+    for title, prefix, spec in [
+        ("Shot Distance Profile (% of shots)", "distance", DISTANCE_ZONES),
+        ("Shot Timing Profile (% of shots)", "minute", TIME_WINDOWS),
+    ]:
+        lines += ["", f"## {title}", "",
+                  f"| {spec.name.replace('_', ' ').title()} | {home['team']} | {away['team']} |",
+                  "|---|---|---|"]
+        for label in spec.labels:
+            key = f"{prefix} {label} share"
+            lines.append(f"| {label} | {_cell(home[key], 1)} | {_cell(away[key], 1)} |")
+
+    lines += ["", "## Matches Used", ""]
+    lines += [f"- {home['team']} (home): {', '.join(home['matches'])}"]
+    lines += [f"- {away['team']} (away): {', '.join(away['matches'])}"]
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,191 @@
+# passing.py
+# Passing profile: pass length, live / dead balls, crosses, through
+# balls and switches per team, from the passing styles and pass
+# types tables
+#
+# FBref column names differ between exports (flattened group
+# headers such as "short_att" vs older "short_passes_att"), so each
+# profile field is resolved to a column once per table schema and
+# cached. All tables of one or many matches are then stacked into one
+# float array of profile fields and summed per (match, team) with
+# bincount.
+
+import re
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+from .discovery import SIDES
+from .fbref import TOTAL_ROW_PATTERN
+
+# =====================================================
+# 1. COLUMN RESOLUTION
+# =====================================================
+# Profile field -> (table kind, exact names, substrings that must all
+# appear when no exact name exists). "%" columns never match.
+PROFILE_FIELDS = {
+    "passes_att": ("passing", ["total_att"], ["total", "att"]),
+    "passes_cmp": ("passing", ["total_cmp"], ["total", "cmp"]),
+    "short_att": ("passing", ["short_att"], ["short", "att"]),
+    "short_cmp": ("passing", ["short_cmp"], ["short", "cmp"]),
+    "medium_att": ("passing", ["medium_att"], ["medium", "att"]),
+    "medium_cmp": ("passing", ["medium_cmp"], ["medium", "cmp"]),
+    "long_att": ("passing", ["long_att"], ["long", "att"]),
+    "long_cmp": ("passing", ["long_cmp"], ["long", "cmp"]),
+    "live": ("pass_types", ["live"], ["live"]),
+    "dead": ("pass_types", ["dead"], ["dead"]),
+    "crosses": ("pass_types", ["crs"], ["cross"]),
+    "through_balls": ("pass_types", ["tb"], ["through"]),
+    "switches": ("pass_types", ["sw"], ["switch"]),
+}
+
+FIELD_INDEX = {field: i for i, field in enumerate(PROFILE_FIELDS)}
+
+PROFILE_KINDS = ["passing", "pass_types"]
+
+LENGTHS = ["short", "medium", "long"]
+
+
+@lru_cache(maxsize=None)
+def resolve_columns(kind, columns):
+    """
+    {profile field: column} for one table schema (``columns`` is a
+    tuple of column names). Fields without a matching column are
+    left out.
+    """
+    candidates = [c for c in columns if "%" not in c]
+    mapping = {}
+    for field, (field_kind, exact, parts) in PROFILE_FIELDS.items():
+        if field_kind != kind:
+            continue
+        found = next((c for c in exact if c in candidates), None)
+        if found is None:
+            found = next(
+                (c for c in candidates if all(part in c for part in parts)), None
+            )
+        if found is not None:
+            mapping[field] = found
+    return mapping
+
+# =====================================================
+# 2. PROFILES
+# =====================================================
+TOTAL_ROW = re.compile(TOTAL_ROW_PATTERN, re.IGNORECASE)
+
+
+def _profile_block(kind, df):
+    """
+    (rows x PROFILE_FIELDS float array, footer-row mask) for one
+    table; fields the table does not have stay NaN.
+    """
+    block = np.full((len(df), len(PROFILE_FIELDS)), np.nan)
+    for field, column in resolve_columns(kind, tuple(df.columns)).items():
+        values = pd.to_numeric(df[column], errors="coerce")
+        block[:, FIELD_INDEX[field]] = values.to_numpy(dtype="float64", na_value=np.nan)
+
+    if "player" in df.columns:
+        is_total = np.array([
+            isinstance(name, str) and TOTAL_ROW.match(name) is not None
+            for name in df["player"].to_numpy(dtype=object)
+        ], dtype=bool)
+    else:
+        is_total = np.zeros(len(df), dtype=bool)
+    return block, is_total
+
+
+def passing_profiles(tables):
+    """
+    One profile row per (match, team) from an iterable of
+    (match, team, kind, raw table) with kind "passing" or
+    "pass_types".
+
+    Each table contributes its FBref footer ("14 Players") when it
+    has one and the sum of its player rows otherwise, as
+    fbref.squad_totals does. Fields missing from a table are NA.
+    """
+    keys, blocks, totals, table_ids = [], [], [], []
+    positions = {}
+    for table_id, (match, team, kind, df) in enumerate(tables):
+        block, is_total = _profile_block(kind, df)
+        keys.append(positions.setdefault((match, team), len(positions)))
+        blocks.append(block)
+        totals.append(is_total)
+        table_ids.append(np.full(len(block), table_id))
+
+    columns = ["match", "team"] + list(PROFILE_FIELDS)
+    if not positions:
+        return pd.DataFrame(columns=columns)
+
+    values = np.concatenate(blocks)
+    is_total = np.concatenate(totals)
+    table_id = np.concatenate(table_ids)
+
+    # Keep the footer rows of tables that have one, else the players.
+    has_total = np.bincount(table_id, weights=is_total, minlength=len(keys)) > 0
+    keep = is_total == has_total[table_id]
+    group = np.asarray(keys)[table_id[keep]]
+    values = values[keep]
+
+    n_groups = len(positions)
+    present = ~np.isnan(values)
+    sums = np.empty((n_groups, len(PROFILE_FIELDS)))
+    for j in range(len(PROFILE_FIELDS)):
+        sums[:, j] = np.bincount(
+            group, weights=np.where(present[:, j], values[:, j], 0), minlength=n_groups
+        )
+        counts = np.bincount(group, weights=present[:, j], minlength=n_groups)
+        sums[counts == 0, j] = np.nan
+
+    profile = pd.DataFrame(list(positions), columns=["match", "team"])
+    for field, j in FIELD_INDEX.items():
+        profile[field] = pd.Series(sums[:, j]).round().astype("Int64")
+    return add_shares(profile)
+
+
+def add_shares(profile):
+    """
+    Completion rate per pass length and the share of attempted
+    passes that were short / medium / long.
+    """
+    length_att = profile[[f"{length}_att" for length in LENGTHS]].sum(axis=1, min_count=1)
+    for length in LENGTHS:
+        att = profile[f"{length}_att"]
+        profile[f"{length}_cmp_pct"] = (100 * profile[f"{length}_cmp"] / att.where(att > 0)).round(1)
+        profile[f"{length}_share"] = (100 * att / length_att.where(length_att > 0)).round(1)
+    return profile
+
+
+def match_tables(match, table):
+    """
+    (match, team, kind, raw table) for every passing table of one
+    match; ``table(kind, side)`` returns a raw table (e.g.
+    MatchContext.table).
+    """
+    return [
+        (match.name, match.teams[side], kind, table(kind, side))
+        for kind in PROFILE_KINDS
+        for side in SIDES
+        if side in match.raw_files.get(kind, {})
+    ]
+
+
+def load_passing_profiles(matches, max_open=None):
+    """
+    Passing profiles for many matches: raw tables are read with the
+    concurrent loader and profiled in one pass. Tables that failed
+    to load are left out.
+    """
+    from .loader import DEFAULT_MAX_OPEN, load_matches
+
+    tables = []
+    loaded_matches = load_matches(
+        matches, max_open or DEFAULT_MAX_OPEN, kinds=PROFILE_KINDS
+    )
+    for loaded in loaded_matches:
+        tables.extend(
+            (loaded.match.name, loaded.match.teams[side], kind, df)
+            for (kind, side), df in loaded.tables.items()
+            if kind in PROFILE_KINDS
+        )
+    return passing_profiles(tables)
@@ -0,0 +1,313 @@
+# pipeline.py
+# Declared multi-match pipeline: stages, per-match context, runners
+
+import os
+
+from . import stages
+from .checks import OutputTables, check_tables, raise_for_errors
+from .discovery import discover_matches, load_match
+from .errors import MissingRawTableError, PipelineError
+from .fbref import load_fbref
+from .identity import IdentityResolver
+from .manifest import file_digest, load_manifest, save_manifest, stage_key
+from .storage import CsvStore
+
+# Bump whenever a stage's logic changes so every match is rebuilt.
+PIPELINE_VERSION = "12"
+
+# =====================================================
+# 1. STAGE DECLARATION
+# =====================================================
+class Stage:
+    """
+    A named pipeline step.
+
+    - ``func(ctx)`` returns {output_name: DataFrame}
+    - ``requires`` lists the raw table kinds the stage reads
+    - ``uses`` lists earlier stages whose outputs it reads
+    - ``optional`` stages are skipped when a required table is
+      missing instead of failing the match
+    """
+
+    def __init__(self, name, func, requires=(), uses=(), optional=False):
+        self.name = name
+        self.func = func
+        self.requires = tuple(requires)
+        self.uses = tuple(uses)
+        self.optional = optional
+
+    def __repr__(self):
+        return f"Stage({self.name!r})"
+
+
+DEFAULT_STAGES = [
+    Stage("players_clean", stages.players_clean, requires=["team_stats"]),
+    Stage("team_summary", stages.team_summary, requires=["team_stats"]),
+    Stage("shots_clean", stages.shots_clean, requires=["shots"]),
+    Stage("shot_summary", stages.shot_summary, requires=["shots"], uses=["shots_clean"]),
+    Stage("shot_outcomes", stages.shot_outcomes, requires=["shots"], uses=["shots_clean"]),
+    Stage("distance_analysis", stages.distance_analysis, requires=["shots"], uses=["shots_clean"]),
+    Stage("shot_timing", stages.shot_timing, requires=["shots"], uses=["shots_clean"]),
+    Stage("goal_events", stages.goal_events, requires=["shots"], uses=["shots_clean"]),
+    Stage("xg_timeline", stages.xg_timeline, requires=["shots"], uses=["shots_clean"]),
+    Stage("passing_styles", stages.passing_styles, requires=["passing"], optional=True),
+    Stage("pass_types", stages.pass_types, requires=["pass_types"], optional=True),
+    Stage(
+        "passing_profile", stages.passing_profile,
+        requires=["passing", "pass_types"], optional=True
+    ),
+    Stage("goalkeeper_summary", stages.goalkeeper_summary, requires=["goalkeeper"], optional=True),
+]
+
+# =====================================================
+# 2. PER-MATCH CONTEXT
+# =====================================================
+class MatchContext:
+    """
+    State shared by the stages of one match run.
+    Raw tables are loaded lazily and cached, so a stage list that
+    never touches e.g. goalkeeper stats never reads those files.
+    ``loaded`` (a loader.LoadedMatch) supplies tables read ahead of
+    time by the concurrent loader.
+    ``teams`` holds the match's canonical team names (identity.py).
+    """
+
+    def __init__(self, match, store=None, loaded=None, identities=None):
+        self.match = match
+        self.store = store or CsvStore()
+        self.identities = identities or IdentityResolver()
+        self.teams = {side: self.identities.team(name) for side, name in match.teams.items()}
+        self.outputs = {}
+        self.skipped = []
+        self.fresh = []
+        self.warnings = []
+        self._tables = dict(loaded.tables) if loaded else {}
+        self._errors = dict(loaded.errors) if loaded else {}
+
+    def table(self, kind, side=None):
+        key = (kind, side)
+        if key in self._errors:
+            raise self._errors[key]
+        if key not in self._tables:
+            if kind == "shots":
+                path = self.match.shot_file
+            else:
+                path = self.match.raw_files.get(kind, {}).get(side)
+            if path is None:
+                raise MissingRawTableError(
+                    f"{self.match.name}: no raw '{kind}' table"
+                    + (f" for {side} team" if side else "")
+                )
+            self._tables[key] = load_fbref(path, kind)
+        return self._tables[key]
+
+    def output(self, name):
+        """
+        An output frame from this run, or from the store if its
+        stage was up to date and therefore not recomputed.
+        """
+        if name in self.outputs:
+            return self.outputs[name]
+        return self.store.read(self.match, name)
+
+# =====================================================
+# 3. PIPELINE
+# =====================================================
+def _stage_inputs(match, stage):
+    if "shots" in stage.requires and match.shot_file:
+        yield match.shot_file
+    for kind in stage.requires:
+        for path in match.raw_files.get(kind, {}).values():
+            yield path
+
+
+class Pipeline:
+    """
+    Ordered list of stages run against one match at a time.
+
+    With ``incremental=True`` a per-match manifest records a
+    content hash of each stage's raw inputs; stages whose hash is
+    unchanged and whose outputs still exist are not recomputed.
+
+    ``stores`` decides where outputs go (see storage.py); the
+    default is the per-match CSV layout.
+
+    With ``checks=True`` the data-quality invariants (checks.py)
+    run on a match's outputs before they are written: an error
+    raises DataQualityError and nothing is written, warnings are
+    kept in ``ctx.warnings``.
+
+    ``identities`` (an identity.IdentityResolver) canonicalizes the
+    team and player names in every output and adds ``team_id`` /
+    ``player_id`` columns next to them, so outputs join on ids.
+    """
+
+    def __init__(self, stages=None, incremental=True, version=PIPELINE_VERSION,
+                 stores=None, checks=True, identities=None):
+        self.stages = list(DEFAULT_STAGES if stages is None else stages)
+        self.incremental = incremental
+        self.version = version
+        self.stores = list(stores) if stores else [CsvStore()]
+        self.checks = checks
+        self.identities = identities or IdentityResolver()
+
+    def stage_names(self):
+        return [stage.name for stage in self.stages]
+
+    def stage_keys(self, match, digests=None):
+        """
+        {stage name: input hash} for every runnable stage.
+        Each raw file is hashed once per call; ``digests`` may
+        supply hashes already computed (e.g. by the loader). The
+        alias table is part of every key, since every output is
+        annotated with it.
+        """
+        digests = dict(digests or {})
+        version = f"{self.version}\0{self.identities.digest()}"
+        keys = {}
+        for stage in self.stages:
+            inputs = []
+            for path in _stage_inputs(match, stage):
+                if path not in digests:
+                    digests[path] = file_digest(path)
+                inputs.append((os.path.basename(path), digests[path]))
+            keys[stage.name] = stage_key(version, stage.name, inputs)
+        return keys
+
+    def _dirty_stages(self, match, keys, manifest):
+        """
+        Stages to recompute: changed inputs, missing outputs, or a
+        dependency on a stage that is itself being recomputed.
+        A recomputed stage also pulls in the stages it ``uses`` so
+        their outputs are available in memory.
+        """
+        previous = manifest.get("stages", {})
+        dirty = set()
+        for stage in self.stages:
+            entry = previous.get(stage.name)
+            if (
+                entry is None
+                or entry.get("key") != keys[stage.name]
+                or not all(
+                    store.exists(match, name)
+                    for store in self.stores
+                    for name in entry.get("outputs", [])
+                )
+                or any(name in dirty for name in stage.uses)
+            ):
+                dirty.add(stage.name)
+
+        by_name = {stage.name: stage for stage in self.stages}
+        pending = list(dirty)
+        while pending:
+            for name in by_name[pending.pop()].uses:
+                if name not in dirty:
+                    dirty.add(name)
+                    pending.append(name)
+        return dirty
+
+    def run(self, match, write=True, force=False, loaded=None):
+        """
+        Run the stages for one match and return its context.
+        ``force`` ignores the manifest and recomputes everything.
+        ``loaded`` is the match's pre-read raw tables (loader.py).
+        """
+        ctx = MatchContext(match, self.stores[0], loaded, self.identities)
+        incremental = self.incremental and write and not force
+
+        digests = loaded.digests if loaded else None
+        keys = self.stage_keys(match, digests) if self.incremental and write else {}
+        manifest = load_manifest(match.clean_dir) if incremental else {"stages": {}}
+        dirty = (
+            self._dirty_stages(match, keys, manifest)
+            if incremental else set(self.stage_names())
+        )
+
+        stage_outputs = {}
+        for stage in self.stages:
+            missing = [kind for kind in stage.requires if not match.has_table(kind)]
+            if missing:
+                if stage.optional:
+                    ctx.skipped.append(stage.name)
+                    continue
+                raise MissingRawTableError(
+                    f"{match.name}: stage '{stage.name}' needs {', '.join(missing)}"
+                )
+            if stage.name not in dirty:
+                ctx.fresh.append(stage.name)
+                continue
+            candidates = list(ctx.teams.values())
+            produced = {
+                name: self.identities.annotate(frame, candidates)
+                for name, frame in stage.func(ctx).items()
+            }
+            stage_outputs[stage.name] = sorted(produced)
+            ctx.outputs.update(produced)
+
+        if self.checks and stage_outputs:
+            violations = check_tables(OutputTables.from_context(ctx))
+            raise_for_errors(violations, match.name)
+            ctx.warnings = [
+                f"{row.invariant}: {row.detail}" for row in violations.itertuples()
+            ]
+
+        if write:
+            for store in self.stores:
+                store.write(match, ctx.outputs)
+
+        if keys:
+            stages_state = {
+                name: entry for name, entry in manifest.get("stages", {}).items()
+                if name in ctx.fresh
+            }
+            for name, outputs in stage_outputs.items():
+                stages_state[name] = {"key": keys[name], "outputs": outputs}
+            save_manifest(match.clean_dir, {
+                "pipeline_version": self.version,
+                "stages": stages_state,
+            })
+
+        return ctx
+
+# =====================================================
+# 4. ENTRY POINTS
+# =====================================================
+def _as_match(match):
+    if isinstance(match, str):
+        found = load_match(match)
+        if found is None:
+            raise PipelineError(f"{match}: no raw data folder found")
+        return found
+    return match
+
+
+def run_match(match, pipeline=None, write=True, force=False):
+    """
+    Run the pipeline for a single match folder (path or Match).
+    """
+    pipeline = pipeline or Pipeline()
+    return pipeline.run(_as_match(match), write=write, force=force)
+
+
+def run_season(root, pipeline=None, write=True, force=False, max_open=None):
+    """
+    Run the pipeline for every match folder under ``root`` in
+    this process and return {match name: MatchContext}.
+    With ``max_open`` raw files are read concurrently ahead of the
+    pipeline (at most ``max_open`` open at once, see loader.py).
+    """
+    pipeline = pipeline or Pipeline()
+    matches = discover_matches(root)
+
+    if max_open:
+        from .loader import iter_loaded
+
+        return {
+            loaded.match.name: pipeline.run(loaded.match, write, force, loaded)
+            for loaded in iter_loaded(matches, max_open)
+        }
+
+    return {
+        match.name: pipeline.run(match, write=write, force=force)
+        for match in matches
+    }
@@ -0,0 +1,104 @@
+# players.py
+# Season player aggregation from the per-match *_players_clean tables
+#
+# All player tables of the season are concatenated into one frame
+# (match, team, player, ...) and aggregated with a single groupby.
+# FBref indents substitutes ("   Beto", with non-breaking spaces); the indentation is turned
+# into a ``substitute`` flag and stripped from the name so a player's
+# starts and sub appearances count as the same person.
+
+import numpy as np
+import pandas as pd
+
+from .fbref import TOTAL_ROW_PATTERN
+from .identity import IdentityResolver
+
+# Whitespace including FBref's non-breaking spaces (pandas' Arrow-backed
+# strings use RE2, where \s is ASCII only).
+SPACE = r"[\s\xa0]"
+
+# Counting metrics summed over the season and expressed per 90.
+PLAYER_METRICS = [
+    "gls", "ast", "sh", "sot", "xg", "npxg", "xag",
+    "sca", "gca", "cmp", "prgp", "prgc", "carries",
+]
+
+# =====================================================
+# 1. PLAYER IDENTITY
+# =====================================================
+def normalise_player_names(names):
+    """
+    Strip FBref indentation and repeated spaces and use one Unicode
+    form, so "   Estêvão  Willian" and "Estêvão Willian" match.
+    """
+    names = names.astype("string")
+    return (
+        names.str.normalize("NFC")
+        .str.replace(rf"{SPACE}+", " ", regex=True)
+        .str.strip()
+    )
+
+
+def prepare_players(players):
+    """
+    Concatenated player tables -> one clean row per appearance:
+    ``substitute`` flag, normalised ``player`` and ``team``,
+    numeric ``min`` and metric columns. Squad total rows
+    ("14 Players") left in older clean files are dropped.
+    """
+    raw_names = players["player"].astype("string")
+    is_total = raw_names.str.match(TOTAL_ROW_PATTERN, case=False).fillna(False)
+    players = players[~is_total.to_numpy(dtype=bool)].copy()
+    raw_names = raw_names[~is_total.to_numpy(dtype=bool)]
+    players["substitute"] = raw_names.str.match(rf"^{SPACE}").fillna(False).astype(bool)
+    players["player"] = normalise_player_names(raw_names)
+    players["team"] = players["team"].astype("string").str.strip()
+
+    for col in ["min"] + PLAYER_METRICS:
+        if col in players.columns:
+            players[col] = pd.to_numeric(players[col], errors="coerce")
+        else:
+            players[col] = np.nan
+
+    return players.dropna(subset=["player"])
+
+# =====================================================
+# 2. SEASON AGGREGATION
+# =====================================================
+def season_players(players, min_minutes=0, identities=None):
+    """
+    One row per (player, team) for the season: appearances,
+    starts, minutes, totals of PLAYER_METRICS and their per-90
+    rates (<metric>_p90; NaN when no minutes were played).
+
+    ``players`` is the concatenation of *_players_clean tables with
+    ``match`` and ``team`` columns (see Season.players()). Names are
+    grouped by their canonical ``identities`` name, so every spelling
+    of a team or player is one row, with ``team_id`` / ``player_id``.
+    """
+    identities = identities or IdentityResolver()
+    if "player" not in players.columns:
+        players = players.assign(player=pd.Series(dtype="string"), team=pd.Series(dtype="string"))
+    players = prepare_players(players)
+    players["player"] = pd.Series(identities.players(players["player"]), index=players.index,
+                                  dtype="string")
+    players["team"] = pd.Series(identities.teams(players["team"]), index=players.index,
+                                dtype="string")
+
+    grouped = players.groupby(["player", "team"], sort=True)
+    season = grouped[["min"] + PLAYER_METRICS].sum(min_count=1)
+    season.insert(0, "matches", grouped["match"].nunique())
+    season.insert(1, "starts", grouped["substitute"].size() - grouped["substitute"].sum())
+
+    minutes = season["min"].to_numpy(dtype="float64", na_value=np.nan)
+    played = minutes > 0
+    for col in PLAYER_METRICS:
+        values = season[col].to_numpy(dtype="float64", na_value=np.nan)
+        per_90 = np.full(len(season), np.nan)
+        per_90[played] = values[played] / minutes[played] * 90
+        season[f"{col}_p90"] = per_90
+
+    season = identities.annotate(season.reset_index())
+    if min_minutes:
+        season = season[season["min"] >= min_minutes].reset_index(drop=True)
+    return season
@@ -0,0 +1,335 @@
+# powerbi.py
+# Season-wide star schema for Power BI
+#
+# Instead of one dashboard per match reading a dozen small CSVs, the
+# whole season is exported as a handful of tables:
+#
+#   dim_match, dim_team, dim_player       (one row per entity)
+#   fact_shot                             (one row per shot)
+#   fact_player_match                     (one row per player per match)
+#   fact_team_match                       (one row per team per match)
+#
+# Every table joins on integer surrogate keys (match_key, team_key,
+# player_key, 1-based, assigned in name order). Facts carry keys and
+# measures only, so the model stays small and refreshes quickly.
+# Relationships: each fact's *_key -> the dimension of that name;
+# opponent_key and dim_match's home / away keys also -> dim_team.
+# Rows are keyed through the outputs' team_id / player_id columns
+# (identity.py), never by matching names; dim_team and dim_player
+# keep those ids so other seasons' exports can be related to them.
+
+import os
+
+import numpy as np
+import pandas as pd
+
+from .bins import TIME_WINDOWS
+from .checks import check_season, raise_for_errors
+from .discovery import SIDES, discover_clean_matches
+from .identity import IdentityResolver, load_identities
+from .players import PLAYER_METRICS, prepare_players
+from .season import Season
+from .storage import _require_pyarrow
+
+STAR_TABLES = [
+    "dim_match", "dim_team", "dim_player",
+    "fact_shot", "fact_player_match", "fact_team_match",
+]
+
+SHOT_MEASURES = ["minute", "minute_added", "xg", "psxg", "distance"]
+
+TEAM_MEASURES = [
+    "passes_completed", "passes_attempted", "fouls", "corners",
+]
+
+# Column types of fact_shot, so a season without shots still exports
+# the full (empty) table.
+FACT_SHOT_DTYPES = dict(
+    [("shot_key", "int32"), ("match_key", "Int32"), ("team_key", "Int32"), ("player_key", "Int32")]
+    + [(col, "float64") for col in SHOT_MEASURES]
+    + [("outcome", "object"), ("is_goal", "int8"), ("body_part", "object"),
+       ("distance_zone", "object"), ("time_window", "object")]
+)
+
+FACT_PLAYER_COLUMNS = ["match_key", "team_key", "player_key", "substitute", "min"] + PLAYER_METRICS
+
+# =====================================================
+# 1. DIMENSIONS
+# =====================================================
+def _team_ids(frame, col, identities, teams):
+    """
+    Team id of every row: the output's ``team_id`` column, with the
+    names resolved per match for rows from outputs written before it
+    existed (the column is missing, or empty in a mixed season).
+    """
+    ids = frame["team_id"].astype("Int64") if "team_id" in frame.columns else None
+    if ids is not None and not ids.isna().any():
+        return ids
+    resolved = pd.Series(
+        identities.team_ids(identities.teams_by_match(frame, col, teams)), index=frame.index
+    )
+    return resolved if ids is None else ids.fillna(resolved)
+
+
+def _player_ids(frame, identities):
+    ids = frame["player_id"].astype("Int64") if "player_id" in frame.columns else None
+    if ids is not None and not ids.isna().any():
+        return ids
+    resolved = pd.Series(identities.player_ids(frame["player"]), index=frame.index)
+    return resolved if ids is None else ids.fillna(resolved)
+
+
+def build_dimensions(matches, player_names, identities):
+    """
+    (dim_match, dim_team, dim_player) plus the key lookups used by
+    the facts: {match name: key}, {team id: key}, {(player id, team
+    id): key}. ``player_names`` maps (player id, team id) to a name
+    seen in the outputs.
+
+    Player ids come from the name alone, so players are keyed per
+    club: namesakes at different clubs stay apart, and a player who
+    changes club during the season has one row per club.
+    """
+    team_names = {}
+    for match in matches:
+        for side in SIDES:
+            if side in match.teams:
+                name = identities.team(match.teams[side])
+                team_names.setdefault(identities.team_id(name), name)
+    team_keys = {tid: i for i, tid in enumerate(sorted(team_names, key=team_names.get), start=1)}
+    dim_team = pd.DataFrame({
+        "team_key": list(team_keys.values()),
+        "team": [team_names[tid] for tid in team_keys],
+        "team_id": list(team_keys),
+    })
+
+    def team_key_of(match, side):
+        return team_keys.get(identities.team_id(match.teams[side])) if side in match.teams else None
+
+    ordered = sorted(matches, key=lambda m: m.name)
+    match_keys = {match.name: i for i, match in enumerate(ordered, start=1)}
+    dim_match = pd.DataFrame({
+        "match_key": [match_keys[m.name] for m in ordered],
+        "match": [m.name for m in ordered],
+        "home_team_key": [team_key_of(m, "home") for m in ordered],
+        "away_team_key": [team_key_of(m, "away") for m in ordered],
+    })
+    for col in ["home_team_key", "away_team_key"]:
+        dim_match[col] = dim_match[col].astype("Int32")
+
+    names = {key: identities.player(name) for key, name in player_names.items()}
+    player_keys = {
+        key: i for i, key in enumerate(
+            sorted(names, key=lambda k: (names[k], team_names.get(k[1], ""), k)), start=1
+        )
+    }
+    dim_player = pd.DataFrame({
+        "player_key": list(player_keys.values()),
+        "player": [names[key] for key in player_keys],
+        "team_key": pd.array([team_keys.get(tid) for _, tid in player_keys], dtype="Int32"),
+        "player_id": [pid for pid, _ in player_keys],
+    })
+    return (dim_match, dim_team, dim_player), (match_keys, team_keys, player_keys)
+
+# =====================================================
+# 2. FACTS
+# =====================================================
+def _opponents(frame, team_keys_by_match):
+    """
+    Opponent team key of each (match_key, team_key) row.
+    """
+    return np.array([
+        next((t for t in team_keys_by_match.get(m, ()) if t != team), -1)
+        for m, team in zip(frame["match_key"], frame["team_key"])
+    ], dtype="int32")
+
+
+def _key_column(values, lookup):
+    return pd.array([lookup.get(v) for v in values], dtype="Int32")
+
+
+def build_fact_shot(shots, team_ids, player_ids, match_keys, team_keys, player_keys):
+    if shots.empty or "outcome" not in shots.columns:
+        return pd.DataFrame({col: pd.Series(dtype=dtype) for col, dtype in FACT_SHOT_DTYPES.items()})
+    fact = pd.DataFrame({
+        "shot_key": np.arange(1, len(shots) + 1, dtype="int32"),
+        "match_key": _key_column(shots["match"].astype(str), match_keys),
+        "team_key": _key_column(team_ids, team_keys),
+        "player_key": _key_column(zip(player_ids, team_ids), player_keys),
+    })
+    for col in SHOT_MEASURES:
+        if col in shots.columns:
+            fact[col] = shots[col].to_numpy()
+    fact["outcome"] = shots["outcome"].astype(str).to_numpy()
+    fact["is_goal"] = (fact["outcome"] == "Goal").astype("int8")
+    if "body_part" in shots.columns:
+        fact["body_part"] = shots["body_part"].to_numpy()
+    fact["distance_zone"] = shots["distance_zone"].astype(str).to_numpy()
+    fact["time_window"] = TIME_WINDOWS.categorical(shots["minute"]).astype(str)
+    return fact
+
+
+def build_fact_player_match(players, team_ids, player_ids, match_keys, team_keys, player_keys):
+    fact = pd.DataFrame({
+        "match_key": _key_column(players["match"].astype(str), match_keys),
+        "team_key": _key_column(team_ids, team_keys),
+        "player_key": _key_column(zip(player_ids, team_ids), player_keys),
+        "substitute": players["substitute"].astype("int8").to_numpy(),
+    })
+    for col in ["min"] + PLAYER_METRICS:
+        fact[col] = players[col].to_numpy()
+    return fact
+
+
+def build_fact_team_match(fact_shot, dim_match, teams, keepers, profile,
+                          match_keys, team_keys, identities, match_teams):
+    """
+    Per team and match: venue, opponent, shots / xG / goals for and
+    against (from fact_shot), team totals, saves and the passing
+    profile where those outputs exist.
+    """
+    rows = pd.concat([
+        dim_match[["match_key", "home_team_key"]]
+        .rename(columns={"home_team_key": "team_key"}).assign(venue="home"),
+        dim_match[["match_key", "away_team_key"]]
+        .rename(columns={"away_team_key": "team_key"}).assign(venue="away"),
+    ], ignore_index=True).dropna(subset=["team_key"])
+    rows["team_key"] = rows["team_key"].astype("int32")
+    rows = rows.sort_values(["match_key", "venue"], ascending=[True, False]).reset_index(drop=True)
+
+    by_match = rows.groupby("match_key")["team_key"].agg(tuple).to_dict()
+    rows["opponent_key"] = _opponents(rows, by_match)
+
+    shots = (
+        fact_shot.groupby(["match_key", "team_key"], observed=True)
+        .agg(shots=("shot_key", "size"), xg=("xg", "sum"), goals=("is_goal", "sum"))
+        .reset_index()
+        .astype({"match_key": "int32", "team_key": "int32"})
+    )
+    rows = rows.merge(shots, on=["match_key", "team_key"], how="left")
+    against = shots.rename(columns={
+        "team_key": "opponent_key", "shots": "shots_against",
+        "xg": "xg_against", "goals": "goals_against",
+    })
+    rows = rows.merge(against, on=["match_key", "opponent_key"], how="left")
+    for col in ["shots", "goals", "shots_against", "goals_against"]:
+        rows[col] = rows[col].fillna(0).astype("int32")
+    for col in ["xg", "xg_against"]:
+        rows[col] = rows[col].fillna(0.0)
+
+    for table, columns in [
+        (teams, TEAM_MEASURES),
+        (keepers, ["saves"]),
+        (profile, [c for c in profile.columns if c not in ("match", "team", "team_id")]),
+    ]:
+        if table.empty or "team" not in table.columns:
+            continue
+        keyed = pd.DataFrame({
+            "match_key": _key_column(table["match"].astype(str), match_keys),
+            "team_key": _key_column(_team_ids(table, "team", identities, match_teams), team_keys),
+        })
+        for col in columns:
+            keyed[col] = table[col].to_numpy()
+        keyed = keyed.dropna(subset=["match_key", "team_key"]).astype(
+            {"match_key": "int32", "team_key": "int32"}
+        )
+        rows = rows.merge(keyed, on=["match_key", "team_key"], how="left")
+
+    opponent = rows["opponent_key"].astype("Int32")
+    rows["opponent_key"] = opponent.mask(opponent < 0)
+    return rows
+
+# =====================================================
+# 3. EXPORT
+# =====================================================
+def build_star_schema(season, identities=None):
+    """
+    {table name: DataFrame} for every table in STAR_TABLES, from a
+    Season's clean outputs. Facts join the dimensions through the
+    outputs' team / player ids (identity.py).
+    """
+    identities = identities or IdentityResolver()
+    match_teams = {m.name: m.teams for m in season.matches}
+
+    shots = season.shots()
+    players = season.players()
+    players = prepare_players(players) if "player" in players.columns else players
+
+    ids = {}
+    if len(shots):
+        shot_teams = _team_ids(shots, "team", identities, match_teams)
+        shot_players = _player_ids(shots, identities)
+        ids["shots"] = (shot_teams, shot_players)
+    if "player" in players.columns:
+        ids["players"] = (
+            _team_ids(players, "team", identities, match_teams), _player_ids(players, identities)
+        )
+
+    player_names = {}
+    for name, frame in [("shots", shots), ("players", players)]:
+        if name in ids:
+            pairs = pd.DataFrame({
+                "player_id": ids[name][1], "team_id": ids[name][0],
+                "player": frame["player"].astype(str).to_numpy(),
+            })
+            for pid, tid, player in pairs.dropna().drop_duplicates(["player_id", "team_id"]) \
+                    .itertuples(index=False):
+                player_names.setdefault((int(pid), int(tid)), player)
+
+    (dim_match, dim_team, dim_player), (match_keys, team_keys, player_keys) = \
+        build_dimensions(season.matches, player_names, identities)
+
+    shot_teams, shot_players = ids.get("shots", ([], []))
+    fact_shot = build_fact_shot(shots, shot_teams, shot_players, match_keys, team_keys, player_keys)
+    if "players" in ids:
+        fact_player_match = build_fact_player_match(
+            players, *ids["players"], match_keys, team_keys, player_keys
+        )
+    else:
+        fact_player_match = pd.DataFrame(columns=FACT_PLAYER_COLUMNS)
+    fact_team_match = build_fact_team_match(
+        fact_shot, dim_match, season.teams(), season.goalkeepers(),
+        season.passing_profile(), match_keys, team_keys, identities, match_teams
+    )
+
+    return {
+        "dim_match": dim_match,
+        "dim_team": dim_team,
+        "dim_player": dim_player,
+        "fact_shot": fact_shot,
+        "fact_player_match": fact_player_match,
+        "fact_team_match": fact_team_match,
+    }
+
+
+def export_star_schema(root=None, out_dir=None, output_format="csv", matches=None, store=None,
+                       checks=True, identities=None):
+    """
+    Build the star schema for a season and write one file per table
+    (.csv, or .parquet with pyarrow). Returns {table: row count}.
+    With ``checks`` the season's outputs are checked first and a
+    DataQualityError stops the export before anything is written.
+    ``identities`` defaults to the season folder's alias table;
+    ``matches`` to every match folder with clean outputs, as for
+    `check`.
+    """
+    if output_format not in ("csv", "parquet"):
+        raise ValueError(f"unknown export format {output_format!r} (csv or parquet)")
+    if output_format == "parquet":
+        _require_pyarrow()
+
+    identities = identities or load_identities(root)
+    if matches is None:
+        matches = discover_clean_matches(root)
+    season = Season(matches=matches, store=store, identities=identities)
+    if checks:
+        raise_for_errors(check_season(season, identities=identities), "the season outputs")
+    tables = build_star_schema(season, identities)
+    os.makedirs(out_dir, exist_ok=True)
+    for name, table in tables.items():
+        path = os.path.join(out_dir, f"{name}.{output_format}")
+        if output_format == "parquet":
+            table.to_parquet(path, index=False)
+        else:
+            table.to_csv(path, index=False)
+    return {name: len(table) for name, table in tables.items()}
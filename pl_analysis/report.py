@@ -0,0 +1,365 @@
+# report.py
+# Templated post-match reports (Markdown + PDF) from the clean outputs
+#
+# Every match's report is rendered from the same template: the
+# numeric sections (team totals, shot outcomes, distance and timing
+# profiles, goals, goalkeeper saves) are filled in from the stored
+# outputs, and the PDF adds the match charts. A report manifest in
+# the report folder records a hash of the input files' bytes and the
+# template; reports whose inputs are unchanged are not rebuilt (and
+# their inputs are not even parsed). Hand-written Report.md files
+# are never touched: generated reports go to match_report.md / .pdf.
+
+import hashlib
+import os
+import string
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from .bins import DISTANCE_ZONES, TIME_WINDOWS
+from .manifest import load_manifest, save_manifest
+from .runner import default_workers
+from .storage import CsvStore
+
+REPORT_MANIFEST_NAME = ".report_manifest.json"
+
+REPORT_NAME = "match_report"
+
+# Bump when the report layout or the context below changes.
+REPORTS_VERSION = "1"
+
+# Outputs the Markdown report reads; the optional ones become
+# "not available" when a stage was skipped for lack of raw data.
+REPORT_INPUTS = [
+    "shot_summary", "shot_outcome_breakdown", "distance_based_analysis",
+    "shot_timing_analysis", "goal_events",
+]
+OPTIONAL_INPUTS = ["team_summary", "goalkeeper_summary"]
+
+# Charts appended to the PDF (names in charts.CHART_TEMPLATES).
+PDF_CHARTS = [
+    "shots_by_team", "xg_by_team", "xg_timeline", "shot_map", "shot_distance_distribution",
+]
+
+DEFAULT_TEMPLATE = """\
+# $home vs $away — Match Performance Summary
+
+## Match Information
+- Competition: Premier League
+- Fixture: $home vs $away
+- Analysis Type: Post-Match Performance Summary
+- Data Source: FBref
+
+---
+
+## Team-Level Performance Overview
+
+$headline
+
+$team_table
+
+---
+
+### Shot Outcome Breakdown
+
+$outcome_table
+
+---
+
+## Shot Distance Profile
+
+$distance_table
+
+---
+
+## Shot Timing
+
+$timing_table
+
+---
+
+## Goals
+
+$goals
+
+---
+
+## Goalkeeper Context
+
+$keeper_table
+
+---
+
+## Methodology Notes
+
+- Generated from the cleaned FBref outputs in `$clean_dir`
+- xG per shot = total xG / shots; stoppage-time shots count in the 31-45+ / 76-90+ windows
+"""
+
+# =====================================================
+# 1. REPORT CONTEXT
+# =====================================================
+def markdown_table(frame, digits=2):
+    """
+    Minimal GitHub Markdown table (no tabulate dependency).
+    """
+    def cell(value):
+        if isinstance(value, float):
+            return "–" if value != value else f"{value:.{digits}f}"
+        return "–" if value is None else str(value).strip()
+
+    header = "| " + " | ".join(str(c).replace("_", " ") for c in frame.columns) + " |"
+    rule = "|" + "---|" * len(frame.columns)
+    rows = ["| " + " | ".join(cell(v) for v in row) + " |"
+            for row in frame.astype(object).itertuples(index=False)]
+    return "\n".join([header, rule] + rows)
+
+
+def _wide(frame, spec):
+    """
+    Long (squad, bin label, shots) table -> one column per squad,
+    bins in their natural order.
+    """
+    wide = frame.pivot_table(
+        index=spec.name, columns="squad", values="shots", aggfunc="sum", observed=False
+    ).reindex([str(label) for label in spec.labels], fill_value=0)
+    wide.columns = [str(c).strip() for c in wide.columns]
+    return wide.fillna(0).astype("int64").reset_index()
+
+
+def _headline(summary):
+    if len(summary) < 2:
+        return "Only one team recorded shots in this match."
+    rows = summary.sort_values("shots", ascending=False).reset_index(drop=True)
+    top, other = rows.iloc[0], rows.iloc[1]
+    by_xg = summary.sort_values("total_xg", ascending=False).reset_index(drop=True)
+
+    shots = (
+        f"{top['squad']} and {other['squad']} took {top['shots']} shots each"
+        if top["shots"] == other["shots"]
+        else f"{top['squad']} out-shot {other['squad']} {top['shots']}–{other['shots']}"
+    )
+    return (
+        f"{shots}; {by_xg.iloc[0]['squad']} created the higher expected goals "
+        f"({by_xg.iloc[0]['total_xg']:.2f} xG to {by_xg.iloc[1]['total_xg']:.2f})."
+    )
+
+
+def report_context(match, frames):
+    """
+    Template placeholders ($home, $team_table, ...) for one match.
+    """
+    summary = frames["shot_summary"].assign(
+        squad=lambda f: f["squad"].astype(str).str.strip()
+    )
+
+    teams = summary[["squad", "shots", "total_xg", "xg_per_shot"]]
+    team_summary = frames.get("team_summary")
+    if team_summary is not None:
+        extra = team_summary.drop(columns=["shots"], errors="ignore").assign(
+            team=lambda f: f["team"].astype(str).str.strip()
+        )
+        if "team_id" in summary.columns and "team_id" in extra.columns:
+            teams = teams.assign(team_id=summary["team_id"]).merge(
+                extra.drop(columns="team"), how="left", on="team_id"
+            )
+        else:
+            teams = teams.merge(
+                extra, how="left", left_on="squad", right_on="team"
+            ).drop(columns="team")
+        teams = teams.drop(columns="team_id", errors="ignore")
+
+    goals = frames["goal_events"]
+    goal_lines = [
+        f"- {row.minute}' {str(row.player).strip()} ({str(row.squad).strip()}, xG {row.xg:.2f})"
+        for row in goals.itertuples(index=False)
+    ]
+    keepers = frames.get("goalkeeper_summary")
+
+    return {
+        "home": match.teams.get("home", ""),
+        "away": match.teams.get("away", ""),
+        "match": match.name,
+        "clean_dir": os.path.basename(match.clean_dir),
+        "headline": _headline(summary),
+        "team_table": markdown_table(teams.rename(columns={"squad": "team"})),
+        "outcome_table": markdown_table(
+            frames["shot_outcome_breakdown"]
+            .pivot_table(index="outcome", columns="squad", values="count",
+                         aggfunc="sum", fill_value=0, observed=False)
+            .rename(columns=lambda c: str(c).strip())
+            .reset_index()
+        ),
+        "distance_table": markdown_table(_wide(frames["distance_based_analysis"], DISTANCE_ZONES)),
+        "timing_table": markdown_table(_wide(frames["shot_timing_analysis"], TIME_WINDOWS)),
+        "goals": "\n".join(goal_lines) or "No goals.",
+        "keeper_table": (
+            markdown_table(keepers.drop(columns="team_id", errors="ignore")) if keepers is not None
+            else "Goalkeeper data not available."
+        ),
+    }
+
+
+def render_markdown(match, frames, template=DEFAULT_TEMPLATE):
+    return string.Template(template).safe_substitute(report_context(match, frames))
+
+# =====================================================
+# 2. PDF
+# =====================================================
+def render_pdf(match, frames, markdown, path):
+    """
+    PDF report: the Markdown text on the first page(s), then one
+    page per chart in PDF_CHARTS whose inputs are available.
+    """
+    from .charts import CHART_TEMPLATES, _require_matplotlib
+
+    _require_matplotlib()
+    from matplotlib.backends.backend_pdf import PdfPages
+    from matplotlib.figure import Figure
+
+    lines = markdown.splitlines()
+    per_page = 70
+    with PdfPages(path) as pdf:
+        for start in range(0, len(lines), per_page):
+            page = Figure(figsize=(8.27, 11.69))
+            page.text(
+                0.06, 0.96, "\n".join(lines[start:start + per_page]),
+                family="monospace", fontsize=7, va="top"
+            )
+            pdf.savefig(page)
+
+        for name in PDF_CHARTS:
+            template = CHART_TEMPLATES[name]
+            if all(frames.get(i) is not None for i in template.inputs):
+                pdf.savefig(template.draw_figure(frames))
+
+# =====================================================
+# 3. CACHED RENDERING
+# =====================================================
+def report_dir(match):
+    """
+    <match>/Report (created on first render).
+    """
+    return os.path.join(match.base_dir, "Report")
+
+
+def _input_key(match, store, names, template, pdf):
+    digest = hashlib.sha256()
+    digest.update(f"{REPORTS_VERSION}\0{pdf}\0{template}".encode())
+    for name in names:
+        path = store.path(match, name)
+        digest.update(f"\0{name}\0".encode())
+        if os.path.exists(path):
+            with open(path, "rb") as f:
+                digest.update(f.read())
+    return digest.hexdigest()
+
+
+def render_match_report(match, store=None, template=DEFAULT_TEMPLATE, pdf=True, force=False):
+    """
+    Write match_report.md (and .pdf) into the match's Report folder.
+    Returns "rendered" or "fresh" (inputs and template unchanged).
+    """
+    from .charts import CHART_TEMPLATES
+
+    store = store or CsvStore()
+    names = REPORT_INPUTS + OPTIONAL_INPUTS
+    if pdf:
+        names += [i for c in PDF_CHARTS for i in CHART_TEMPLATES[c].inputs if i not in names]
+
+    folder = report_dir(match)
+    os.makedirs(folder, exist_ok=True)
+    md_path = os.path.join(folder, f"{REPORT_NAME}.md")
+    pdf_path = os.path.join(folder, f"{REPORT_NAME}.pdf")
+
+    key = _input_key(match, store, names, template, pdf)
+    manifest = load_manifest(folder, REPORT_MANIFEST_NAME)
+    outputs_exist = os.path.exists(md_path) and (not pdf or os.path.exists(pdf_path))
+    if not force and manifest.get("key") == key and outputs_exist:
+        return "fresh"
+
+    frames = {name: store.read(match, name) for name in REPORT_INPUTS}
+    for name in names:
+        if name not in frames and store.exists(match, name):
+            frames[name] = store.read(match, name)
+
+    markdown = render_markdown(match, frames, template)
+    with open(md_path, "w", encoding="utf-8") as f:
+        f.write(markdown)
+    if pdf:
+        render_pdf(match, frames, markdown, pdf_path)
+
+    save_manifest(folder, {"key": key}, REPORT_MANIFEST_NAME)
+    return "rendered"
+
+
+class ReportResult:
+    """
+    Outcome of rendering one match's report.
+    """
+
+    def __init__(self, name, ok, seconds, status=None, error=None):
+        self.name = name
+        self.ok = ok
+        self.seconds = seconds
+        self.status = status
+        self.error = error
+
+    def __repr__(self):
+        state = self.status if self.ok else "failed"
+        return f"ReportResult({self.name!r}, {state}, {self.seconds:.2f}s)"
+
+
+def render_one_report(match, store=None, template=DEFAULT_TEMPLATE, pdf=True, force=False):
+    """
+    Render one report and capture success / failure and timing.
+    Module level so it can be pickled into worker processes.
+    """
+    start = time.perf_counter()
+    try:
+        status = render_match_report(match, store, template, pdf, force)
+    except Exception:
+        return ReportResult(
+            match.name, False, time.perf_counter() - start, error=traceback.format_exc()
+        )
+    return ReportResult(match.name, True, time.perf_counter() - start, status)
+
+
+def render_season_reports(matches, workers=None, store=None, template=DEFAULT_TEMPLATE,
+                          pdf=True, force=False):
+    """
+    Render every match's report across a process pool. Returns one
+    ReportResult per match, in input order.
+    """
+    matches = list(matches)
+    workers = min(workers or default_workers(), max(len(matches), 1))
+    args = (store, template, pdf, force)
+
+    if workers == 1:
+        return [render_one_report(match, *args) for match in matches]
+
+    results = {}
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {pool.submit(render_one_report, match, *args): match for match in matches}
+        for future in as_completed(futures):
+            match = futures[future]
+            try:
+                results[match.base_dir] = future.result()
+            except Exception:
+                results[match.base_dir] = ReportResult(
+                    match.name, False, 0.0, error=traceback.format_exc()
+                )
+
+    return [results[match.base_dir] for match in matches]
+
+
+def summarise_reports(results):
+    lines = []
+    for result in results:
+        if result.ok:
+            lines.append(f"REPORT  {result.name} ({result.status}, {result.seconds:.2f}s)")
+        else:
+            last = result.error.strip().splitlines()[-1] if result.error else "unknown error"
+            lines.append(f"FAILED  {result.name} report: {last}")
+    return "\n".join(lines)
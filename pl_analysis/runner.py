@@ -0,0 +1,157 @@
+# runner.py
+# Process-pool season runner: one match folder per task
+#
+# Each worker loads, cleans and writes one match. A failing match
+# (missing shot table, malformed CSV, ...) is reported in its
+# MatchResult instead of aborting the rest of the season.
+
+import os
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from .discovery import discover_matches
+from .pipeline import Pipeline
+
+# =====================================================
+# 1. PER-MATCH RESULT
+# =====================================================
+class MatchResult:
+    """
+    Outcome of one match run.
+
+    - ``ok`` is False when the pipeline raised
+    - ``outputs`` lists the written output names
+    - ``fresh`` lists stages skipped because inputs were unchanged
+    - ``warnings`` lists data-quality warnings (checks.py)
+    - ``aliases`` maps unknown team spellings matched to a close
+      match team to that team (identity.py), for `clean` to report
+    - ``error`` holds the formatted traceback on failure
+    """
+
+    def __init__(self, name, base_dir, ok, seconds, outputs=(), skipped=(),
+                 fresh=(), warnings=(), aliases=None, error=None):
+        self.name = name
+        self.base_dir = base_dir
+        self.ok = ok
+        self.seconds = seconds
+        self.outputs = list(outputs)
+        self.skipped = list(skipped)
+        self.fresh = list(fresh)
+        self.warnings = list(warnings)
+        self.aliases = dict(aliases or {})
+        self.error = error
+
+    def __repr__(self):
+        status = "ok" if self.ok else "failed"
+        return f"MatchResult({self.name!r}, {status}, {self.seconds:.2f}s)"
+
+
+def run_one(match, pipeline=None, force=False, loaded=None):
+    """
+    Run one match and capture success / failure and timing.
+    Module level so it can be pickled into worker processes.
+    """
+    pipeline = pipeline or Pipeline()
+    start = time.perf_counter()
+
+    try:
+        ctx = pipeline.run(match, force=force, loaded=loaded)
+    except Exception:
+        return MatchResult(
+            match.name, match.base_dir, False,
+            time.perf_counter() - start,
+            error=traceback.format_exc()
+        )
+
+    return MatchResult(
+        match.name, match.base_dir, True,
+        time.perf_counter() - start,
+        outputs=sorted(ctx.outputs),
+        skipped=ctx.skipped,
+        fresh=ctx.fresh,
+        warnings=ctx.warnings,
+        aliases=ctx.identities.learned
+    )
+
+# =====================================================
+# 2. SEASON RUNNER
+# =====================================================
+def default_workers():
+    return os.cpu_count() or 1
+
+
+def run_matches_parallel(matches, workers=None, pipeline=None, force=False,
+                         max_open=None):
+    """
+    Fan matches out across a ProcessPoolExecutor and return one
+    MatchResult per match, in input order.
+    ``workers=1`` runs inline, which is easier to debug; with
+    ``max_open`` the inline run reads raw files concurrently ahead
+    of the pipeline (see loader.py). ``max_open`` needs
+    ``workers=1``: worker processes each read their own match.
+    """
+    if max_open and workers != 1:
+        raise ValueError("max_open only applies to inline runs (workers=1)")
+    matches = list(matches)
+    workers = min(workers or default_workers(), max(len(matches), 1))
+
+    if workers == 1 and max_open:
+        from .loader import iter_loaded
+
+        return [
+            run_one(loaded.match, pipeline, force, loaded)
+            for loaded in iter_loaded(matches, max_open)
+        ]
+
+    if workers == 1:
+        return [run_one(match, pipeline, force) for match in matches]
+
+    results = {}
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = {
+            pool.submit(run_one, match, pipeline, force): match
+            for match in matches
+        }
+        for future in as_completed(futures):
+            match = futures[future]
+            try:
+                results[match.base_dir] = future.result()
+            except Exception:
+                # Worker died (e.g. killed, unpicklable result).
+                results[match.base_dir] = MatchResult(
+                    match.name, match.base_dir, False, 0.0,
+                    error=traceback.format_exc()
+                )
+
+    return [results[match.base_dir] for match in matches]
+
+
+def run_season_parallel(root, workers=None, pipeline=None, force=False):
+    """
+    Discover every match folder under ``root`` and process them
+    concurrently.
+    """
+    return run_matches_parallel(discover_matches(root), workers, pipeline, force)
+
+
+def summarise_results(results):
+    """
+    One line per match plus a totals line, for console output.
+    """
+    lines = []
+    for result in results:
+        if result.ok and not result.outputs:
+            lines.append(f"FRESH   {result.name} (up to date, {result.seconds:.2f}s)")
+        elif result.ok:
+            warned = f", {len(result.warnings)} warnings" if result.warnings else ""
+            lines.append(
+                f"OK      {result.name} ({len(result.outputs)} outputs{warned}, {result.seconds:.2f}s)"
+            )
+        else:
+            last = result.error.strip().splitlines()[-1] if result.error else "unknown error"
+            lines.append(f"FAILED  {result.name} ({result.seconds:.2f}s): {last}")
+
+    failed = sum(1 for r in results if not r.ok)
+    lines.append(f"{len(results) - failed} succeeded, {failed} failed")
+    return "\n".join(lines)
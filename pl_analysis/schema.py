@@ -0,0 +1,131 @@
+# schema.py
+# Declared column dtypes for each FBref table kind
+#
+# Column names are the ones produced by read_fbref_table (lower
+# case, repeated names prefixed with their header group). Counts
+# use nullable small integers because FBref exports contain blank
+# separator rows; rates and xG use float32; repeated labels use
+# category. Columns not listed keep the dtype the parser inferred.
+
+import pandas as pd
+
+COUNT = "Int16"
+WIDE_COUNT = "Int32"
+RATE = "float32"
+LABEL = "category"
+
+# =====================================================
+# 1. TABLE SCHEMAS
+# =====================================================
+SCHEMAS = {
+    # Player summary table ("<Team> team stats.csv")
+    "team_stats": {
+        "#": COUNT, "nation": LABEL, "pos": LABEL, "min": COUNT,
+        "gls": COUNT, "ast": COUNT, "pk": COUNT, "pkatt": COUNT,
+        "sh": COUNT, "sot": COUNT, "crdy": COUNT, "crdr": COUNT,
+        "touches": COUNT, "tkl": COUNT, "int": COUNT, "blocks": COUNT,
+        "xg": RATE, "npxg": RATE, "xag": RATE,
+        "sca": COUNT, "gca": COUNT,
+        "cmp": COUNT, "passes_att": COUNT, "cmp%": RATE, "prgp": COUNT,
+        "carries": COUNT, "prgc": COUNT,
+        "take_ons_att": COUNT, "succ": COUNT,
+        "fls": COUNT, "ck": COUNT,
+    },
+    # "Shot table <home> vs <away>.csv" (minute handled by parse_minutes)
+    "shots": {
+        "squad": LABEL, "xg": RATE, "psxg": RATE, "outcome": LABEL,
+        "distance": RATE, "body_part": LABEL, "notes": LABEL,
+        "sca1_event": LABEL, "sca2_event": LABEL,
+    },
+    # Passing table ("passing styles" / "passing types")
+    "passing": {
+        "#": COUNT, "nation": LABEL, "pos": LABEL,
+        "total_cmp": COUNT, "total_att": COUNT, "total_cmp%": RATE,
+        "totdist": WIDE_COUNT, "prgdist": WIDE_COUNT,
+        "short_cmp": COUNT, "short_att": COUNT, "short_cmp%": RATE,
+        "medium_cmp": COUNT, "medium_att": COUNT, "medium_cmp%": RATE,
+        "long_cmp": COUNT, "long_att": COUNT, "long_cmp%": RATE,
+        "ast": COUNT, "xag": RATE, "xa": RATE, "kp": COUNT,
+        "1/3": COUNT, "ppa": COUNT, "crspa": COUNT, "prgp": COUNT,
+    },
+    # Pass types table
+    "pass_types": {
+        "#": COUNT, "nation": LABEL, "pos": LABEL, "min": COUNT,
+        "att": COUNT, "live": COUNT, "dead": COUNT, "fk": COUNT,
+        "tb": COUNT, "sw": COUNT, "crs": COUNT, "ti": COUNT, "ck": COUNT,
+        "in": COUNT, "out": COUNT, "str": COUNT,
+        "cmp": COUNT, "off": COUNT, "blocks": COUNT,
+    },
+    # Goalkeeper table
+    "goalkeeper": {
+        "nation": LABEL, "min": COUNT,
+        "sota": COUNT, "ga": COUNT, "saves": COUNT, "save%": RATE,
+        "psxg": RATE,
+        "launched_cmp": COUNT, "launched_att": COUNT, "launched_cmp%": RATE,
+        "passes_att": COUNT, "thr": COUNT, "passes_launch%": RATE,
+        "passes_avglen": RATE,
+        "goal_kicks_att": COUNT, "goal_kicks_launch%": RATE,
+        "goal_kicks_avglen": RATE,
+        "opp": COUNT, "stp": COUNT, "stp%": RATE,
+        "#opa": COUNT, "avgdist": RATE,
+    },
+}
+
+# =====================================================
+# 2. SPECIAL PARSERS
+# =====================================================
+def parse_minutes(df):
+    """
+    FBref writes stoppage time as "45+2" / "90+3". Split it into
+    ``minute`` (45 / 90, so the shot stays in the 31-45+ / 76-90+
+    window) and ``minute_added`` (2 / 3) instead of dropping the row.
+    """
+    if "minute" not in df.columns:
+        return df
+
+    if pd.api.types.is_numeric_dtype(df["minute"]):
+        # No stoppage-time shots: already parsed as numbers (float
+        # when a blank separator row is present).
+        df["minute"] = df["minute"].astype(COUNT)
+        added = pd.Series(0, index=df.index, dtype=COUNT)
+    else:
+        parts = df["minute"].astype("string").str.extract(r"^\s*(\d+)(?:\+(\d+))?\s*$")
+        df["minute"] = pd.to_numeric(parts[0], errors="coerce").astype(COUNT)
+        added = pd.to_numeric(parts[1], errors="coerce").fillna(0).astype(COUNT)
+
+    df.insert(df.columns.get_loc("minute") + 1, "minute_added", added.where(df["minute"].notna()))
+    return df
+
+
+PARSERS = {
+    "shots": [parse_minutes],
+}
+
+# =====================================================
+# 3. APPLYING A SCHEMA
+# =====================================================
+def read_dtypes(kind, columns):
+    """
+    dtype mapping for read_csv, restricted to columns present.
+    """
+    schema = SCHEMAS.get(kind, {})
+    return {col: schema[col] for col in columns if col in schema}
+
+
+def coerce_to_schema(df, kind):
+    """
+    Fallback for files whose numeric columns contain stray text
+    (e.g. a repeated header row): coerce, then cast.
+    """
+    for col, dtype in read_dtypes(kind, df.columns).items():
+        if dtype == LABEL:
+            df[col] = df[col].astype(LABEL)
+        else:
+            df[col] = pd.to_numeric(df[col], errors="coerce").astype(dtype)
+    return df
+
+
+def apply_parsers(df, kind):
+    for parser in PARSERS.get(kind, []):
+        df = parser(df)
+    return df
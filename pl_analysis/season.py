@@ -0,0 +1,291 @@
+# season.py
+# In-memory query layer over the cleaned outputs of a season
+#
+#   season = Season("Tactical- analysis")
+#   season.team_xg()            # shots / xG per team, all matches
+#   season.shots_by_zone()      # team x distance-zone counts
+#   season.shots(team="Chelsea")
+#
+# Output tables are read once and concatenated across matches;
+# aggregates are memoized in a bounded LRU cache. Every cache key
+# includes a signature (modification time and size) of the output
+# files it was built from, so re-running the pipeline for a match
+# invalidates exactly the entries that depended on it; per-match
+# frames are kept too, so only the changed match is read again.
+#
+# Aggregates group teams and players by their canonical identity
+# (identity.py), so a club spelled differently in two matches' files
+# is still one team.
+
+import os
+from collections import OrderedDict
+
+import pandas as pd
+
+from .bins import DISTANCE_ZONES, TIME_WINDOWS, count_matrix
+from .discovery import SIDES, discover_matches, team_slug
+from .identity import IdentityResolver, integer_ids
+from .players import season_players
+from .shot_table import consolidate_shots
+from .storage import CsvStore
+
+DEFAULT_CACHE_SIZE = 64
+
+# Per-team player tables are written as <team slug>_players_clean.
+PLAYERS = "players_clean"
+
+# =====================================================
+# 1. LRU CACHE
+# =====================================================
+class LRUCache:
+    """
+    Small least-recently-used cache with hit / miss counters.
+    """
+
+    def __init__(self, maxsize=DEFAULT_CACHE_SIZE):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._items = OrderedDict()
+
+    def __len__(self):
+        return len(self._items)
+
+    def get(self, key, compute):
+        if key in self._items:
+            self._items.move_to_end(key)
+            self.hits += 1
+            return self._items[key]
+
+        self.misses += 1
+        value = compute()
+        self._items[key] = value
+        if len(self._items) > self.maxsize:
+            self._items.popitem(last=False)
+        return value
+
+    def clear(self):
+        self._items.clear()
+
+# =====================================================
+# 2. SEASON
+# =====================================================
+class Season:
+    """
+    Cleaned match data for every match folder under ``root``.
+
+    Tables (``shots``, ``players``, ``teams``, ``passing``,
+    ``pass_types``, ``passing_profile``, ``goalkeepers``) carry a ``match`` column
+    (``players`` also a ``team`` column);
+    aggregates are cached and rebuilt only when an output file they
+    read has changed. Matches without an output are left out.
+    ``identities`` (default: built-in aliases only) gives the
+    canonical team and player names aggregates group by.
+    """
+
+    def __init__(self, root=None, matches=None, store=None, cache_size=DEFAULT_CACHE_SIZE,
+                 identities=None):
+        if matches is None:
+            matches = discover_matches(root)
+        self.matches = list(matches)
+        self.store = store or CsvStore()
+        self.identities = identities or IdentityResolver()
+        self.cache = LRUCache(cache_size)
+        self._frames = {}
+
+    def __repr__(self):
+        return f"Season({len(self.matches)} matches)"
+
+    def invalidate(self):
+        """
+        Drop every cached table and aggregate.
+        """
+        self.cache.clear()
+        self._frames.clear()
+
+    # -----------------------------
+    # Change detection
+    # -----------------------------
+    def _outputs(self, match, name):
+        """
+        (output, team) pairs; team is set for per-team player tables.
+        """
+        if name == PLAYERS:
+            return [(f"{team_slug(match.teams[side])}_{PLAYERS}", match.teams[side])
+                    for side in SIDES if side in match.teams]
+        return [(name, None)]
+
+    def _file_signature(self, match, output):
+        try:
+            stat = os.stat(self.store.path(match, output))
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
+    def _signature(self, name):
+        """
+        (match, output, mtime, size) for every existing output file.
+        """
+        signature = []
+        for match in self.matches:
+            for output, _ in self._outputs(match, name):
+                file_signature = self._file_signature(match, output)
+                if file_signature is not None:
+                    signature.append((match.name, output) + file_signature)
+        return tuple(signature)
+
+    def _cached(self, key, inputs, compute):
+        signature = tuple(self._signature(name) for name in inputs)
+        return self.cache.get((key, signature), compute)
+
+    # -----------------------------
+    # Tables
+    # -----------------------------
+    def _frame(self, match, output):
+        """
+        One match's output, re-read only if its file changed
+        (None if it does not exist).
+        """
+        file_signature = self._file_signature(match, output)
+        key = (match.base_dir, output)
+        if file_signature is None:
+            self._frames.pop(key, None)
+            return None
+        cached = self._frames.get(key)
+        if cached is None or cached[0] != file_signature:
+            cached = (file_signature, self.store.read(match, output))
+            self._frames[key] = cached
+        return cached[1]
+
+    def _read_all(self, name):
+        parts = []
+        for match in self.matches:
+            for output, team in self._outputs(match, name):
+                frame = self._frame(match, output)
+                if frame is not None:
+                    ids = {"match": match.name}
+                    if team is not None:
+                        ids["team"] = self.identities.team(team)
+                    parts.append(frame.assign(**ids))
+        if not parts:
+            return pd.DataFrame(columns=["match"])
+        table = integer_ids(pd.concat(parts, ignore_index=True))
+        first = [c for c in ["match", "team"] if c in table.columns]
+        return table[first + [c for c in table.columns if c not in first]]
+
+    def table(self, name):
+        """
+        One pipeline output across all matches (cached).
+        """
+        return self._cached(("table", name), [name], lambda: self._read_all(name))
+
+    def shots(self, **filters):
+        """
+        Consolidated shot table (see shot_table.consolidate_shots);
+        keyword filters select rows by column value, e.g. team=.
+        """
+        table = self._cached(("shots",), ["shots_clean"], self._consolidated_shots)
+        for col, value in filters.items():
+            values = value if isinstance(value, (list, tuple, set)) else [value]
+            table = table[table[col].isin(values)]
+        return table
+
+    def _consolidated_shots(self):
+        frames = {match.name: self._frame(match, "shots_clean") for match in self.matches}
+        table = consolidate_shots({name: f for name, f in frames.items() if f is not None})
+        if len(table):
+            table["team"] = self._canonical_teams(table, "team").astype("category")
+        return table
+
+    def _canonical_teams(self, frame, col):
+        """
+        Canonical team of every row, resolved against its match's
+        teams (the name as it is where it is not one of them).
+        """
+        teams = {match.name: match.teams for match in self.matches}
+        resolved = self.identities.teams_by_match(frame, col, teams)
+        names = frame[col].astype(str).str.strip().to_numpy(dtype=object)
+        return pd.Series(
+            [name if team is None else team for team, name in zip(resolved, names)],
+            index=frame.index, dtype=object
+        )
+
+    def players(self):
+        return self.table(PLAYERS)
+
+    def teams(self):
+        return self.table("team_summary")
+
+    def passing(self):
+        return self.table("passing_styles_summary")
+
+    def pass_types(self):
+        return self.table("pass_types_summary")
+
+    def passing_profile(self):
+        return self.table("passing_profile")
+
+    def goalkeepers(self):
+        return self.table("goalkeeper_summary")
+
+    # -----------------------------
+    # Memoized aggregates
+    # -----------------------------
+    def team_xg(self):
+        """
+        Per team: matches, shots, total xG and xG per shot.
+        """
+        def compute():
+            shots = self.shots()
+            summary = (
+                shots.groupby("team", observed=True)
+                .agg(matches=("match", "nunique"), shots=("xg", "count"), total_xg=("xg", "sum"))
+                .reset_index()
+            )
+            summary["xg_per_shot"] = summary["total_xg"] / summary["shots"]
+            return summary
+        return self._cached(("team_xg",), ["shots_clean"], compute)
+
+    def shots_by_zone(self, by="team"):
+        """
+        Shot counts per ``by`` group and distance zone.
+        """
+        return self._cached(
+            ("shots_by_zone", by), ["shots_clean"],
+            lambda: count_matrix(self.shots(), DISTANCE_ZONES, by=by)
+        )
+
+    def shots_by_window(self, by="team"):
+        """
+        Shot counts per ``by`` group and 15-minute window.
+        """
+        return self._cached(
+            ("shots_by_window", by), ["shots_clean"],
+            lambda: count_matrix(self.shots(), TIME_WINDOWS, by=by)
+        )
+
+    def saves(self):
+        """
+        Total goalkeeper saves per team across the season.
+        """
+        def compute():
+            keepers = self.goalkeepers()
+            if keepers.empty:
+                return pd.DataFrame(columns=["team", "matches", "saves"])
+            return (
+                keepers.assign(team=self._canonical_teams(keepers, "team"))
+                .groupby("team")
+                .agg(matches=("match", "nunique"), saves=("saves", "sum"))
+                .reset_index()
+            )
+        return self._cached(("saves",), ["goalkeeper_summary"], compute)
+
+    def player_totals(self, min_minutes=0):
+        """
+        Per player and team: appearances, minutes, season totals and
+        per-90 rates (see players.season_players).
+        """
+        return self._cached(
+            ("player_totals", min_minutes), [PLAYERS],
+            lambda: season_players(self.players(), min_minutes, self.identities)
+        )
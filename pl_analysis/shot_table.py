@@ -0,0 +1,163 @@
+# shot_table.py
+# Season-wide consolidated shot event table with lookup indexes
+#
+# Concatenates every match's shots_clean output into one frame,
+# sorted by match / team / minute, and builds position indexes by
+# team, player, match and distance zone so queries such as "all
+# Chelsea shots from 18+ yards" intersect small integer arrays
+# instead of scanning every row (or every match CSV).
+
+import os
+
+import numpy as np
+import pandas as pd
+
+from .bins import DISTANCE_ZONES
+from .identity import integer_ids
+from .storage import CsvStore
+
+KEY_COLUMNS = ["match", "team", "player", "minute"]
+
+INDEXED_COLUMNS = ["team", "player", "match", "distance_zone"]
+
+# =====================================================
+# 1. CONSOLIDATION
+# =====================================================
+def consolidate_shots(frames):
+    """
+    Build the season shot table from {match name: shots_clean}.
+    - Adds ``match`` and a whitespace-stripped ``team`` column
+    - Strips FBref indentation from player names
+    - Adds the ``distance_zone`` bin as an ordered categorical
+    """
+    parts = []
+    for match_name, shots in frames.items():
+        shots = shots.copy()
+        shots.insert(0, "match", match_name)
+        parts.append(shots)
+
+    if not parts:
+        return pd.DataFrame(columns=KEY_COLUMNS)
+
+    table = integer_ids(pd.concat(parts, ignore_index=True))
+    table["team"] = table["squad"].astype(str).str.strip()
+    table["player"] = table["player"].astype(str).str.strip()
+    table["distance_zone"] = DISTANCE_ZONES.categorical(table["distance"])
+
+    for col in ["match", "team", "player", "outcome"]:
+        if col in table.columns:
+            table[col] = table[col].astype("category")
+
+    ordered = KEY_COLUMNS + [c for c in table.columns if c not in KEY_COLUMNS]
+    return (
+        table[ordered]
+        .sort_values(["match", "team", "minute"], kind="stable")
+        .reset_index(drop=True)
+    )
+
+# =====================================================
+# 2. INDEXED TABLE
+# =====================================================
+class SeasonShots:
+    """
+    Consolidated shot table plus prebuilt position indexes.
+
+    ``query(team=..., player=..., match=..., distance_zone=...)``
+    intersects the matching index arrays; ``min_distance`` /
+    ``max_minute`` style numeric filters are applied only to the
+    rows that survive.
+    """
+
+    def __init__(self, table):
+        self.table = table
+        self.indexes = {
+            col: {
+                key: np.asarray(positions)
+                for key, positions in table.groupby(col, observed=True).indices.items()
+            }
+            for col in INDEXED_COLUMNS
+            if col in table.columns
+        }
+
+    def __len__(self):
+        return len(self.table)
+
+    @classmethod
+    def from_matches(cls, matches, store=None):
+        """
+        Load shots_clean for each match from ``store`` (default:
+        the per-match CSV outputs) and consolidate them.
+        """
+        store = store or CsvStore()
+        frames = {
+            match.name: store.read(match, "shots_clean")
+            for match in matches
+            if store.exists(match, "shots_clean")
+        }
+        return cls(consolidate_shots(frames))
+
+    def keys(self, column):
+        return sorted(self.indexes.get(column, {}))
+
+    def positions(self, **lookups):
+        """
+        Row positions matching every indexed lookup (sorted).
+        A lookup value may be a single key or a list of keys.
+        """
+        result = None
+        for col, value in lookups.items():
+            if col not in self.indexes:
+                raise KeyError(f"no index on {col!r}")
+            values = value if isinstance(value, (list, tuple, set)) else [value]
+            index = self.indexes[col]
+            found = [index[v] for v in values if v in index]
+            hits = np.concatenate(found) if found else np.empty(0, dtype=np.intp)
+            result = hits if result is None else np.intersect1d(result, hits)
+
+        if result is None:
+            return np.arange(len(self.table))
+        return np.sort(result)
+
+    def query(self, min_distance=None, max_distance=None,
+              min_minute=None, max_minute=None, **lookups):
+        rows = self.table.iloc[self.positions(**lookups)]
+
+        if min_distance is not None:
+            rows = rows[rows["distance"] >= min_distance]
+        if max_distance is not None:
+            rows = rows[rows["distance"] <= max_distance]
+        if min_minute is not None:
+            rows = rows[rows["minute"] >= min_minute]
+        if max_minute is not None:
+            rows = rows[rows["minute"] <= max_minute]
+
+        return rows
+
+    # -----------------------------
+    # Persistence
+    # -----------------------------
+    def save(self, path):
+        """
+        Write the table to .parquet (dtypes kept) or .csv.
+        """
+        folder = os.path.dirname(path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        if path.endswith(".parquet"):
+            self.table.to_parquet(path, index=False)
+        else:
+            self.table.to_csv(path, index=False)
+
+    @classmethod
+    def load(cls, path):
+        if path.endswith(".parquet"):
+            return cls(pd.read_parquet(path))
+
+        table = pd.read_csv(path)
+        for col in ["match", "team", "player", "outcome"]:
+            if col in table.columns:
+                table[col] = table[col].astype("category")
+        table["distance_zone"] = pd.Categorical(
+            table["distance_zone"], categories=DISTANCE_ZONES.labels, ordered=True
+        )
+        return cls(table)
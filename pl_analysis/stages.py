@@ -0,0 +1,252 @@
+# stages.py
+# Shared match analysis stages (one function per output group)
+#
+# Every stage takes a MatchContext and returns a dict of
+# {output_name: DataFrame}. Outputs become available to later
+# stages through ctx.outputs and are written to the clean folder.
+
+import pandas as pd
+
+from .bins import DISTANCE_ZONES, TIME_WINDOWS, count_matrix, long_counts
+from .discovery import SIDES, team_slug
+from .errors import PipelineError
+from .fbref import split_squad_total, squad_totals
+from .passing import match_tables, passing_profiles, resolve_columns
+from .timeline import xg_timelines
+
+# =====================================================
+# 1. TEAM SUMMARY COLUMNS
+# =====================================================
+TEAM_SUMMARY_COLUMNS = {
+    "shots": "sh",
+    "passes_completed": "cmp",
+    "passes_attempted": "passes_att",
+    "fouls": "fls",
+    "corners": "ck",
+}
+
+# =====================================================
+# 2. PLAYER TABLES
+# =====================================================
+def players_clean(ctx):
+    """
+    Cleaned per-team player tables (<team>_players_clean), without
+    FBref's "N Players" footer row (totals go to team_summary).
+    The tables have no team column, so the team's id is added as
+    ``team_id`` (player ids are added by the pipeline).
+    """
+    tables = {}
+    for side in SIDES:
+        players = split_squad_total(ctx.table("team_stats", side))[0].copy()
+        players.insert(0, "team_id", ctx.identities.team_id(ctx.teams[side]))
+        tables[f"{team_slug(ctx.match.teams[side])}_players_clean"] = players
+    return tables
+
+# =====================================================
+# 3. TEAM SUMMARY
+# =====================================================
+def validated_count(value, team, name):
+    """
+    A team-level count must be a non-negative whole number.
+    Missing columns (e.g. fouls in the summary table) become NA
+    rather than a misleading 0.
+    """
+    if value is None or pd.isna(value):
+        return pd.NA
+    if value < 0 or float(value) != int(value):
+        raise PipelineError(f"{team}: invalid {name} total {value!r}")
+    return int(value)
+
+
+def team_summary(ctx):
+    """
+    Team totals read from the squad total row (one lookup per
+    metric) or summed from player rows when there is no footer.
+    """
+    rows = []
+    for side in SIDES:
+        team = ctx.match.teams[side]
+        totals = squad_totals(ctx.table("team_stats", side))
+        row = {"team": team}
+        for name, col in TEAM_SUMMARY_COLUMNS.items():
+            row[name] = validated_count(totals.get(col), team, name)
+        rows.append(row)
+
+    summary = pd.DataFrame(rows)
+    for name in TEAM_SUMMARY_COLUMNS:
+        summary[name] = summary[name].astype("Int64")
+
+    return {"team_summary": summary}
+
+# =====================================================
+# 4. SHOT TABLE CLEANING
+# =====================================================
+def shots_clean(ctx):
+    """
+    Drop non-shot rows (blank separators between halves) and the
+    padding FBref leaves in squad names (" Aston Villa").
+    xG / minute / distance are already typed by the shot schema.
+    """
+    shots = ctx.table("shots").dropna(subset=["xg", "minute", "distance"])
+    shots["squad"] = shots["squad"].astype("string").str.strip().astype("category")
+
+    return {"shots_clean": shots.reset_index(drop=True)}
+
+# =====================================================
+# 5. SHOT SUMMARY & OUTCOMES
+# =====================================================
+def shot_summary(ctx):
+    shots = ctx.outputs["shots_clean"]
+
+    summary = (
+        shots
+        .groupby("squad")
+        .agg(
+            shots=("xg", "count"),
+            total_xg=("xg", "sum"),
+            xg_per_shot=("xg", "mean")
+        )
+        .reset_index()
+    )
+
+    return {
+        "shot_summary": summary,
+        "shot_volume_by_team": summary[["squad", "shots"]],
+    }
+
+
+def shot_outcomes(ctx):
+    shots = ctx.outputs["shots_clean"]
+
+    outcomes = (
+        shots
+        .groupby(["squad", "outcome"])
+        .size()
+        .reset_index(name="count")
+    )
+
+    return {"shot_outcome_breakdown": outcomes}
+
+# =====================================================
+# 6. DISTANCE & TIMING BINS
+# =====================================================
+def distance_analysis(ctx):
+    shots = ctx.outputs["shots_clean"]
+    matrix = count_matrix(shots, DISTANCE_ZONES, by="squad")
+    return {"distance_based_analysis": long_counts(matrix)}
+
+
+def shot_timing(ctx):
+    shots = ctx.outputs["shots_clean"]
+    matrix = count_matrix(shots, TIME_WINDOWS, by="squad")
+    return {"shot_timing_analysis": long_counts(matrix)}
+
+# =====================================================
+# 7. GOAL EVENTS
+# =====================================================
+def goal_events(ctx):
+    shots = ctx.outputs["shots_clean"]
+
+    goals = shots.loc[
+        shots["outcome"] == "Goal",
+        ["minute", "squad", "player", "xg"]
+    ].reset_index(drop=True)
+
+    return {"goal_events": goals}
+
+# =====================================================
+# 8. xG TIMELINE
+# =====================================================
+def xg_timeline(ctx):
+    """
+    Cumulative xG for and against per minute for each team.
+    """
+    shots = ctx.outputs["shots_clean"].assign(match=ctx.match.name)
+    teams = {ctx.match.name: list(ctx.teams.values())}
+    timeline = xg_timelines(shots, team_col="squad", teams=teams).drop(columns="match")
+    return {"xg_timeline": timeline}
+
+# =====================================================
+# 9. PASSING STYLES (TOTAL PASS VOLUME)
+# =====================================================
+def extract_passing_styles_total(df):
+    """
+    Extract total number of short, medium, and long passes
+    from FBref passing styles tables.
+    """
+    totals = squad_totals(df)
+    columns = resolve_columns("passing", tuple(totals.index))
+    output = {}
+
+    for style in ["short", "medium", "long"]:
+        col = columns.get(f"{style}_att")
+        output[style] = int(totals[col]) if col and pd.notna(totals[col]) else 0
+
+    return output
+
+
+def passing_styles(ctx):
+    rows = []
+    for side in SIDES:
+        styles = extract_passing_styles_total(ctx.table("passing", side))
+        rows.append({
+            "team": ctx.match.teams[side],
+            "short_passes": styles["short"],
+            "medium_passes": styles["medium"],
+            "long_passes": styles["long"],
+        })
+
+    return {"passing_styles_summary": pd.DataFrame(rows)}
+
+# =====================================================
+# 10. PASS TYPES (NUMERIC SUMMARY)
+# =====================================================
+def extract_pass_types_numeric(df):
+    """
+    Extract numeric summaries from FBref pass types table.
+    """
+    return squad_totals(df)
+
+
+def pass_types(ctx):
+    summaries = {
+        side: extract_pass_types_numeric(ctx.table("pass_types", side))
+        for side in SIDES
+    }
+    columns = summaries["home"].index.tolist()
+
+    summary = pd.DataFrame(
+        [[ctx.match.teams[side]] + summaries[side].tolist() for side in SIDES],
+        columns=["team"] + columns
+    )
+
+    return {"pass_types_summary": summary}
+
+# =====================================================
+# 11. PASSING PROFILE
+# =====================================================
+def passing_profile(ctx):
+    """
+    Attempted / completed passes by length, live and dead balls,
+    crosses, through balls and switches per team (passing.py).
+    """
+    profile = passing_profiles(match_tables(ctx.match, ctx.table))
+    return {"passing_profile": profile.drop(columns="match")}
+
+# =====================================================
+# 12. GOALKEEPER SUMMARY
+# =====================================================
+def goalkeeper_summary(ctx):
+    teams = [ctx.match.teams[side] for side in SIDES]
+    summary = pd.DataFrame({
+        "team": teams,
+        "saves": [
+            validated_count(
+                squad_totals(ctx.table("goalkeeper", side)).get("saves"), team, "saves"
+            )
+            for side, team in zip(SIDES, teams)
+        ]
+    })
+    summary["saves"] = summary["saves"].astype("Int64")
+
+    return {"goalkeeper_summary": summary}
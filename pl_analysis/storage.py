@@ -0,0 +1,163 @@
+# storage.py
+# Output stores for pipeline results: per-match CSV or columnar Parquet
+#
+# CsvStore keeps the existing <match>/Data_clean/<name>.csv layout.
+# ParquetStore writes one dataset per output, partitioned Hive-style:
+#   <root>/<name>/season=<season>/match=<match>/part-0.parquet
+# so season-level readers load only the tables, partitions and
+# columns they need, with dtypes (incl. categoricals) preserved.
+
+import os
+
+import pandas as pd
+
+from .discovery import team_slug
+
+# Columns stored as categoricals in columnar output. Binned columns
+# already arrive as ordered categoricals from the stages.
+CATEGORICAL_COLUMNS = ["squad", "team", "outcome", "distance_zone", "time_window"]
+
+# =====================================================
+# 1. CSV (DEFAULT)
+# =====================================================
+class CsvStore:
+    """
+    <match clean folder>/<name>.csv — the layout Power BI reads today.
+    """
+
+    format = "csv"
+
+    def path(self, match, name):
+        return os.path.join(match.clean_dir, f"{name}.csv")
+
+    def exists(self, match, name):
+        return os.path.exists(self.path(match, name))
+
+    def write(self, match, outputs):
+        os.makedirs(match.clean_dir, exist_ok=True)
+        for name, df in outputs.items():
+            df.to_csv(self.path(match, name), index=False)
+
+    def read(self, match, name, columns=None):
+        return pd.read_csv(self.path(match, name), usecols=columns)
+
+# =====================================================
+# 2. PARQUET (COLUMNAR, OPTIONAL)
+# =====================================================
+def _require_pyarrow():
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError as exc:
+        raise ImportError(
+            "Parquet output needs pyarrow: pip install pyarrow"
+        ) from exc
+
+
+def _unique_columns(columns):
+    """
+    Parquet does not allow duplicate column names. Pipeline outputs
+    already have unique names (the FBref header reader names the
+    shot table's repeated "player" / "event" columns sca1_player,
+    ...); frames from elsewhere get repeats suffixed as pandas does
+    on read ("player", "player.1", ...).
+    """
+    seen = {}
+    result = []
+    for col in columns:
+        col = str(col)
+        if col in seen:
+            seen[col] += 1
+            result.append(f"{col}.{seen[col]}")
+        else:
+            seen[col] = 0
+            result.append(col)
+    return result
+
+
+def to_columnar(df):
+    """
+    Prepare a frame for columnar storage: unique column names and
+    categorical dtype for low-cardinality label columns.
+    """
+    df = df.copy()
+    df.columns = _unique_columns(df.columns)
+    for col in CATEGORICAL_COLUMNS:
+        if col in df.columns and not isinstance(df[col].dtype, pd.CategoricalDtype):
+            df[col] = df[col].astype("category")
+    return df
+
+
+class ParquetStore:
+    """
+    Season-wide columnar store partitioned by season and match.
+    """
+
+    format = "parquet"
+
+    def __init__(self, root, season="unspecified"):
+        _require_pyarrow()
+        self.root = root
+        self.season = str(season)
+
+    def partition_dir(self, match, name):
+        return os.path.join(
+            self.root, name,
+            f"season={self.season}",
+            f"match={team_slug(match.name)}"
+        )
+
+    def path(self, match, name):
+        return os.path.join(self.partition_dir(match, name), "part-0.parquet")
+
+    def exists(self, match, name):
+        return os.path.exists(self.path(match, name))
+
+    def write(self, match, outputs):
+        for name, df in outputs.items():
+            os.makedirs(self.partition_dir(match, name), exist_ok=True)
+            to_columnar(df).to_parquet(self.path(match, name), index=False)
+
+    def read(self, match, name, columns=None):
+        return pd.read_parquet(self.path(match, name), columns=columns)
+
+
+def read_dataset(root, name, columns=None, season=None, match=None):
+    """
+    Read one output table across the store, optionally restricted
+    to a season / match partition and a subset of columns.
+    Partition values come back as ``season`` / ``match`` columns.
+    """
+    _require_pyarrow()
+    filters = []
+    if season is not None:
+        filters.append(("season", "==", str(season)))
+    if match is not None:
+        filters.append(("match", "==", team_slug(match)))
+
+    return pd.read_parquet(
+        os.path.join(root, name),
+        columns=columns,
+        filters=filters or None
+    )
+
+# =====================================================
+# 3. FACTORY
+# =====================================================
+OUTPUT_FORMATS = ["csv", "parquet", "both"]
+
+
+def make_stores(output_format="csv", store_root=None, season="unspecified"):
+    """
+    Stores for an output format name. Parquet needs ``store_root``.
+    """
+    if output_format not in OUTPUT_FORMATS:
+        raise ValueError(f"unknown output format: {output_format!r}")
+
+    stores = []
+    if output_format in ("csv", "both"):
+        stores.append(CsvStore())
+    if output_format in ("parquet", "both"):
+        if store_root is None:
+            raise ValueError("parquet output needs a store root folder")
+        stores.append(ParquetStore(store_root, season))
+    return stores
@@ -0,0 +1,228 @@
+# synthetic.py
+# FBref-shaped synthetic raw data for benchmarks
+#
+# Writes match folders laid out like the real ones
+# (<match>/Data_raw/<FBref export>.csv) with the same two header
+# rows, "N Players" footer rows, blank separator rows in shot tables
+# and stoppage-time minutes ("45+2"). Values are random but
+# plausible and consistent across tables (a player's Sh / Gls / xG
+# in the team stats come from their rows in the shot table); a
+# fixed seed makes runs reproducible.
+
+import csv
+import os
+import random
+
+TEAMS = [
+    "Arsenal", "Aston Villa", "Bournemouth", "Brentford", "Brighton",
+    "Burnley", "Chelsea", "Crystal Palace", "Everton", "Fulham",
+    "Leeds United", "Liverpool", "Manchester City", "Manchester United",
+    "Newcastle United", "Nottingham Forest", "Sunderland", "Tottenham",
+    "West Ham", "Wolves",
+]
+
+OUTCOMES = ["Goal", "Saved", "Off Target", "Blocked", "Woodwork"]
+BODY_PARTS = ["Right Foot", "Left Foot", "Head"]
+SCA_EVENTS = ["Pass (Live)", "Pass (Dead)", "Take-On", "Shot", "Fouled"]
+
+# =====================================================
+# 1. FIXTURES
+# =====================================================
+def season_fixtures(n_matches):
+    """
+    First ``n_matches`` of a double round robin (380 for 20 teams).
+    """
+    fixtures = [(home, away) for home in TEAMS for away in TEAMS if home != away]
+    random.Random(0).shuffle(fixtures)
+    return fixtures[:n_matches]
+
+# =====================================================
+# 2. TABLE WRITERS
+# =====================================================
+def _write(path, groups, header, rows):
+    with open(path, "w", newline="", encoding="latin1") as f:
+        writer = csv.writer(f)
+        writer.writerow(groups)
+        writer.writerow(header)
+        writer.writerows(rows)
+
+
+def _players(rng, team, n):
+    return [f"{team.split()[0]} Player {i + 1}" for i in range(n)]
+
+
+def _with_total(rows, first_numeric):
+    """
+    Append FBref's "N Players" footer with column totals.
+    """
+    total = [f"{len(rows)} Players"] + [""] * (first_numeric - 1)
+    for i in range(first_numeric, len(rows[0])):
+        values = [r[i] for r in rows if r[i] != ""]
+        total.append(round(sum(values), 1) if any(isinstance(v, float) for v in values)
+                     else sum(values))
+    return rows + [total]
+
+
+def team_stats(path, rng, team, shots=None, n=15):
+    """
+    ``shots`` maps player -> (shots, on target, goals, xG) from the
+    match's shot table.
+    """
+    groups = (
+        [""] * 6 + ["Performance"] * 12 + ["Expected"] * 3 + ["SCA"] * 2
+        + ["Passes"] * 4 + ["Carries"] * 2 + ["Take-Ons"] * 2
+    )
+    header = [
+        "Player", "#", "Nation", "Pos", "Age", "Min",
+        "Gls", "Ast", "PK", "PKatt", "Sh", "SoT", "CrdY", "CrdR",
+        "Touches", "Tkl", "Int", "Blocks", "xG", "npxG", "xAG",
+        "SCA", "GCA", "Cmp", "Att", "Cmp%", "PrgP", "Carries", "PrgC",
+        "Att", "Succ",
+    ]
+    rows = []
+    for i, name in enumerate(_players(rng, team, n)):
+        att = rng.randint(5, 80)
+        cmp_ = rng.randint(0, att)
+        row = [
+            ("   " if i >= 11 else "") + name, i + 1, "eng ENG",
+            rng.choice(["GK", "DF", "MF", "FW"]), f"{rng.randint(18, 35)}-{rng.randint(0, 364):03d}",
+            90 if i < 11 else rng.randint(1, 30),
+        ]
+        sh, sot, gls, xg = (shots or {}).get(name, (0, 0, 0, 0.0))
+        xg = round(xg, 1)
+        row += [gls, rng.randint(0, 1), 0, 0]
+        row += [sh, sot, rng.randint(0, 1), 0]
+        row += [rng.randint(10, 90), rng.randint(0, 5), rng.randint(0, 3), rng.randint(0, 3)]
+        row += [xg, xg, round(rng.random() * 0.3, 1)]
+        row += [rng.randint(0, 5), rng.randint(0, 1)]
+        row += [cmp_, att, round(100 * cmp_ / att, 1), rng.randint(0, 8)]
+        row += [rng.randint(5, 60), rng.randint(0, 6)]
+        takeons = rng.randint(0, 5)
+        row += [takeons, rng.randint(0, takeons)]
+        rows.append(row)
+    _write(path, groups, header, _with_total(rows, 5))
+
+
+def shot_table(path, rng, home, away):
+    """
+    Write the shot table and return {team: {player: (shots, on
+    target, goals, xG)}} for the team stats.
+    """
+    groups = [""] * 9 + ["SCA 1"] * 2 + ["SCA 2"] * 2
+    header = [
+        "Minute", "Player", "Squad", "xG", "PSxG", "Outcome", "Distance",
+        "Body Part", "Notes", "Player", "Event", "Player", "Event",
+    ]
+    rows = []
+    for minute in sorted(rng.randint(1, 95) for _ in range(rng.randint(15, 35))):
+        team = rng.choice([home, away])
+        players = _players(rng, team, 11)
+        if minute > 90:
+            label = f"90+{minute - 90}"
+        elif minute == 45 and rng.random() < 0.5:
+            label = f"45+{rng.randint(1, 4)}"
+        else:
+            label = str(minute)
+        rows.append([
+            label, rng.choice(players), team, round(rng.random() * 0.6, 2),
+            round(rng.random() * 0.8, 2), rng.choice(OUTCOMES), rng.randint(3, 35),
+            rng.choice(BODY_PARTS), "", rng.choice(players), rng.choice(SCA_EVENTS),
+            rng.choice(players), rng.choice(SCA_EVENTS),
+        ])
+    totals = {home: {}, away: {}}
+    for row in rows:
+        player, team, xg, outcome = row[1], row[2], row[3], row[5]
+        sh, sot, gls, total = totals[team].get(player, (0, 0, 0, 0.0))
+        totals[team][player] = (
+            sh + 1, sot + (outcome in ("Goal", "Saved")), gls + (outcome == "Goal"), total + xg
+        )
+    rows.insert(len(rows) // 2, [""] * len(header))
+    _write(path, groups, header, rows)
+    return totals
+
+
+def passing_table(path, rng, team, n=15):
+    groups = (
+        [""] * 5 + ["Total"] * 5 + ["Short"] * 3 + ["Medium"] * 3
+        + ["Long"] * 3 + [""] * 8
+    )
+    header = [
+        "Player", "#", "Nation", "Pos", "Age",
+        "Cmp", "Att", "Cmp%", "TotDist", "PrgDist",
+        "Cmp", "Att", "Cmp%", "Cmp", "Att", "Cmp%", "Cmp", "Att", "Cmp%",
+        "Ast", "xAG", "xA", "KP", "1/3", "PPA", "CrsPA", "PrgP",
+    ]
+    rows = []
+    for i, name in enumerate(_players(rng, team, n)):
+        parts = [rng.randint(2, 30), rng.randint(2, 25), rng.randint(0, 8)]
+        done = [rng.randint(0, p) for p in parts]
+        row = [name, i + 1, "eng ENG", "MF", "25-001"]
+        row += [sum(done), sum(parts), round(100 * sum(done) / sum(parts), 1),
+                rng.randint(100, 900), rng.randint(10, 300)]
+        for d, p in zip(done, parts):
+            row += [d, p, round(100 * d / p, 1) if p else 0]
+        row += [0, round(rng.random() * 0.2, 1), round(rng.random() * 0.2, 1),
+                rng.randint(0, 3), rng.randint(0, 5), rng.randint(0, 2),
+                rng.randint(0, 1), rng.randint(0, 6)]
+        rows.append(row)
+    _write(path, groups, header, _with_total(rows, 5))
+
+
+def pass_types_table(path, rng, team, n=15):
+    groups = [""] * 7 + ["Pass Types"] * 8 + ["Corner Kicks"] * 3 + ["Outcomes"] * 3
+    header = [
+        "Player", "#", "Nation", "Pos", "Age", "Min", "Att",
+        "Live", "Dead", "FK", "TB", "Sw", "Crs", "TI", "CK",
+        "In", "Out", "Str", "Cmp", "Off", "Blocks",
+    ]
+    rows = []
+    for i, name in enumerate(_players(rng, team, n)):
+        live, dead = rng.randint(5, 60), rng.randint(0, 8)
+        row = [name, i + 1, "eng ENG", "MF", "25-001", 90, live + dead, live, dead]
+        row += [rng.randint(0, 3) for _ in range(9)]
+        row += [rng.randint(0, live), rng.randint(0, 1), rng.randint(0, 2)]
+        rows.append(row)
+    _write(path, groups, header, _with_total(rows, 5))
+
+
+def goalkeeper_table(path, rng, team):
+    groups = [""] * 4 + ["Shot Stopping"] * 5 + ["Launched"] * 3
+    header = [
+        "Player", "Nation", "Age", "Min",
+        "SoTA", "GA", "Saves", "Save%", "PSxG",
+        "Cmp", "Att", "Cmp%",
+    ]
+    sota = rng.randint(0, 9)
+    ga = rng.randint(0, sota)
+    saves = sota - ga
+    row = [f"{team.split()[0]} Keeper", "eng ENG", "29-100", 90,
+           sota, ga, saves, round(100 * saves / sota, 1) if sota else "",
+           round(rng.random() * 2, 1), rng.randint(0, 10), rng.randint(5, 20), 50.0]
+    _write(path, groups, header, [row])
+
+# =====================================================
+# 3. SEASON
+# =====================================================
+def write_season(root, n_matches, seed=0):
+    """
+    Write ``n_matches`` synthetic match folders under ``root`` and
+    return their paths.
+    """
+    rng = random.Random(seed)
+    paths = []
+    for number, (home, away) in enumerate(season_fixtures(n_matches), start=1):
+        base = os.path.join(root, f"{number:03d} {home} vs {away}")
+        raw = os.path.join(base, "Data_raw")
+        os.makedirs(raw, exist_ok=True)
+
+        shots = shot_table(
+            os.path.join(raw, f"Shot table {home.lower()} vs {away.lower()}.csv"),
+            rng, home, away
+        )
+        for team in (home, away):
+            team_stats(os.path.join(raw, f"{team} team stats.csv"), rng, team, shots[team])
+            passing_table(os.path.join(raw, f"{team} passing styles.csv"), rng, team)
+            pass_types_table(os.path.join(raw, f"{team} pass types.csv"), rng, team)
+            goalkeeper_table(os.path.join(raw, f"{team} goalkeeper stats.csv"), rng, team)
+        paths.append(base)
+    return paths
@@ -0,0 +1,140 @@
+# timeline.py
+# Cumulative per-minute xG timelines and rolling multi-match xG
+#
+# Shots are scattered into a dense (match, team) x minute matrix with
+# one bincount and summed along the minute axis with cumsum, so a
+# whole season of timelines is a handful of array operations. The
+# opponent of each (match, team) row is the other row of the same
+# match, which gives cumulative xG against for free. Rolling xG
+# for / against over the last N matches uses per-team cumulative
+# sums as well (sum of last N = cumsum - cumsum N matches earlier).
+
+import numpy as np
+import pandas as pd
+
+# Timelines always run to full time; later minutes (extra time)
+# extend them. Stoppage time sits on minute 45 / 90 as in the
+# shot table's ``minute`` column.
+FULL_TIME = 90
+
+# =====================================================
+# 1. (MATCH, TEAM) x MINUTE MATRIX
+# =====================================================
+def _xg_matrix(shots, team_col, end_minute=FULL_TIME, teams=None):
+    """
+    (index, per-minute xG matrix, opponent row per row).
+    ``index`` is the sorted (match, team) MultiIndex: every team
+    with a shot plus, with ``teams`` ({match: [team names]}), the
+    match's teams, so a team without shots gets a row of zeros.
+    """
+    keys = pd.MultiIndex.from_arrays(
+        [shots["match"].astype(str), shots[team_col].astype(str).str.strip()],
+        names=["match", team_col]
+    )
+    index = keys.unique()
+    listed = [(str(m), str(t).strip()) for m, names in (teams or {}).items() for t in names]
+    if listed:
+        index = index.append(pd.MultiIndex.from_tuples(listed, names=["match", team_col])).unique()
+    index = index.sort_values()
+    rows = index.get_indexer(keys)
+
+    minutes = pd.to_numeric(shots["minute"], errors="coerce").to_numpy(dtype="float64", na_value=np.nan)
+    xg = pd.to_numeric(shots["xg"], errors="coerce").to_numpy(dtype="float64", na_value=np.nan)
+    valid = ~np.isnan(minutes) & ~np.isnan(xg) & (minutes >= 0)
+    minutes = minutes[valid].astype("int64")
+
+    n_minutes = max(end_minute, int(minutes.max()) if len(minutes) else 0) + 1
+    flat = rows[valid] * n_minutes + minutes
+    per_minute = np.bincount(
+        flat, weights=xg[valid], minlength=len(index) * n_minutes
+    ).reshape(len(index), n_minutes)
+
+    # Rows are sorted by match, so the two teams of a match are
+    # neighbours; a team alone in its match has no opponent (-1).
+    opponent = np.full(len(index), -1)
+    match_codes = index.codes[0]
+    pairs = np.flatnonzero(match_codes[:-1] == match_codes[1:])
+    opponent[pairs] = pairs + 1
+    opponent[pairs + 1] = pairs
+
+    return index, per_minute, opponent
+
+
+def _against(values, opponent):
+    against = np.full(values.shape, np.nan)
+    has = opponent >= 0
+    against[has] = values[opponent[has]]
+    return against
+
+# =====================================================
+# 2. MATCH TIMELINES
+# =====================================================
+def xg_timelines(shots, team_col="team", end_minute=FULL_TIME, teams=None):
+    """
+    Long table of cumulative xG per minute for every (match, team):
+    match, team, minute, xg (shots in that minute), cumulative_xg,
+    cumulative_xg_against. ``shots`` needs match, ``team_col``,
+    minute and xg columns (e.g. SeasonShots.table); ``teams``
+    ({match: [team names]}) adds teams that did not shoot.
+    """
+    index, per_minute, opponent = _xg_matrix(shots, team_col, end_minute, teams)
+    cumulative = per_minute.cumsum(axis=1)
+    n_rows, n_minutes = per_minute.shape
+
+    timeline = index.repeat(n_minutes).to_frame(index=False)
+    timeline["minute"] = np.tile(np.arange(n_minutes, dtype="int16"), n_rows)
+    timeline["xg"] = per_minute.ravel()
+    timeline["cumulative_xg"] = cumulative.ravel()
+    timeline["cumulative_xg_against"] = _against(cumulative, opponent).ravel()
+    return timeline
+
+
+def match_xg(shots, team_col="team", teams=None):
+    """
+    One row per (match, team): shots, xg_for, xg_against.
+    ``teams`` as in xg_timelines.
+    """
+    index, per_minute, opponent = _xg_matrix(shots, team_col, teams=teams)
+    totals = index.to_frame(index=False)
+    counts = (
+        shots.assign(**{team_col: shots[team_col].astype(str).str.strip()})
+        .astype({"match": str})
+        .groupby(["match", team_col])
+        .size()
+    )
+    totals["shots"] = counts.reindex(index, fill_value=0).to_numpy()
+    totals["xg_for"] = per_minute.sum(axis=1)
+    totals["xg_against"] = _against(totals["xg_for"].to_numpy(), opponent)
+    return totals
+
+# =====================================================
+# 3. ROLLING MULTI-MATCH xG
+# =====================================================
+def rolling_xg(totals, window=5, order=None, team_col="team"):
+    """
+    Per team, xG for / against summed and averaged over its last
+    ``window`` matches (including the current one).
+
+    ``order`` lists match names in chronological order; by default
+    matches are taken in name order (folder names carry no date).
+    """
+    totals = totals.copy()
+    if order is None:
+        order = sorted(totals["match"].unique())
+    position = {name: i for i, name in enumerate(order)}
+    totals["match_number"] = totals["match"].map(position)
+    totals = totals.sort_values([team_col, "match_number"], kind="stable").reset_index(drop=True)
+
+    by_team = totals.groupby(team_col, sort=False)
+    played = by_team.cumcount().to_numpy() + 1
+    in_window = np.minimum(played, window)
+
+    for col in ["xg_for", "xg_against"]:
+        values = totals[col].fillna(0)
+        running = values.groupby(totals[team_col], sort=False).cumsum()
+        earlier = running.groupby(totals[team_col], sort=False).shift(window).fillna(0)
+        totals[f"rolling_{col}"] = (running - earlier).to_numpy()
+        totals[f"rolling_{col}_per_match"] = totals[f"rolling_{col}"] / in_window
+
+    totals["rolling_matches"] = in_window
+    return totals
@@ -0,0 +1,114 @@
+# validate.py
+# Fast pre-flight checks of a match's raw FBref files
+#
+# Standard library only (no pandas), so `python -m pl_analysis
+# validate` answers in a fraction of a second. Checks that the
+# tables the pipeline needs are present, that each file has FBref's
+# two header rows with the columns the stages read, and that those
+# columns hold numbers.
+
+import csv
+
+from .discovery import SIDES
+from .headers import RAW_ENCODING, fbref_column_names
+
+# Raw tables the non-optional pipeline stages read.
+REQUIRED_TABLES = ["team_stats", "shots"]
+
+TEXT = "text"
+NUMBER = "number"
+MINUTE = "minute"
+
+# Columns (as named by read_fbref_table) that each stage reads.
+REQUIRED_COLUMNS = {
+    "team_stats": {"player": TEXT, "sh": NUMBER},
+    "shots": {
+        "minute": MINUTE, "player": TEXT, "squad": TEXT, "xg": NUMBER,
+        "outcome": TEXT, "distance": NUMBER,
+    },
+    "passing": {"player": TEXT, "short_att": NUMBER, "medium_att": NUMBER, "long_att": NUMBER},
+    "pass_types": {"player": TEXT, "att": NUMBER},
+    "goalkeeper": {"player": TEXT, "saves": NUMBER},
+}
+
+# =====================================================
+# 1. VALUE CHECKS
+# =====================================================
+def _is_number(value):
+    try:
+        float(value)
+    except ValueError:
+        return False
+    return True
+
+
+def _is_minute(value):
+    """
+    "67", "67.0" or stoppage time "90+3".
+    """
+    base, plus, added = value.partition("+")
+    if plus:
+        return base.strip().isdigit() and added.strip().isdigit()
+    return _is_number(value)
+
+
+VALUE_CHECKS = {NUMBER: _is_number, MINUTE: _is_minute}
+
+# =====================================================
+# 2. FILE & MATCH CHECKS
+# =====================================================
+def validate_raw_file(path, kind):
+    """
+    Problems found in one raw export (empty list if none).
+    """
+    try:
+        with open(path, encoding=RAW_ENCODING, newline="") as f:
+            rows = list(csv.reader(f))
+    except OSError as exc:
+        return [f"{path}: cannot read ({exc.strerror})"]
+
+    if len(rows) < 3:
+        return [f"{path}: expected two header rows and data"]
+
+    names = fbref_column_names(rows[0], rows[1])
+    required = REQUIRED_COLUMNS.get(kind, {})
+    missing = [col for col in required if col not in names]
+    problems = [f"{path}: missing column(s) {', '.join(missing)}"] if missing else []
+
+    positions = {col: names.index(col) for col in required if col in names}
+    for line, row in enumerate(rows[2:], start=3):
+        if not any(cell.strip() for cell in row):
+            continue  # blank separator row
+        if len(row) > len(names):
+            problems.append(f"{path}:{line}: {len(row)} fields, header has {len(names)}")
+            continue
+        for col, pos in positions.items():
+            check = VALUE_CHECKS.get(required[col])
+            value = row[pos].strip() if pos < len(row) else ""
+            if check and value and not check(value):
+                problems.append(f"{path}:{line}: {col} is not a {required[col]}: {value!r}")
+    return problems
+
+
+def validate_match(match):
+    """
+    Problems for one Match: missing required tables plus every
+    file-level problem in the tables that are present.
+    """
+    problems = []
+    for side in SIDES:
+        if side not in match.teams:
+            problems.append(f"{match.name}: no {side} team found")
+
+    for kind in REQUIRED_TABLES:
+        if not match.has_table(kind):
+            problems.append(f"{match.name}: missing raw '{kind}' table")
+
+    for kind in sorted(match.raw_files):
+        for side in SIDES:
+            path = match.raw_files[kind].get(side)
+            if path:
+                problems.extend(validate_raw_file(path, kind))
+    if match.shot_file:
+        problems.extend(validate_raw_file(match.shot_file, "shots"))
+    return problems
@@ -0,0 +1,61 @@
+# Shared fixtures: small synthetic seasons in a temporary folder.
+
+import glob
+import os
+import shutil
+
+import pandas as pd
+import pytest
+
+from pl_analysis.pipeline import run_season
+from pl_analysis.synthetic import write_season
+
+
+@pytest.fixture
+def season_root(tmp_path):
+    """
+    Two raw synthetic match folders (not yet cleaned).
+    """
+    write_season(str(tmp_path), 2, seed=1)
+    return str(tmp_path)
+
+
+@pytest.fixture
+def cleaned_root(season_root):
+    """
+    The same season after one pipeline run.
+    """
+    run_season(season_root)
+    return season_root
+
+
+@pytest.fixture
+def mixed_root(cleaned_root):
+    """
+    The cleaned season with its second match turned into a legacy
+    clean-only folder: no raw data and outputs without id columns.
+    """
+    legacy = sorted(glob.glob(os.path.join(cleaned_root, "*", "Data_raw")))[1]
+    shutil.rmtree(legacy)
+    for path in glob.glob(os.path.join(os.path.dirname(legacy), "Data_clean", "*.csv")):
+        frame = pd.read_csv(path)
+        frame.drop(columns=["team_id", "player_id"], errors="ignore").to_csv(path, index=False)
+    return cleaned_root
+
+
+@pytest.fixture
+def respelled_root(season_root):
+    """
+    The season plus a copy of its first match whose raw files spell
+    Newcastle United "Newcastle Utd", all cleaned.
+    """
+    first = sorted(glob.glob(os.path.join(season_root, "001 *")))[0]
+    raw = os.path.join(season_root, "003 Newcastle Utd vs Brighton", "Data_raw")
+    os.makedirs(raw)
+    for path in glob.glob(os.path.join(first, "Data_raw", "*.csv")):
+        name = os.path.basename(path)
+        name = name.replace("Newcastle United", "Newcastle Utd")
+        name = name.replace("newcastle united", "newcastle utd")
+        shutil.copy(path, os.path.join(raw, name))
+    run_season(season_root)
+    return season_root
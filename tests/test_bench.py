@@ -0,0 +1,23 @@
+from pl_analysis.bench import bench_season, compare_results
+
+
+def test_season_bench_times_every_step(tmp_path):
+    rows = bench_season(2, charts=False, keep=str(tmp_path), memory=False)
+    steps = [row["step"] for row in rows]
+    assert "pipeline (end to end)" in steps
+    assert len(steps) == len(set(steps))
+    assert all(row["matches"] == 2 and row["seconds"] >= 0 for row in rows)
+    assert all(row["peak_mib"] is None for row in rows)
+
+
+def test_compare_flags_only_slowdowns_beyond_tolerance():
+    baseline = [
+        {"step": "read", "matches": 38, "seconds": 1.0},
+        {"step": "write", "matches": 38, "seconds": 1.0},
+    ]
+    rows = [
+        {"step": "read", "matches": 38, "seconds": 1.1},
+        {"step": "write", "matches": 38, "seconds": 1.5},
+        {"step": "new", "matches": 38, "seconds": 9.0},
+    ]
+    assert compare_results(rows, baseline, 0.2) == [("write", 38, 1.0, 1.5)]
@@ -0,0 +1,54 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from pl_analysis.bins import DISTANCE_ZONES, TIME_WINDOWS, BinSpec, count_matrix
+from pl_analysis.live import parse_minute
+from pl_analysis.schema import parse_minutes
+
+
+def _labels(spec, values):
+    return list(spec.categorical(values).astype(object))
+
+
+def test_stoppage_time_stays_in_its_half():
+    shots = parse_minutes(pd.DataFrame({"minute": ["44", "45+2", "46", "90+4", "91"]}))
+    assert shots["minute"].tolist() == [44, 45, 46, 90, 91]
+    assert shots["minute_added"].tolist() == [0, 2, 0, 4, 0]
+    assert _labels(TIME_WINDOWS, shots["minute"]) == ["31-45+", "31-45+", "46-60", "76-90+", "90+"]
+    assert [TIME_WINDOWS.code(parse_minute(m)[0]) for m in ["45+2", "90+4"]] == [2, 5]
+
+
+@pytest.mark.parametrize("distance, label", [
+    (6, "0-6 yards"), (6.5, "6-12 yards"), (12, "6-12 yards"), (12.0001, "12-18 yards"),
+    (18, "12-18 yards"), (19, "18+ yards"), (100, "18+ yards"),
+])
+def test_distance_edges_are_right_closed(distance, label):
+    assert _labels(DISTANCE_ZONES, [distance]) == [label]
+    assert DISTANCE_ZONES.labels[DISTANCE_ZONES.code(distance)] == label
+
+
+def test_outside_and_missing_values_have_no_bin():
+    values = [0, -1, 101, np.nan, None, "n/a"]
+    assert DISTANCE_ZONES.codes(values).tolist() == [-1] * len(values)
+    assert DISTANCE_ZONES.code(0) == DISTANCE_ZONES.code(None) == -1
+
+
+def test_lookup_matches_pd_cut():
+    values = np.r_[np.arange(0, 101), np.linspace(0.5, 99.5, 40)]
+    expected = pd.cut(values, DISTANCE_ZONES.edges, labels=DISTANCE_ZONES.labels)
+    assert list(DISTANCE_ZONES.categorical(values)) == list(expected)
+
+
+def test_edges_must_match_labels():
+    with pytest.raises(ValueError):
+        BinSpec("zone", "distance", [0, 6, 12], ["a"])
+    with pytest.raises(ValueError):
+        BinSpec("zone", "distance", [0, 12, 6], ["a", "b"])
+
+
+def test_count_matrix_ignores_rows_outside_every_bin():
+    shots = pd.DataFrame({"squad": ["B", "A", "A", "A"], "distance": [5, 6, 13, 150]})
+    matrix = count_matrix(shots, DISTANCE_ZONES)
+    assert matrix.index.tolist() == ["A", "B"]
+    assert matrix.to_numpy().tolist() == [[1, 0, 1, 0], [1, 0, 0, 0]]
@@ -0,0 +1,69 @@
+import os
+
+import pandas as pd
+import pytest
+
+from pl_analysis.charts import (
+    CHART_TEMPLATES, render_match_charts, render_season_charts, summarise_charts,
+)
+from pl_analysis.discovery import discover_matches
+
+pytest.importorskip("matplotlib")
+
+
+def test_charts_are_redrawn_only_when_their_data_changes(cleaned_root):
+    match = discover_matches(cleaned_root)[0]
+    assert set(render_match_charts(match).values()) == {"rendered"}
+    for name in CHART_TEMPLATES:
+        assert os.path.getsize(os.path.join(match.visuals_dir, f"{name}.png")) > 0
+    assert set(render_match_charts(match).values()) == {"fresh"}
+
+    path = os.path.join(match.clean_dir, "shot_summary.csv")
+    summary = pd.read_csv(path)
+    summary.assign(total_xg=summary["total_xg"] + 0.1).to_csv(path, index=False)
+    status = render_match_charts(match)
+    assert {name for name, s in status.items() if s == "rendered"} == {
+        "shots_by_team", "xg_by_team",
+    }
+    assert render_match_charts(match, titles={"shot_map": "Map"})["shot_map"] == "rendered"
+    assert set(render_match_charts(match, force=True).values()) == {"rendered"}
+
+
+def test_templates_reuse_one_figure(cleaned_root):
+    match = discover_matches(cleaned_root)[0]
+    template = CHART_TEMPLATES["shots_by_team"]
+    frames = {"shot_summary": pd.read_csv(os.path.join(match.clean_dir, "shot_summary.csv"))}
+    first = template.draw_figure(frames)
+    assert template.draw_figure(frames, "Other") is first
+    assert len(first.axes) == 1
+
+
+def test_season_charts_in_worker_processes(cleaned_root):
+    matches = discover_matches(cleaned_root)
+    results = render_season_charts(matches, workers=2)
+    assert [r.name for r in results] == [m.name for m in matches]
+    assert all(r.ok for r in results)
+    assert "5 rendered, 0 unchanged" in summarise_charts(results)
+
+
+def test_xg_timeline_ends_at_each_teams_total(cleaned_root):
+    match = discover_matches(cleaned_root)[0]
+    timeline = pd.read_csv(os.path.join(match.clean_dir, "xg_timeline.csv"))
+    summary = pd.read_csv(os.path.join(match.clean_dir, "shot_summary.csv"))
+    final = timeline.sort_values("minute").groupby("squad")["cumulative_xg"].last()
+    totals = summary.set_index("squad")["total_xg"]
+    assert final.loc[totals.index].to_numpy() == pytest.approx(totals.to_numpy())
+
+
+def test_shot_map_and_timeline_draw_without_shots(cleaned_root):
+    match = discover_matches(cleaned_root)[0]
+    frames = {
+        name: pd.read_csv(os.path.join(match.clean_dir, f"{name}.csv"))
+        for name in ["shots_clean", "xg_timeline", "goal_events"]
+    }
+    shot_map = CHART_TEMPLATES["shot_map"].draw_figure(frames)
+    assert len(shot_map.axes[0].collections) == 4  # shots and goals per team
+
+    empty = {name: frame.iloc[:0] for name, frame in frames.items()}
+    assert CHART_TEMPLATES["shot_map"].draw_figure(empty).axes[0].get_xlim() == (0, 95)
+    CHART_TEMPLATES["xg_timeline"].draw_figure(empty)
@@ -0,0 +1,60 @@
+import os
+
+import pandas as pd
+
+from pl_analysis.__main__ import main
+from pl_analysis.checks import ERROR, check_season
+from pl_analysis.discovery import discover_clean_matches
+from pl_analysis.season import Season
+
+
+def _check(root):
+    return check_season(Season(matches=discover_clean_matches(root)))
+
+
+def _edit(root, output, func):
+    match = discover_clean_matches(root)[0]
+    path = os.path.join(match.clean_dir, f"{output}.csv")
+    func(pd.read_csv(path)).to_csv(path, index=False)
+
+
+def test_clean_season_passes(cleaned_root, capsys):
+    assert main(["check", cleaned_root]) == 0
+    assert "2 passed, 0 failed" in capsys.readouterr().out
+
+
+def test_mixed_fresh_and_legacy_folders_pass(mixed_root, capsys):
+    assert len(discover_clean_matches(mixed_root)) == 2
+    assert main(["check", mixed_root]) == 0
+    assert "2 passed, 0 failed" in capsys.readouterr().out
+
+
+def test_shot_total_mismatch_is_an_error(cleaned_root):
+    _edit(cleaned_root, "team_summary", lambda f: f.assign(shots=f["shots"] + 1))
+    violations = _check(cleaned_root)
+    assert set(violations.loc[violations["severity"] == ERROR, "invariant"]) == {"shots_match_team_totals"}
+
+
+def test_tampered_player_id_is_an_error(cleaned_root):
+    _edit(cleaned_root, "goal_events", lambda f: f.assign(player_id=f["player_id"] + 1))
+    violations = _check(cleaned_root)
+    assert "identity_ids" in set(violations["invariant"])
+
+
+def test_padded_and_repeated_names_are_errors(cleaned_root):
+    def pad(frame):
+        frame["squad"] = " " + frame["squad"]
+        return frame
+
+    _edit(cleaned_root, "goal_events", pad)
+    match = discover_clean_matches(cleaned_root)[0]
+    path = os.path.join(match.clean_dir, "shot_volume_by_team.csv")
+    with open(path, encoding="utf-8") as f:
+        lines = f.read().splitlines()
+    lines[0] += ",squad"
+    lines[1:] = [line + ",x" for line in lines[1:]]
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("\n".join(lines) + "\n")
+
+    invariants = set(_check(cleaned_root)["invariant"])
+    assert {"trimmed_names", "unique_columns"} <= invariants
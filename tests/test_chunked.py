@@ -0,0 +1,67 @@
+import os
+
+import pandas as pd
+import pytest
+
+from pl_analysis.chunked import ShotAggregates, aggregate_shots, shot_chunks
+from pl_analysis.discovery import discover_matches
+from pl_analysis.shot_table import SeasonShots
+
+
+def _frames(aggregates):
+    return {name: frame.reset_index(drop=True) for name, frame in aggregates.outputs().items()}
+
+
+def _assert_same(left, right):
+    assert left.keys() == right.keys()
+    for name in left:
+        pd.testing.assert_frame_equal(left[name], right[name], check_dtype=False)
+
+
+def test_chunk_size_does_not_change_the_results(season_root):
+    whole = _frames(aggregate_shots(season_root))
+    for size in [1, 7]:
+        _assert_same(_frames(aggregate_shots(season_root, chunk_size=size)), whole)
+
+
+def test_results_match_the_batch_stages(cleaned_root):
+    aggregates = aggregate_shots(cleaned_root, by=["match", "team"], chunk_size=5)
+    summary = aggregates.shot_summary()
+    for match in discover_matches(cleaned_root):
+        batch = pd.read_csv(os.path.join(match.clean_dir, "shot_summary.csv"))
+        mine = summary[summary["match"] == match.name].set_index("team")
+        batch = batch.set_index("squad").loc[mine.index]
+        assert mine["shots"].tolist() == batch["shots"].tolist()
+        assert mine["total_xg"].to_numpy() == pytest.approx(batch["total_xg"].to_numpy())
+
+
+@pytest.mark.parametrize("ext", ["csv", "parquet"])
+def test_season_tables_and_raw_files_agree(cleaned_root, tmp_path, ext):
+    if ext == "parquet":
+        pytest.importorskip("pyarrow")
+    matches = discover_matches(cleaned_root)
+    path = str(tmp_path / f"shots.{ext}")
+    SeasonShots.from_matches(matches).save(path)
+
+    from_table = _frames(aggregate_shots(path, chunk_size=9))
+    from_raw = _frames(aggregate_shots([m.shot_file for m in matches], chunk_size=9))
+    _assert_same(from_table, from_raw)
+
+
+def test_merged_partials_equal_one_pass(season_root):
+    matches = discover_matches(season_root)
+    merged = ShotAggregates()
+    for match in matches:
+        part = ShotAggregates()
+        for chunk in shot_chunks(match.shot_file, chunk_size=4):
+            part.update(chunk)
+        merged.merge(part)
+    _assert_same(_frames(merged), _frames(aggregate_shots(season_root)))
+    with pytest.raises(ValueError):
+        merged.merge(ShotAggregates(by=["match", "team"]))
+
+
+def test_no_shots_gives_empty_tables():
+    outputs = ShotAggregates().outputs()
+    assert list(outputs["shot_summary"].columns) == ["team", "shots", "total_xg", "xg_per_shot"]
+    assert outputs["shot_summary"].empty
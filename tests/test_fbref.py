@@ -0,0 +1,98 @@
+import glob
+import os
+
+import pandas as pd
+
+from pl_analysis.fbref import parse_fbref_text, read_fbref_table, split_squad_total, squad_totals
+from pl_analysis.headers import fbref_column_names, group_prefix, read_header
+
+SHOTS = """\
+,,,,,SCA 1,SCA 1,SCA 2,SCA 2
+Minute,Player,Squad,xG,Outcome,Player,Event,Player,Event
+12,A One,Arsenal,0.12,Goal,B Two,Pass (Live),C Three,Shot
+,,,,,,,,
+45+2,B Two,Chelsea,0.3,Saved,A One,Take-On,,
+90+4,C Three,Arsenal,0.05,Blocked,,,,
+"""
+
+
+def test_repeated_names_are_prefixed_by_group():
+    groups = ["", "Passes", "Passes", "Take-Ons", "Take-Ons", ""]
+    header = ["Player", "Cmp", "Att", "Att", "Succ", ""]
+    assert fbref_column_names(groups, header) == [
+        "player", "cmp", "passes_att", "take_ons_att", "succ", None,
+    ]
+    assert fbref_column_names(["", ""], ["Min", "Min"]) == ["min", "min_2"]
+    assert group_prefix("SCA 1") == "sca1"
+
+
+def test_shot_table_is_read_in_one_pass():
+    shots = parse_fbref_text(SHOTS, "shots")
+    assert list(shots.columns) == [
+        "minute", "minute_added", "player", "squad", "xg", "outcome",
+        "sca1_player", "sca1_event", "sca2_player", "sca2_event",
+    ]
+    # The blank separator row stays empty (shots_clean drops it).
+    assert shots["player"].isna().tolist() == [False, True, False, False]
+    shots = shots.dropna(subset=["minute"])
+    assert shots["minute"].tolist() == [12, 45, 90]
+    assert shots["minute_added"].tolist() == [0, 2, 4]
+    assert pd.api.types.is_float_dtype(shots["xg"])
+
+
+def test_stray_text_in_a_numeric_column_is_coerced():
+    shots = parse_fbref_text(SHOTS.replace("0.3", "n/a"), "shots")
+    assert pd.api.types.is_float_dtype(shots["xg"])
+    assert shots["xg"].isna().tolist() == [False, True, True, False]
+
+
+def test_raw_exports_match_their_headers(season_root):
+    path = glob.glob(os.path.join(season_root, "001 *", "Data_raw", "Brighton team stats.csv"))[0]
+    groups, header = read_header(path)
+    stats = read_fbref_table(path, "team_stats")
+    assert list(stats.columns) == [n for n in fbref_column_names(groups, header) if n]
+    assert {"passes_att", "take_ons_att"} <= set(stats.columns)
+    assert pd.api.types.is_integer_dtype(stats["sh"])
+    assert stats["player"].iloc[-1] == "15 Players"
+
+
+STATS = """\
+,,,Performance,Passes,Passes,Take-Ons
+Player,#,Min,Sh,Cmp,Att,Att
+A One,1,90,2,30,40,3
+   B Two,12,20,1,5,9,1
+2 Players,,110,3,35,49,4
+"""
+
+
+def test_squad_totals_use_the_footer_once():
+    stats = parse_fbref_text(STATS, "team_stats")
+    players, total = split_squad_total(stats)
+    assert players["player"].tolist() == ["A One", "   B Two"]
+    assert total["player"] == "2 Players"
+
+    totals = squad_totals(stats)
+    assert totals[["sh", "cmp", "passes_att"]].tolist() == [3, 35, 49]
+    assert "#" not in totals.index
+
+
+def test_squad_totals_without_a_footer_sum_the_players():
+    stats = parse_fbref_text(STATS.replace("2 Players,,110,3,35,49,4\n", ""), "team_stats")
+    assert split_squad_total(stats)[1] is None
+    assert squad_totals(stats)[["sh", "cmp", "passes_att"]].tolist() == [3, 35, 49]
+
+
+def test_footer_beats_a_wrong_player_sum():
+    # FBref's footer is the source of truth; player rows are not re-summed.
+    stats = parse_fbref_text(STATS.replace("2 Players,,110,3,", "2 Players,,110,4,"), "team_stats")
+    assert squad_totals(stats)["sh"] == 4
+
+
+def test_team_summary_matches_the_footer(cleaned_root):
+    path = glob.glob(os.path.join(cleaned_root, "001 *", "Data_raw", "Brighton team stats.csv"))[0]
+    footer = split_squad_total(read_fbref_table(path, "team_stats"))[1]
+    summary = pd.read_csv(os.path.join(os.path.dirname(os.path.dirname(path)),
+                                       "Data_clean", "team_summary.csv"))
+    brighton = summary.set_index("team").loc["Brighton"]
+    assert brighton["shots"] == footer["sh"]
+    assert brighton["passes_attempted"] == footer["passes_att"]
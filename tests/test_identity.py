@@ -0,0 +1,95 @@
+import glob
+import os
+
+import pandas as pd
+import pytest
+
+from pl_analysis.discovery import discover_matches
+from pl_analysis.errors import DataQualityError
+from pl_analysis.identity import (
+    ALIASES_NAME, IdentityResolver, load_identities, save_identities, stable_id,
+)
+from pl_analysis.pipeline import Pipeline
+
+
+def test_seeded_aliases_share_one_id():
+    identities = IdentityResolver()
+    assert identities.team("Manchester Utd") == "Manchester United"
+    assert identities.team_id(" man utd ") == identities.team_id("Manchester United")
+    assert identities.player_id("\xa0\xa0Beto") == identities.player_id("Beto")
+
+
+def test_ids_are_exact_as_float():
+    for name in ["Arsenal", "Newcastle United", "Estêvão Willian"]:
+        team_id = stable_id("team", name)
+        assert 0 <= team_id < 2 ** 53
+        assert int(float(team_id)) == team_id
+
+
+def test_candidate_names_resolve_to_themselves():
+    identities = IdentityResolver()
+    assert identities.team(" Arsenal", ["Arsenal", "Fulham"]) == "Arsenal"
+    assert identities.learned == {}
+
+
+def test_close_spelling_matches_a_candidate():
+    identities = IdentityResolver()
+    assert identities.team("Brighton HA", ["Newcastle United", "Brighton"]) == "Brighton"
+    assert identities.learned == {"Brighton HA": "Brighton"}
+
+
+def test_unknown_team_is_left_unresolved():
+    identities = IdentityResolver()
+    assert identities.team("Zzz Rovers", ["Newcastle United", "Brighton"]) == "Zzz Rovers"
+    assert identities.learned == {}
+
+
+def test_learned_spellings_saved_only_on_request(tmp_path):
+    identities = load_identities(str(tmp_path))
+    identities.team("Brighton HA", ["Newcastle United", "Brighton"])
+    save_identities(str(tmp_path), identities)
+    assert load_identities(str(tmp_path)).team("Brighton HA") == "Brighton HA"
+    save_identities(str(tmp_path), identities, learned=True)
+    assert load_identities(str(tmp_path)).team("Brighton HA") == "Brighton"
+
+
+def _rename_squad(match, old, new):
+    with open(match.shot_file, encoding="utf-8") as f:
+        text = f.read()
+    with open(match.shot_file, "w", encoding="utf-8") as f:
+        f.write(text.replace(f",{old},", f",{new},"))
+
+
+def test_pipeline_writes_canonical_names_and_ids(season_root):
+    match = discover_matches(season_root)[0]
+    _rename_squad(match, "Newcastle United", "Newcastle Utd")
+    ctx = Pipeline().run(match)
+
+    summary = pd.read_csv(os.path.join(match.clean_dir, "shot_summary.csv"))
+    teams = pd.read_csv(os.path.join(match.clean_dir, "team_summary.csv"))
+    assert set(summary["squad"]) == set(teams["team"]) == {"Newcastle United", "Brighton"}
+    assert set(summary["team_id"]) == set(teams["team_id"])
+    assert ctx.identities.learned == {}
+
+
+def test_pipeline_rejects_unknown_team(season_root):
+    match = discover_matches(season_root)[0]
+    _rename_squad(match, "Brighton", "Zzz Rovers")
+    with pytest.raises(DataQualityError, match="known_teams"):
+        Pipeline().run(match)
+    assert not glob.glob(os.path.join(season_root, ALIASES_NAME))
+
+
+def test_alias_edits_rebuild_annotated_outputs(cleaned_root):
+    match = discover_matches(cleaned_root)[0]
+    pipeline = Pipeline(identities=load_identities(cleaned_root))
+    assert set(pipeline.run(match).fresh) == set(pipeline.stage_names())
+
+    identities = IdentityResolver({"team": {"Brighton": "Brighton & Hove Albion FC"}})
+    save_identities(cleaned_root, identities)
+    ctx = Pipeline(identities=load_identities(cleaned_root)).run(match)
+    assert ctx.fresh == []
+
+    teams = pd.read_csv(os.path.join(match.clean_dir, "team_summary.csv"))
+    assert "Brighton & Hove Albion FC" in set(teams["team"])
+    assert stable_id("team", "Brighton & Hove Albion FC") in set(teams["team_id"])
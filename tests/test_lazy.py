@@ -0,0 +1,20 @@
+import importlib
+import subprocess
+import sys
+
+import pl_analysis
+
+
+def test_every_public_name_resolves_from_its_module():
+    for name, module in pl_analysis._LAZY.items():
+        value = getattr(pl_analysis, name)
+        assert getattr(importlib.import_module(f"pl_analysis.{module}"), name) is value
+
+
+def test_package_import_and_help_do_not_load_pandas():
+    code = (
+        "import sys, pl_analysis, pl_analysis.validate, pl_analysis.__main__; "
+        "print(sorted({'pandas', 'numpy', 'matplotlib'} & set(sys.modules)))"
+    )
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True)
+    assert result.stdout.strip() == "[]", result.stderr
@@ -0,0 +1,39 @@
+import os
+
+import pandas as pd
+
+from pl_analysis.__main__ import main
+from pl_analysis.discovery import discover_matches
+from pl_analysis.identity import IdentityResolver
+from pl_analysis.live import LIVE_PREFIX, stream_shots
+from pl_analysis.manifest import load_manifest
+
+
+def _lines(path, squad=None, new=None):
+    with open(path, encoding="latin1", newline="") as f:
+        lines = f.read().splitlines(keepends=True)
+    return [line.replace(squad, new) for line in lines] if squad else lines
+
+
+def test_live_outputs_leave_batch_outputs_alone(cleaned_root):
+    match = discover_matches(cleaned_root)[0]
+    batch = sorted(os.listdir(match.clean_dir))
+    before = {f: open(os.path.join(match.clean_dir, f), "rb").read() for f in batch}
+    manifest = load_manifest(match.clean_dir)
+    assert manifest["stages"]
+
+    lines = _lines(match.shot_file, "Newcastle United", "Newcastle Utd")
+    live = stream_shots(lines, match, interval=0, identities=IdentityResolver())
+
+    for f in batch:
+        assert open(os.path.join(match.clean_dir, f), "rb").read() == before[f], f
+    assert load_manifest(match.clean_dir) == manifest
+    assert main(["check", cleaned_root]) == 0
+
+    summary = pd.read_csv(os.path.join(match.clean_dir, f"{LIVE_PREFIX}shot_summary.csv"))
+    batch_summary = pd.read_csv(os.path.join(match.clean_dir, "shot_summary.csv"))
+    assert sorted(summary["squad"]) == sorted(match.teams.values())
+    assert summary["shots"].sum() == live.events == batch_summary["shots"].sum()
+    merged = summary.merge(batch_summary, on=["squad", "team_id"], suffixes=("", "_batch"))
+    assert len(merged) == 2
+    assert (merged["shots"] == merged["shots_batch"]).all()
@@ -0,0 +1,60 @@
+import glob
+import os
+
+from pl_analysis.__main__ import main
+from pl_analysis.discovery import discover_matches
+from pl_analysis.manifest import load_manifest
+from pl_analysis.pipeline import Pipeline
+
+SHOT_STAGES = {
+    "shots_clean", "shot_summary", "shot_outcomes", "distance_analysis",
+    "shot_timing", "goal_events", "xg_timeline",
+}
+
+
+def _run(root):
+    return Pipeline().run(discover_matches(root)[0])
+
+
+def test_unchanged_match_is_fresh(cleaned_root, capsys):
+    ctx = _run(cleaned_root)
+    assert ctx.outputs == {}
+    assert set(ctx.fresh) == set(Pipeline().stage_names())
+
+    assert main(["clean", cleaned_root, "-j", "1"]) == 0
+    out = capsys.readouterr().out
+    assert out.count("FRESH") == 2 and "OK " not in out
+
+
+def test_edited_raw_file_rebuilds_its_stages(cleaned_root):
+    match = discover_matches(cleaned_root)[0]
+    with open(match.shot_file, "a", encoding="latin1") as f:
+        f.write("\n")
+    ctx = _run(cleaned_root)
+    assert set(ctx.fresh).isdisjoint(SHOT_STAGES)
+    assert "team_summary" in ctx.fresh
+    assert _run(cleaned_root).outputs == {}
+
+
+def test_deleted_output_is_rebuilt(cleaned_root):
+    match = discover_matches(cleaned_root)[0]
+    os.remove(os.path.join(match.clean_dir, "goal_events.csv"))
+    ctx = _run(cleaned_root)
+    assert "goal_events" in ctx.outputs
+    assert "goal_events" not in ctx.fresh and "team_summary" in ctx.fresh
+    assert os.path.exists(os.path.join(match.clean_dir, "goal_events.csv"))
+
+
+def test_deleted_raw_file_is_not_fresh(cleaned_root):
+    match = discover_matches(cleaned_root)[0]
+    for path in glob.glob(os.path.join(match.raw_dir, "* pass types.csv")):
+        os.remove(path)
+    ctx = _run(cleaned_root)
+    assert {"pass_types", "passing_profile"} <= set(ctx.skipped)
+    assert not {"pass_types", "passing_profile"} & set(ctx.fresh)
+    assert not {"pass_types", "passing_profile"} & set(load_manifest(match.clean_dir)["stages"])
+
+
+def test_pipeline_version_change_rebuilds_everything(cleaned_root):
+    ctx = Pipeline(version="test").run(discover_matches(cleaned_root)[0])
+    assert ctx.fresh == []
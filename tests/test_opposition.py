@@ -0,0 +1,55 @@
+import os
+
+import pandas as pd
+import pytest
+
+from pl_analysis.discovery import discover_matches
+from pl_analysis.identity import IdentityResolver
+from pl_analysis.opposition import FORM_INPUTS, match_records, update_form_index
+from pl_analysis.storage import CsvStore
+
+
+def _respell(match, drop_ids):
+    for name in FORM_INPUTS:
+        path = os.path.join(match.clean_dir, f"{name}.csv")
+        if not os.path.exists(path):
+            continue
+        table = pd.read_csv(path)
+        for col in ["squad", "team"]:
+            if col in table.columns:
+                table[col] = table[col].replace("Newcastle United", "Newcastle Utd")
+        if drop_ids:
+            table = table.drop(columns=["team_id", "player_id"], errors="ignore")
+        table.to_csv(path, index=False)
+
+
+@pytest.mark.parametrize("drop_ids", [False, True])
+def test_spelling_variants_count_for_their_side(cleaned_root, drop_ids):
+    match = discover_matches(cleaned_root)[0]
+    assert match.teams["home"] == "Newcastle United"
+    before = match_records(match, CsvStore(), IdentityResolver())
+    assert before["home"]["shots"] > 0
+
+    _respell(match, drop_ids)
+    assert match_records(match, CsvStore(), IdentityResolver()) == before
+
+
+def test_form_index_records_each_side(cleaned_root):
+    index, recorded = update_form_index(cleaned_root)
+    assert recorded == 2
+    summary = pd.read_csv(
+        os.path.join(discover_matches(cleaned_root)[0].clean_dir, "shot_summary.csv")
+    )
+    home = index.form("Newcastle United", "home")
+    assert home["shots"] == summary.loc[summary["squad"] == "Newcastle United", "shots"].sum()
+    assert update_form_index(cleaned_root)[1] == 0
+
+
+def test_spellings_of_one_club_share_a_window(respelled_root):
+    index, recorded = update_form_index(respelled_root)
+    assert recorded == 3
+    home = index.form("Newcastle United", "home")
+    assert len(home["matches"]) == 2
+    assert index.form("Newcastle Utd", "home") == home
+    assert len(index.profile("Newcastle Utd", "Brighton")["away"]["matches"]) == 2
+    assert index.profile("Newcastle Utd", "Brighton")["home"]["team"] == "Newcastle United"
@@ -0,0 +1,56 @@
+import os
+
+import pandas as pd
+import pytest
+
+from pl_analysis.discovery import discover_matches
+from pl_analysis.passing import load_passing_profiles, passing_profiles, resolve_columns
+
+
+def test_columns_resolve_across_export_layouts():
+    new = resolve_columns("passing", ("player", "total_att", "total_cmp", "total_cmp%",
+                                      "short_att"))
+    old = resolve_columns("passing", ("player", "total_passes_att", "short_passes_cmp%",
+                                      "short_passes_att"))
+    assert new == {"passes_att": "total_att", "passes_cmp": "total_cmp", "short_att": "short_att"}
+    assert old == {"passes_att": "total_passes_att", "short_att": "short_passes_att"}
+    assert resolve_columns("pass_types", ("crs", "tb", "sw", "live")) == {
+        "live": "live", "crosses": "crs", "through_balls": "tb", "switches": "sw",
+    }
+
+
+def _table(rows, footer=None):
+    frame = pd.DataFrame(rows, columns=["player", "short_att", "short_cmp", "long_att"])
+    if footer is not None:
+        frame.loc[len(frame)] = footer
+    return frame
+
+
+def test_footer_or_player_sum_per_table():
+    with_footer = _table([["A", 10, 8, 2], ["B", 5, 5, 1]], ["2 Players", 20, 16, 4])
+    without = _table([["C", 10, 8, 2], ["D", 5, 5, 1]])
+    profile = passing_profiles([
+        ("m", "X", "passing", with_footer),
+        ("m", "Y", "passing", without),
+    ]).set_index("team")
+    assert profile.loc["X", ["short_att", "short_cmp", "long_att"]].tolist() == [20, 16, 4]
+    assert profile.loc["Y", ["short_att", "short_cmp", "long_att"]].tolist() == [15, 13, 3]
+    assert profile.loc["Y", "short_cmp_pct"] == pytest.approx(86.7)
+    assert profile.loc["Y", "short_share"] == pytest.approx(83.3)
+    assert profile["medium_att"].isna().all()
+    assert profile["crosses"].isna().all()
+
+
+def test_no_tables_gives_an_empty_profile():
+    assert passing_profiles([]).empty
+
+
+def test_loader_profiles_match_the_pipeline(cleaned_root):
+    matches = discover_matches(cleaned_root)
+    loaded = load_passing_profiles(matches, max_open=2)
+    for match in matches:
+        stage = pd.read_csv(os.path.join(match.clean_dir, "passing_profile.csv"))
+        mine = loaded[loaded["match"] == match.name].set_index("team")
+        stage = stage.set_index("team").loc[mine.index]
+        for col in ["passes_att", "short_att", "live", "crosses", "switches"]:
+            assert mine[col].tolist() == stage[col].tolist()
@@ -0,0 +1,54 @@
+import glob
+import os
+
+import pandas as pd
+import pytest
+
+from pl_analysis.discovery import discover_matches
+from pl_analysis.errors import MissingRawTableError
+from pl_analysis.pipeline import DEFAULT_STAGES, Pipeline, Stage, run_season
+
+
+def test_one_pipeline_runs_every_match(season_root):
+    contexts = run_season(season_root)
+    assert list(contexts) == [m.name for m in discover_matches(season_root)]
+    for ctx in contexts.values():
+        expected = {"shot_summary", "team_summary", "xg_timeline", "passing_profile"}
+        assert expected <= set(ctx.outputs)
+        home, away = ctx.match.teams.values()
+        assert set(ctx.outputs["shot_summary"]["squad"].astype(str)) == {home, away}
+        written = glob.glob(os.path.join(ctx.match.clean_dir, "*.csv"))
+        assert {os.path.basename(p)[:-len(".csv")] for p in written} == set(ctx.outputs)
+
+
+def test_dry_run_writes_nothing(season_root):
+    match = discover_matches(season_root)[0]
+    ctx = Pipeline().run(match, write=False)
+    assert ctx.outputs
+    assert not os.path.exists(match.clean_dir)
+
+
+def test_missing_tables_skip_optional_stages_only(season_root):
+    match = discover_matches(season_root)[0]
+    for path in glob.glob(os.path.join(match.raw_dir, "* goalkeeper stats.csv")):
+        os.remove(path)
+    ctx = Pipeline().run(discover_matches(season_root)[0], write=False)
+    assert ctx.skipped == ["goalkeeper_summary"]
+
+    os.remove(match.shot_file)
+    with pytest.raises(MissingRawTableError, match="shots_clean"):
+        Pipeline().run(discover_matches(season_root)[0], write=False)
+
+
+def test_custom_stages_see_earlier_outputs(season_root):
+    def top_scorer(ctx):
+        shots = ctx.output("shots_clean")
+        goals = shots[shots["outcome"] == "Goal"].groupby("player").size()
+        return {"top_scorer": pd.DataFrame({"player": goals.index, "goals": goals.to_numpy()})}
+
+    stages = DEFAULT_STAGES + [
+        Stage("top_scorer", top_scorer, requires=["shots"], uses=["shots_clean"])
+    ]
+    ctx = Pipeline(stages=stages).run(discover_matches(season_root)[0])
+    assert "player_id" in ctx.outputs["top_scorer"].columns
+    assert Pipeline(stages=stages).run(ctx.match).fresh == [s.name for s in stages]
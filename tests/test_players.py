@@ -0,0 +1,45 @@
+import unicodedata
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from pl_analysis.players import normalise_player_names, season_players
+
+# The same name in decomposed Unicode form.
+WILLIAN_NFD = unicodedata.normalize("NFD", "Estêvão Willian")
+
+PLAYERS = pd.DataFrame({
+    "match": ["m1", "m1", "m1", "m2", "m2"],
+    "team": ["Arsenal", "Arsenal", "Arsenal", "Arsenal ", "Arsenal"],
+    "player": ["Bukayo Saka", "\xa0\xa0Estêvão  Willian", "2 Players",
+               "\xa0\xa0Bukayo Saka", WILLIAN_NFD],
+    "min": [90, 0, 90, 30, 60],
+    "gls": [1, 0, 1, 1, 0],
+    "xg": [0.5, 0.0, 0.5, 0.4, 0.2],
+})
+
+
+def test_names_are_normalised():
+    names = normalise_player_names(pd.Series(["\xa0\xa0Estêvão  Willian", WILLIAN_NFD]))
+    assert names.tolist() == ["Estêvão Willian", "Estêvão Willian"]
+
+
+def test_season_totals_and_per_90():
+    season = season_players(PLAYERS).set_index("player")
+    assert list(season.index) == ["Bukayo Saka", "Estêvão Willian"]
+
+    saka = season.loc["Bukayo Saka"]
+    assert (saka["matches"], saka["starts"], saka["min"], saka["gls"]) == (2, 1, 120, 2)
+    assert saka["gls_p90"] == pytest.approx(1.5)
+    assert saka["xg_p90"] == pytest.approx(0.9 / 120 * 90)
+    assert saka["team"] == "Arsenal"
+
+    willian = season.loc["Estêvão Willian"]
+    assert (willian["matches"], willian["starts"]) == (2, 1)
+    assert np.isnan(season.loc["Estêvão Willian", "sca"])  # missing metric stays NA
+
+
+def test_min_minutes_and_no_players():
+    assert season_players(PLAYERS, min_minutes=100)["player"].tolist() == ["Bukayo Saka"]
+    assert season_players(pd.DataFrame(columns=["match"])).empty
@@ -0,0 +1,44 @@
+import os
+
+import pandas as pd
+
+from pl_analysis.discovery import discover_clean_matches
+from pl_analysis.identity import IdentityResolver
+from pl_analysis.powerbi import FACT_SHOT_DTYPES, STAR_TABLES, build_star_schema, export_star_schema
+from pl_analysis.season import Season
+
+
+def test_empty_root_exports_empty_tables(tmp_path):
+    out = tmp_path / "out"
+    counts = export_star_schema(str(tmp_path), str(out))
+    assert counts == dict.fromkeys(STAR_TABLES, 0)
+    assert list(pd.read_csv(out / "fact_shot.csv").columns) == list(FACT_SHOT_DTYPES)
+
+
+def test_legacy_clean_only_folders_are_exported(mixed_root, tmp_path):
+    counts = export_star_schema(mixed_root, str(tmp_path / "out"))
+    assert counts["dim_match"] == 2
+    assert counts["fact_team_match"] == 4
+    fact = pd.read_csv(tmp_path / "out" / "fact_shot.csv")
+    assert fact[["match_key", "team_key", "player_key"]].notna().all().all()
+
+
+def test_namesakes_at_different_clubs_stay_apart(cleaned_root):
+    identities = IdentityResolver()
+    match = discover_clean_matches(cleaned_root)[0]
+    name = "Brighton Player 1"
+    for output in ["shots_clean", "newcastle_united_players_clean"]:
+        path = os.path.join(match.clean_dir, f"{output}.csv")
+        frame = pd.read_csv(path)
+        renamed = frame["player"].str.strip() == "Newcastle Player 1"
+        frame.loc[renamed, "player"] = name
+        frame.loc[renamed, "player_id"] = identities.player_id(name)
+        frame.to_csv(path, index=False)
+
+    tables = build_star_schema(Season(matches=discover_clean_matches(cleaned_root)), identities)
+    dim = tables["dim_player"]
+    rows = dim[dim["player"] == name]
+    assert len(rows) == 2
+    assert rows["team_key"].nunique() == 2
+    fact = tables["fact_player_match"].merge(dim, on="player_key", suffixes=("", "_player"))
+    assert (fact["team_key"] == fact["team_key_player"]).all()
@@ -0,0 +1,48 @@
+import os
+
+import pandas as pd
+
+from pl_analysis.discovery import discover_matches
+from pl_analysis.report import DEFAULT_TEMPLATE, REPORT_NAME, render_match_report, report_dir
+
+
+def _report(match, ext="md"):
+    return os.path.join(report_dir(match), f"{REPORT_NAME}.{ext}")
+
+
+def test_report_is_fresh_until_an_input_changes(cleaned_root):
+    match = discover_matches(cleaned_root)[0]
+    assert render_match_report(match, pdf=False) == "rendered"
+    assert render_match_report(match, pdf=False) == "fresh"
+
+    path = os.path.join(match.clean_dir, "goal_events.csv")
+    goals = pd.read_csv(path)
+    goals.iloc[:0].to_csv(path, index=False)
+    assert render_match_report(match, pdf=False) == "rendered"
+    with open(_report(match), encoding="utf-8") as f:
+        assert "No goals." in f.read()
+    assert render_match_report(match, pdf=False) == "fresh"
+
+
+def test_template_deleted_output_and_force_rebuild(cleaned_root):
+    match = discover_matches(cleaned_root)[0]
+    render_match_report(match, pdf=False)
+    template = DEFAULT_TEMPLATE + "\nEnd.\n"
+    assert render_match_report(match, pdf=False, template=template) == "rendered"
+    os.remove(_report(match))
+    assert render_match_report(match, pdf=False) == "rendered"
+    assert render_match_report(match, pdf=False, force=True) == "rendered"
+
+
+def test_pdf_and_hand_written_report(cleaned_root):
+    match = discover_matches(cleaned_root)[0]
+    os.makedirs(report_dir(match), exist_ok=True)
+    hand_written = os.path.join(report_dir(match), "Report.md")
+    with open(hand_written, "w", encoding="utf-8") as f:
+        f.write("Notes\n")
+
+    assert render_match_report(match) == "rendered"
+    assert os.path.getsize(_report(match, "pdf")) > 0
+    assert render_match_report(match, pdf=False) == "rendered"
+    with open(hand_written, encoding="utf-8") as f:
+        assert f.read() == "Notes\n"
@@ -0,0 +1,46 @@
+import os
+
+import pytest
+
+from pl_analysis.__main__ import main
+from pl_analysis.discovery import discover_matches
+from pl_analysis.loader import load_matches, raw_table_keys
+from pl_analysis.manifest import file_digest
+from pl_analysis.runner import run_matches_parallel, summarise_results
+
+
+def test_max_open_needs_inline_runs(season_root, capsys):
+    with pytest.raises(SystemExit):
+        main(["clean", season_root, "--max-open", "4"])
+    assert "--workers 1" in capsys.readouterr().err
+    with pytest.raises(ValueError):
+        run_matches_parallel(discover_matches(season_root), workers=2, max_open=4)
+
+
+def test_inline_loader_run_matches_plain_run(season_root):
+    matches = discover_matches(season_root)
+    loaded = run_matches_parallel(matches, workers=1, max_open=2)
+    assert [r.name for r in loaded] == [m.name for m in matches]
+    assert all(r.ok and r.outputs for r in loaded)
+    assert all(r.ok and not r.outputs for r in run_matches_parallel(matches, workers=1))
+
+
+def test_loader_reads_every_file_once(season_root):
+    matches = discover_matches(season_root)
+    for item in load_matches(matches, max_open=1):
+        keys = raw_table_keys(item.match)
+        assert set(item.tables) == {key for key, _ in keys}
+        assert item.digests == {path: file_digest(path) for _, path in keys}
+        assert item.errors == {}
+
+
+def test_worker_processes_report_failures(season_root):
+    matches = discover_matches(season_root)
+    results = run_matches_parallel(matches, workers=2)
+    assert all(r.ok for r in results)
+
+    os.remove(matches[0].shot_file)
+    matches = discover_matches(season_root)
+    results = run_matches_parallel(matches, workers=2, force=True)
+    assert [r.ok for r in results] == [False, True]
+    assert "1 succeeded, 1 failed" in summarise_results(results)
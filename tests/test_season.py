@@ -0,0 +1,66 @@
+import glob
+import os
+
+import pandas as pd
+
+from pl_analysis.identity import IdentityResolver, load_identities
+from pl_analysis.season import Season
+
+
+def test_player_totals_group_spellings_of_one_club(respelled_root):
+    season = Season(respelled_root)
+    assert {m.teams["home"] for m in season.matches} >= {"Newcastle United", "Newcastle Utd"}
+
+    totals = season.player_totals()
+    newcastle = totals[totals["player"] == "Newcastle Player 1"]
+    assert newcastle[["team", "team_id", "matches"]].values.tolist() == [
+        ["Newcastle United", load_identities().team_id("Newcastle United"), 2]
+    ]
+    assert not totals.duplicated(["player_id", "team_id"]).any()
+
+
+def test_player_aliases_apply_to_totals(cleaned_root):
+    identities = IdentityResolver({"player": {"Newcastle Player 1": "N. Player"}})
+    totals = Season(cleaned_root, identities=identities).player_totals()
+    assert "N. Player" in set(totals["player"])
+    assert "Newcastle Player 1" not in set(totals["player"])
+
+
+def test_team_xg_groups_spellings_of_one_club(respelled_root):
+    # An output written before names were canonicalized.
+    path = glob.glob(os.path.join(respelled_root, "003 *", "Data_clean", "shots_clean.csv"))[0]
+    shots = pd.read_csv(path).drop(columns=["team_id", "player_id"])
+    shots["squad"] = shots["squad"].replace("Newcastle United", "Newcastle Utd")
+    shots.to_csv(path, index=False)
+
+    xg = Season(respelled_root).team_xg()
+    teams = xg.set_index("team")
+    assert "Newcastle Utd" not in teams.index
+    assert teams.loc["Newcastle United", "matches"] == 2
+    assert teams.loc["Brighton", "matches"] == 2
+
+
+def test_aggregates_are_cached_until_an_output_changes(cleaned_root):
+    season = Season(cleaned_root)
+    first = season.team_xg()
+    assert season.team_xg() is first
+    assert season.cache.hits == 1
+
+    match = season.matches[0]
+    path = os.path.join(match.clean_dir, "shots_clean.csv")
+    shots = pd.read_csv(path)
+    shots.iloc[1:].to_csv(path, index=False)
+    changed = season.team_xg()
+    assert changed is not first
+    assert changed["shots"].sum() == first["shots"].sum() - 1
+    assert season.saves() is season.saves()
+
+
+def test_filters_and_bounded_cache(cleaned_root):
+    season = Season(cleaned_root, cache_size=2)
+    shots = season.shots(team="Brighton")
+    assert set(shots["team"]) == {"Brighton"}
+    assert len(season.shots(team=["Brighton", "Bournemouth"])) > len(shots)
+    season.shots_by_zone()
+    season.shots_by_window()
+    assert len(season.cache) == 2
@@ -0,0 +1,68 @@
+import pandas as pd
+import pytest
+
+from pl_analysis.discovery import discover_matches
+from pl_analysis.pipeline import Pipeline
+from pl_analysis.storage import (
+    CsvStore, ParquetStore, _unique_columns, make_stores, read_dataset, to_columnar,
+)
+
+pytest.importorskip("pyarrow")
+
+
+@pytest.fixture
+def both_stores(season_root, tmp_path):
+    stores = make_stores("both", str(tmp_path / "store"), season="2025-26")
+    pipeline = Pipeline(stores=stores)
+    for match in discover_matches(season_root):
+        pipeline.run(match)
+    return discover_matches(season_root), stores
+
+
+def test_csv_and_parquet_hold_the_same_values(both_stores):
+    matches, (csv, parquet) = both_stores
+    assert isinstance(csv, CsvStore) and isinstance(parquet, ParquetStore)
+    for name in ["shots_clean", "shot_summary", "shot_timing_analysis", "team_summary"]:
+        from_csv = csv.read(matches[0], name)
+        from_parquet = parquet.read(matches[0], name)
+        assert list(from_csv.columns) == list(from_parquet.columns)
+        assert from_parquet.to_csv(index=False) == from_csv.to_csv(index=False)
+
+
+def test_parquet_keeps_dtypes(both_stores):
+    matches, (_, parquet) = both_stores
+    shots = parquet.read(matches[0], "shots_clean")
+    assert isinstance(shots["squad"].dtype, pd.CategoricalDtype)
+    assert isinstance(shots["outcome"].dtype, pd.CategoricalDtype)
+    assert pd.api.types.is_integer_dtype(shots["minute"])
+    assert pd.api.types.is_integer_dtype(shots["team_id"])
+    assert pd.api.types.is_float_dtype(shots["xg"])
+
+    timing = parquet.read(matches[0], "shot_timing_analysis")
+    assert timing["time_window"].dtype.ordered
+    assert list(timing["time_window"].cat.categories)[:2] == ["0-15", "16-30"]
+
+
+def test_read_dataset_filters_partitions_and_columns(both_stores):
+    matches, (_, parquet) = both_stores
+    table = read_dataset(parquet.root, "shot_summary", columns=["match", "squad", "shots"])
+    assert list(table.columns) == ["match", "squad", "shots"]
+    assert table["match"].nunique() == len(matches)
+    one = read_dataset(parquet.root, "shot_summary", season="2025-26", match=matches[0].name)
+    assert len(one) == 2
+    assert read_dataset(parquet.root, "shot_summary", season="other").empty
+
+
+def test_repeated_columns_are_suffixed():
+    assert _unique_columns(["player", "event", "player", "player"]) == [
+        "player", "event", "player.1", "player.2"
+    ]
+    frame = pd.DataFrame([[1, 2]], columns=["a", "a"])
+    assert list(to_columnar(frame).columns) == ["a", "a.1"]
+
+
+def test_make_stores_rejects_bad_options():
+    with pytest.raises(ValueError):
+        make_stores("xlsx")
+    with pytest.raises(ValueError):
+        make_stores("parquet")
@@ -0,0 +1,34 @@
+import pandas as pd
+
+from pl_analysis.timeline import match_xg, rolling_xg, xg_timelines
+
+SHOTS = pd.DataFrame({
+    "match": ["m1", "m1", "m2"],
+    "team": ["A", "A", "C"],
+    "minute": [10, 20, 5],
+    "xg": [0.3, 0.2, 0.1],
+})
+
+TEAMS = {"m1": ["A", "B"], "m2": ["C", "A"]}
+
+
+def test_shotless_team_gets_zero_row():
+    totals = match_xg(SHOTS, teams=TEAMS).set_index(["match", "team"])
+    assert totals.loc[("m1", "B"), "shots"] == 0
+    assert totals.loc[("m1", "B"), "xg_for"] == 0
+    assert totals.loc[("m1", "B"), "xg_against"] == 0.5
+    assert totals.loc[("m1", "A"), "xg_against"] == 0
+
+
+def test_rolling_against_counts_shotless_opponent():
+    rolling = rolling_xg(match_xg(SHOTS, teams=TEAMS), window=2)
+    a = rolling[rolling["team"] == "A"].set_index("match")
+    assert a.loc["m2", "rolling_xg_against"] == 0.1
+    assert a.loc["m2", "rolling_matches"] == 2
+
+
+def test_timeline_has_both_teams():
+    timeline = xg_timelines(SHOTS, teams=TEAMS)
+    last = timeline[(timeline["match"] == "m1") & (timeline["minute"] == 90)].set_index("team")
+    assert last.loc["B", "cumulative_xg"] == 0
+    assert last.loc["B", "cumulative_xg_against"] == 0.5